@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import traceback
+
+from ansible.module_utils.common.text.converters import to_text
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+from ansible.plugins.action.normal import ActionModule as NormalActionModule
+from ansible.utils.unsafe_proxy import wrap_var
+from ansible.vars.clean import remove_internal_keys
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import NexusHelper
+from ansible_collections.haxorof.sonatype_nexus.plugins.plugin_utils.nexus_runner import is_supported, run_module
+
+# Action plugin of all modules in the collection, routed to in meta/runtime.yml.
+#
+# When the variable nexus_in_process is true and the target is the controller, e.g. with delegate_to: localhost,
+# the module is run in the process executing the task instead of in a new Python interpreter. The module then uses
+# the Python of the controller instead of ansible_python_interpreter and shares the globals of the process, a crash
+# is reported by this plugin. Modules run the usual way by default, on other targets, with become, environment or
+# async, and with ansible-core versions in which the private parts used by nexus_runner differ.
+# Modules run in the same process, e.g. the items of a loop, share their connection pools.
+
+COLLECTION = "haxorof.sonatype_nexus"
+
+
+class ActionModule(NormalActionModule):
+    """Runs modules in-process when enabled and the target is the controller, the usual way otherwise."""
+
+    _supports_check_mode = True
+    _supports_async = True
+
+    def run(self, tmp=None, task_vars=None):
+        task_vars = task_vars or {}
+        module_name = self._in_process_module_name(task_vars)
+        if module_name is None:
+            return super().run(tmp, task_vars)
+
+        result = ActionBase.run(self, tmp, task_vars)
+        module_args = self._task.args.copy()
+        self._update_module_args(f"{COLLECTION}.{module_name}", module_args, task_vars)
+        if NexusHelper.shared_connection_pools is None:
+            NexusHelper.shared_connection_pools = {}
+        try:
+            output, exit_code = run_module(module_name, module_args)
+        # pylint: disable-next=broad-exception-caught
+        except Exception as e:
+            result.update(
+                failed=True,
+                msg=f"MODULE FAILURE: {to_text(e)}",
+                exception=traceback.format_exc(),
+            )
+            return result
+        data = self._parse_returned_data({"stdout": output, "stderr": "", "rc": exit_code})
+        remove_internal_keys(data)
+        result.update(data)
+        return wrap_var(result)
+
+    def _in_process_module_name(self, task_vars):
+        """Name of the module to run in-process, None if it must run the usual way."""
+        # resolved_action is the name of this action plugin, the module is resolved separately.
+        context = self._shared_loader_obj.module_loader.find_plugin_with_context(
+            self._task.action, collection_list=self._task.collections
+        )
+        collection, dummy, module_name = (context.resolved_fqcn or "").rpartition(".")
+        if collection != COLLECTION or not is_supported():
+            return None
+        if not boolean(self._templar.template(task_vars.get("nexus_in_process", False)), strict=False):
+            return None
+        if self._connection.transport != "local" or self._play_context.become:
+            return None
+        if any(self._task.environment or ()) or self._task.async_val:
+            return None
+        return module_name
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import base64
+
+from ansible.errors import AnsibleError
+from ansible.module_utils._text import to_bytes
+from ansible.module_utils.connection import ConnectionError as AnsibleConnectionError
+
+try:
+    from ansible_collections.ansible.netcommon.plugins.plugin_utils.httpapi_base import HttpApiBase
+
+    HAS_NETCOMMON = True
+except ImportError:
+    HttpApiBase = object
+    HAS_NETCOMMON = False
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_session
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_httpapi import (
+    decode_body,
+    encode_body,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_transport import (
+    NexusConnectionPool,
+)
+
+DOCUMENTATION = r"""
+---
+name: nexus
+short_description: HttpApi plugin for Sonatype Nexus Repository
+description:
+  - Keeps one authenticated session and pooled HTTP connections to Nexus open across tasks,
+    used by all modules of the collection when the connection is C(ansible.netcommon.httpapi).
+  - Requires the C(ansible.netcommon) collection.
+  - Host, port, C(use_ssl), C(validate_certs), C(use_proxy), user and password are the options of the
+    C(ansible.netcommon.httpapi) connection, the C(url), C(username) and C(password) module options are not used.
+author: "Contributors to the haxorof.sonatype_nexus project"
+options:
+  nexus_auth:
+    description:
+      - C(session) logs in once and sends the session cookie, so Nexus authenticates the user, e.g. with an
+        LDAP bind, once per connection instead of once per request. If Nexus does not allow creating a
+        session, basic authentication is used.
+      - C(basic) sends the user and password, or user token name and passcode, with each request.
+    type: str
+    choices: [session, basic]
+    default: session
+    vars:
+      - name: ansible_httpapi_nexus_auth
+"""
+
+
+class HttpApi(HttpApiBase):
+    def __init__(self, connection):
+        if not HAS_NETCOMMON:
+            raise AnsibleError(
+                "The haxorof.sonatype_nexus.nexus httpapi plugin requires the ansible.netcommon collection, "
+                "install it with: ansible-galaxy collection install ansible.netcommon"
+            )
+        super().__init__(connection)
+        self._url = None
+        self._pool = None
+        self._auth_headers = None
+        self._credentials = None
+
+    def pool(self):
+        if self._pool is None:
+            self._pool = NexusConnectionPool(
+                validate_certs=self.connection.get_option("validate_certs"),
+                use_proxy=self.connection.get_option("use_proxy"),
+                timeout=self.connection.get_option("persistent_command_timeout"),
+            )
+        return self._pool
+
+    def login(self, username, password):
+        self._credentials = (username, password)
+        self._auth_headers = self._basic_auth_headers()
+        if self.get_option("nexus_auth") == "session":
+            session_headers = self._create_session()
+            if session_headers:
+                self._auth_headers = session_headers
+
+    def logout(self):
+        if self._auth_headers and "Cookie" in self._auth_headers:
+            response, dummy = self._send(nexus_session.SESSION_PATH, "DELETE", None, dict(self._auth_headers))
+            if response:
+                response.close()
+        self._auth_headers = None
+        if self._pool:
+            self._pool.close()
+
+    def _basic_auth_headers(self):
+        username, password = self._credentials
+        if username is None:
+            return {}
+        token = base64.b64encode(to_bytes(f"{username}:{password or ''}")).decode("ascii")
+        return {"Authorization": f"Basic {token}"}
+
+    def _create_session(self):
+        """Logs in, returns the headers authenticating with the session, None if no session was created."""
+        username, password = self._credentials
+        if username is None:
+            return None
+        session_headers, info = nexus_session.login(self._send, username, password)
+        if session_headers is None:
+            self.connection.queue_message(
+                "vvvv", f"No Nexus session created, using basic authentication: {info.get('msg')}"
+            )
+        return session_headers
+
+    def url(self):
+        """URL of Nexus given by the host, port and use_ssl options of the connection."""
+        if self._url is None:
+            use_ssl = self.connection.get_option("use_ssl")
+            port = self.connection.get_option("port") or (443 if use_ssl else 80)
+            self._url = f"{'https' if use_ssl else 'http'}://{self.connection.get_option('host')}:{port}"
+        return self._url
+
+    def _send(self, path, method, data, headers):
+        return self.pool().request(self.url() + path, method, data, headers)
+
+    def send_request(self, data, path, method="GET", headers=None):
+        """Sends a request to Nexus, data and the returned body are base64 encoded.
+
+        Called by the modules through nexus_httpapi.NexusHttpApiTransport.
+
+        Returns:
+            dict: status, msg, headers (lowercase names) and body of the response
+        """
+        if not self.connection.connected:
+            # pylint: disable-next=protected-access
+            self.connection._connect()
+        data = None if data is None else decode_body(data)
+        request_headers = dict(headers or {})
+        # Without login, i.e. with the session_key option of the connection.
+        if self._auth_headers is not None:
+            request_headers.update(self._auth_headers)
+        else:
+            request_headers.update(self.connection.get_option("session_key") or {})
+        response, info = self._send(path, method, data, request_headers)
+        if info["status"] == 401 and self._auth_headers and "Cookie" in self._auth_headers:
+            # Session expired, log in again and retry once.
+            self._auth_headers = self._create_session() or self._basic_auth_headers()
+            request_headers = dict(headers or {})
+            request_headers.update(self._auth_headers)
+            response, info = self._send(path, method, data, request_headers)
+        if info["status"] == -1:
+            raise AnsibleConnectionError(info["msg"])
+        if response:
+            body = response.read()
+            response.close()
+        else:
+            body = info.pop("body", b"")
+        status, msg = info.pop("status"), info.pop("msg")
+        info.pop("url", None)
+        info.pop("connect_seconds", None)
+        return {"status": status, "msg": msg, "headers": info, "body": encode_body(body)}
@@ -9,35 +9,50 @@ from __future__ import absolute_import, division, print_function
 # pylint: disable-next=invalid-name
 __metaclass__ = type
 
-import copy
+import base64
+import functools
 import json
 import time
 import re
 import dataclasses
-import humps
 
-from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils._text import to_text
+from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.basic import env_fallback
-from ansible.module_utils.urls import fetch_url, basic_auth_header
 
-from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import (
-    nexus_repository_commons,
-)
+# Every module imports this file, it is compiled from source on each module run. Optional features
+# and code needed by some modules only live in separate module_utils imported where they are used.
 
 
-def repository_name_filter(item, helper):
-    return item["name"] == helper.module.params["name"]
+def basic_auth_header(username, password):
+    """Same as ansible.module_utils.urls.basic_auth_header, which is only imported when fetch_url is used."""
+    return b"Basic " + base64.b64encode(
+        to_bytes(f"{username}:{password or ''}", errors="surrogate_or_strict")
+    )
+
+
+def __getattr__(name):
+    """NexusRepositoryHelper and repository_name_filter moved to nexus_repository_helper."""
+    if name in ("NexusRepositoryHelper", "REPOSITORY_DIFF_RULES", "repository_name_filter"):
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_repository_helper
+
+        return getattr(nexus_repository_helper, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 @dataclasses.dataclass
 class NexusVersion:
     version: str
     edition: str
 
+# pylint: disable-next=too-many-public-methods
 class NexusHelper:
     """General Nexus Helper Class"""
 
     NEXUS_API_URL = "http://localhost:8081"
+    # Connection pools shared by all modules run in the same process, None unless enabled by the
+    # nexus_in_process action plugin.
+    shared_connection_pools = None
     NEXUS_API_BASE_PATH = "/service/rest"
 
     NEXUS_API_ENDPOINTS = {
@@ -75,12 +90,22 @@ class NexusHelper:
             raise ValueError(
                 "Bug: Cannot be empty param_name into camalize_param method!"
             )
-        ret_value = (
-            ret_default
-            if not helper.module.params[param_name]
-            else humps.camelize(helper.module.params[param_name])
+        entry = helper.key_table.get(param_name)
+        return NexusHelper.camalize_value(
+            helper.module.params[param_name], ret_default, entry[1] if entry else None
         )
-        return ret_value
+
+    @staticmethod
+    def camalize_value(value, ret_default=None, key_table=None):
+        """Camelizes the keys of value, only the ones in key_table if given, see nexus_normalize.translate_keys."""
+        if not value:
+            return ret_default
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_normalize
+
+        if isinstance(value, (dict, list)):
+            return nexus_normalize.translate_keys(value, key_table)
+        return nexus_normalize.camelize_key(value)
 
     @staticmethod
     def generate_result_struct(
@@ -101,7 +126,15 @@ class NexusHelper:
 
     @staticmethod
     def nexus_argument_spec():
-        """Common module arguments"""
+        """Common module arguments
+
+        Returns a new dict which callers may extend, the option specs in it are shared and must not be modified.
+        """
+        return dict(NexusHelper.cached_nexus_argument_spec())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def cached_nexus_argument_spec():
         return {
             "url": {
                 "type": "str",
@@ -129,9 +162,103 @@ class NexusHelper:
                 "fallback": (env_fallback, ["NEXUS_VALIDATE_CERTS"]),
             },
             "use_proxy": {"type": "bool", "default": True},
+            "timeout": {"type": "int", "default": 10},
             "return_content": {"type": "bool", "default": True},
             "sleep": {"type": "int", "default": 0},
             "retries": {"type": "int", "default": 1},
+            "retry_backoff_factor": {"type": "float", "default": 2.0},
+            "retry_max_sleep": {"type": "int", "default": 60},
+            "retry_jitter": {"type": "bool", "default": True},
+            "retry_status_codes": {
+                "type": "list",
+                "elements": "int",
+                "default": [429, 502, 503, 504],
+            },
+            "retry_deadline": {"type": "int", "required": False},
+            "connection_pooling": {
+                "type": "bool",
+                "default": False,
+                "fallback": (env_fallback, ["NEXUS_CONNECTION_POOLING"]),
+            },
+            "json_streaming": {
+                "type": "bool",
+                "default": False,
+                "fallback": (env_fallback, ["NEXUS_JSON_STREAMING"]),
+            },
+            "compression": {
+                "type": "bool",
+                "default": False,
+                "fallback": (env_fallback, ["NEXUS_COMPRESSION"]),
+            },
+            "request_compression_threshold": {"type": "int", "default": 0},
+            "http_cache": {
+                "type": "bool",
+                "default": False,
+                "fallback": (env_fallback, ["NEXUS_HTTP_CACHE"]),
+            },
+            "http_cache_dir": {
+                "type": "path",
+                "required": False,
+                "fallback": (env_fallback, ["NEXUS_HTTP_CACHE_DIR"]),
+            },
+            "http_cache_ttl": {"type": "dict", "default": {}},
+            "http_cache_max_size": {"type": "int", "default": 50 * 1024 * 1024},
+            "state_cache": {
+                "type": "bool",
+                "default": False,
+                "fallback": (env_fallback, ["NEXUS_STATE_CACHE"]),
+            },
+            "state_cache_dir": {
+                "type": "path",
+                "required": False,
+                "fallback": (env_fallback, ["NEXUS_STATE_CACHE_DIR"]),
+            },
+            "state_cache_max_staleness": {
+                "type": "int",
+                "default": 300,
+                "fallback": (env_fallback, ["NEXUS_STATE_CACHE_MAX_STALENESS"]),
+            },
+            "max_concurrency": {
+                "type": "int",
+                "default": 1,
+                "fallback": (env_fallback, ["NEXUS_MAX_CONCURRENCY"]),
+            },
+            "requests_per_second": {
+                "type": "float",
+                "required": False,
+                "fallback": (env_fallback, ["NEXUS_REQUESTS_PER_SECOND"]),
+            },
+            "metrics": {
+                "type": "bool",
+                "default": False,
+                "fallback": (env_fallback, ["NEXUS_METRICS"]),
+            },
+            "auth_mode": {
+                "type": "str",
+                "choices": ["basic", "session"],
+                "default": "basic",
+                "fallback": (env_fallback, ["NEXUS_AUTH_MODE"]),
+            },
+            "session_cache_dir": {
+                "type": "path",
+                "required": False,
+                "fallback": (env_fallback, ["NEXUS_SESSION_CACHE_DIR"]),
+            },
+            "session_lifetime": {
+                "type": "int",
+                "default": 600,
+                "fallback": (env_fallback, ["NEXUS_SESSION_LIFETIME"]),
+            },
+            "feature_cache_dir": {
+                "type": "path",
+                "required": False,
+                "fallback": (env_fallback, ["NEXUS_FEATURE_CACHE_DIR"]),
+            },
+            "feature_cache_ttl": {
+                "type": "int",
+                "default": 3600,
+                "fallback": (env_fallback, ["NEXUS_FEATURE_CACHE_TTL"]),
+            },
         }
 
     def __init__(self, module):
@@ -140,6 +267,150 @@ class NexusHelper:
         self.module.params["url_password"] = self.module.params["password"]
         if not self.module.params["url"]:
             self.module.params["url"] = self.NEXUS_API_URL
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_client import (
+            NexusCaches,
+            NexusTransport,
+        )
+
+        self.transport = NexusTransport.from_params(
+            self.module.params,
+            # pylint: disable-next=protected-access
+            socket_path=self.module._socket_path,
+            shared_pools=NexusHelper.shared_connection_pools,
+        )
+        # The persistent connection handles the session itself.
+        self.caches = NexusCaches.from_params(
+            self.module.params, self.resource_family, sessions=self.transport.httpapi is None
+        )
+        self.diff = None
+        self._key_table = None
+        self._features = None
+        self._version_probe_info = None
+        self._extend_module_results()
+
+    @property
+    def features(self):
+        """nexus_features.NexusFeatures of the Nexus server, the version is detected on first use."""
+        if self._features is None:
+            # pylint: disable-next=import-outside-toplevel
+            from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_features import (
+                NexusFeatures,
+            )
+
+            self._features = NexusFeatures(
+                nexus_url=self.module.params["url"],
+                detect=lambda: self.probe_nexus_version(self.module.params["url"]),
+                cache_dir=self.module.params["feature_cache_dir"],
+                ttl=self.module.params["feature_cache_ttl"],
+            )
+        return self._features
+
+    @property
+    def key_table(self) -> dict:
+        """snake_case -> camelCase key table of the module's argument spec, compiled on first use."""
+        if self._key_table is None:
+            # pylint: disable-next=import-outside-toplevel
+            from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_normalize
+
+            self._key_table = nexus_normalize.compile_key_table(self.module.argument_spec)
+        return self._key_table
+
+    def _extend_module_results(self):
+        """Adds result_additions() to the module result and releases open connections when the module exits."""
+        exit_json = self.module.exit_json
+        fail_json = self.module.fail_json
+
+        def exit_json_with_additions(**kwargs):
+            for key, value in self.result_additions().items():
+                kwargs.setdefault(key, value)
+            self.close()
+            exit_json(**kwargs)
+
+        def fail_json_with_additions(msg, **kwargs):
+            # pylint: disable-next=import-outside-toplevel
+            from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_executor import (
+                NexusExecutorError,
+                in_worker,
+            )
+
+            if in_worker():
+                raise NexusExecutorError(msg)
+            for key, value in self.result_additions().items():
+                kwargs.setdefault(key, value)
+            self.close()
+            fail_json(msg, **kwargs)
+
+        self.module.exit_json = exit_json_with_additions
+        self.module.fail_json = fail_json_with_additions
+
+    def result_additions(self) -> dict:
+        """Information about the requests made which is added to the module result.
+
+        retry_stats is added when retries are configured, so that the result has the same shape whether
+        retries happened or not, the other information only if enabled.
+        """
+        additions = {}
+        if self.transport.connection_pool:
+            additions["connection_pool"] = dict(self.transport.connection_pool.stats)
+            if self.transport.shared_pool_stats:
+                # Only the requests of this module.
+                for key, value in self.transport.shared_pool_stats.items():
+                    additions["connection_pool"][key] -= value
+        if self.transport.retry_policy.attempts > 1:
+            additions["retry_stats"] = dict(self.transport.retry_policy.stats)
+        if self.transport.compression:
+            additions["transfer"] = dict(self.transport.compression.stats)
+        if self.caches.http_cache:
+            additions["http_cache"] = dict(self.caches.http_cache.stats)
+        if self.caches.state_cache:
+            additions["state_cache"] = dict(self.caches.state_cache.stats)
+        if self.caches.session_store:
+            additions["session"] = dict(self.caches.session_store.stats)
+        if self.transport.metrics:
+            additions["metrics"] = self.transport.metrics.summary()
+        if self.diff is not None:
+            additions["diff"] = self.diff
+        return additions
+
+    def record_change(self, before, after, rules=None) -> bool:
+        """Records a change about to be made, returned as before/after diff in diff mode.
+
+        The diff of an update only has the changed paths, e.g. "storage.blobStoreName", see
+        nexus_diff.changes_to_diff. Password keys are left out of the diff, the API never returns them.
+
+        Args:
+            before: Existing object, None when creating it.
+            after: Desired object, None when deleting it.
+            rules (nexus_diff.DiffRules): Optional per-path rules used to compare an update.
+
+        Returns:
+            bool: True in check mode, the caller must then return without making the change.
+        """
+        # pylint: disable-next=protected-access
+        if self.module._diff:
+            before = self.delete_all_password_keys(before or {})[1]
+            after = self.delete_all_password_keys(after or {})[1]
+            if before and after:
+                # pylint: disable-next=import-outside-toplevel
+                from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_diff
+
+                self.diff = nexus_diff.changes_to_diff(self.json_data_diff(before, after, rules))
+            else:
+                self.diff = {"before": before, "after": after}
+        return self.module.check_mode
+
+    def executor(self):
+        """NexusExecutor running independent requests concurrently, as configured by max_concurrency."""
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_executor import NexusExecutor
+
+        return NexusExecutor(max_workers=self.module.params["max_concurrency"])
+
+    def close(self):
+        # Shared connection pools are kept open for the next module.
+        if self.transport.connection_pool and self.transport.shared_pool_stats is None:
+            self.transport.connection_pool.close()
 
     def generic_authn_failure_msg(self):
         self.module.fail_json(msg="Authentication required.")
@@ -157,49 +428,18 @@ class NexusHelper:
             + ", body={request_info['body']}."
         )
 
-    # pylint: disable-next=too-many-branches
     def request(self, api_url, method, data=None, headers=None):
-        headers = headers or {}
-
-        headers.update(
-            {
-                "Authorization": basic_auth_header(
-                    self.module.params["username"], self.module.params["password"]
-                )
-            }
+        response, info, retries = self.send_request_with_retries(
+            api_url, method, data, headers
         )
 
-        if isinstance(data, dict):
-            data = self.module.jsonify(data)
-            if "Content-type" not in headers:
-                headers.update(
-                    {
-                        "Content-type": "application/json",
-                    }
-                )
-
-        retries = 1
-        response = None
-        info = {}
-        while retries <= self.module.params["retries"]:
-            response, info = fetch_url(
-                module=self.module,
-                url=api_url,
-                method=method,
-                headers=headers,
-                data=data,
-                force=True,
-                use_proxy=self.module.params["use_proxy"],
-            )
-            if info and info["status"] != -1:
-                break
-            time.sleep(self.module.params["sleep"])
-            retries += 1
-
         content = {}
 
+        raw_body = response.read() if response else b""
+        if self.transport.metrics:
+            self.transport.metrics.finish(info["status"], retries, len(raw_body or info.get("body") or b""))
         if response:
-            body = to_text(response.read())
+            body = to_text(raw_body)
             if body:
                 try:
                     js = json.loads(body)
@@ -213,694 +453,376 @@ class NexusHelper:
         if not self.is_request_status_ok(info):
             content["fetch_url_retries"] = retries
 
-        if info["status"] == 401:
-            self.module.fail_json(msg="Authentication required.")
-        elif info["status"] in [503, 500]:
-            self.module.fail_json(msg="Unavailable to service requests.")
-        elif info["status"] == -1:
-            self.module.fail_json(msg=info["msg"])
+        self.fail_on_unusable_response(info)
 
         return info, content
 
-    def is_request_status_ok(self, info) -> bool:
-        return info["status"] in [200, 201, 204]
+    def request_json_list(self, api_url, item_filter=None, parse_item=None):
+        """GET a JSON array, content["json"] will only contain the items accepted by item_filter.
 
-    def generate_url_query(self, params: dict):
-        """Generates a complete URL query including question mark.
+        With json_streaming enabled the array is decoded item by item while it is read from the
+        connection, so only the accepted items are kept in memory. With state_cache enabled the whole
+        array is kept as a snapshot which later module invocations read instead of calling Nexus.
+        The accepted items are passed through parse_item if given, e.g. nexus_models.User.from_api.
+        """
+        if self.caches.state_cache:
+            info, content = self.request_json_list_snapshot(api_url, item_filter)
+        else:
+            info, content = self.request_json_list_uncached(api_url, item_filter)
+        if parse_item and info["status"] == 200 and isinstance(content.get("json"), list):
+            content["json"] = [parse_item(item) for item in content["json"]]
+        return info, content
 
-        Args:
-            params (dict): A dictionary with query parameter key and what module parameter
-                to map it with
+    def request_json_list_snapshot(self, api_url, item_filter=None):
+        items = self.caches.state_cache.get(api_url)
+        if items is not None:
+            if item_filter:
+                items = [item for item in items if item_filter(item)]
+            return {"url": api_url, "status": 200, "msg": "OK (state cache)", "state_cache": "hit"}, {"json": items}
+        fetched_at = time.time()
+        info, content = self.request_json_list_uncached(api_url)
+        if info["status"] == 200 and isinstance(content.get("json"), list):
+            self.caches.state_cache.put(api_url, content["json"], fetched_at)
+            if item_filter:
+                content["json"] = [item for item in content["json"] if item_filter(item)]
+        return info, content
 
-        Returns:
-            string: Returns a query as a string including question mark in front.
-        """
-        query_params = []
-        for k, v in params.items():
-            if self.module.params[v] is not None:
-                query_params.append(f"{k}={self.module.params[v]}")
-        query = "&".join(query_params)
-        return "?" + query if len(query) > 0 else ""
+    def request_json_list_uncached(self, api_url, item_filter=None):
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_json_stream
 
-    def is_json_data_equal(self, left_data, right_data):
-        """Compares JSON data and is considered equal if all keys and its values matches."""
-        if left_data.keys() != right_data.keys():
-            return False
-        return all(right_data[k] == v for k, v in left_data.items())
+        if not self.module.params["json_streaming"]:
+            info, content = self.request(api_url=api_url, method="GET")
+            if item_filter and isinstance(content.get("json"), list):
+                content["json"] = [item for item in content["json"] if item_filter(item)]
+            return info, content
 
-    def clean_dict_list(self, data_to_clean):
-        d = copy.deepcopy(data_to_clean)
-        if isinstance(d, dict):
-            cleaned = {}
-            for k, v in d.items():
-                cleaned_value = self.clean_dict_list(v)
-                if cleaned_value not in ("", [], {}, None):
-                    cleaned[k] = cleaned_value
-            return cleaned
-        if isinstance(d, list):
-            return [self.clean_dict_list(i) for i in d if i not in ("", [], {}, None)]
-        return d
+        response, info, retries = self.send_request_with_retries(api_url, "GET")
 
-    def delete_all_none_values(self, data_to_clean, do_deepcopy=False):
-        """Delete all elements in a list or keys in dicts that is set to None."""
-        d = None
-        if do_deepcopy:
-            d = copy.deepcopy(data_to_clean)
-        else:
-            d = data_to_clean
-        if isinstance(d, dict):
-            cleaned = {}
-            for k, v in d.items():
-                cleaned_value = self.delete_all_none_values(v)
-                if cleaned_value is not None:
-                    cleaned[k] = cleaned_value
-            return cleaned
-        if isinstance(d, list):
-            return [self.delete_all_none_values(i) for i in d if i is not None]
-        return d
+        content = {}
 
-    def delete_all_password_keys(self, d: dict):
-        """Delete all keys in a dict that contains word password (case insensitive)."""
-        key_deleted = False
-        if isinstance(d, dict):
-            cleaned = {}
-            for k, v in d.items():
-                if isinstance(k, str) and k.lower() in "password":
-                    key_deleted = True
-                else:
-                    item_key_deleted, cleaned[k] = self.delete_all_password_keys(v)
-                    if item_key_deleted:
-                        key_deleted = True
-            return key_deleted, cleaned
-        return key_deleted, d
+        bytes_received = [len(info.get("body") or b"")]
+        if response:
+            if self.transport.metrics:
+                # pylint: disable-next=import-outside-toplevel
+                from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_compression import (
+                    CountingReader,
+                )
 
-    def get_nexus_version(self, nexus_base_url) -> NexusVersion:
-        """Get Nexus server version and parse it into version and edition"""
-        nexus_version = ""
-        nexus_edition = ""
-        info, _ = self.request(
-            api_url=(self.NEXUS_API_ENDPOINTS["system"] + "/node").format(
-                url=nexus_base_url,
-            ),
-            method="GET",
-        )
-        if info["status"] in [200]:
-            server_header = info["server"]
-            match = re.search(r"Nexus/([^ ]+) \(([^)]+)\)", str(server_header))
-            if match:
-                nexus_version = match.group(1)
-                nexus_edition = match.group(2)
-            else:
+                response = CountingReader(response, bytes_received.append)
+            try:
+                js = nexus_json_stream.load_json(response, item_filter)
+            except ValueError as e:
                 self.module.fail_json(
-                    msg=f"Unsupported Nexus server information format in HTTP header detected, server_header={server_header}."
+                    msg=f"Failed to decode JSON response from {api_url}, error_msg={e}."
                 )
-        elif info["status"] == 403:
-            self.generic_permission_failure_msg()
-        else:
-            self.module.fail_json(
-                msg=f"Failed to Nexus version information, http_status={info['status']}."
-            )
-        return NexusVersion(
-            version = nexus_version,
-            edition = nexus_edition
-        )
+            finally:
+                response.close()
+            if isinstance(js, dict):
+                content = js
+            elif js is not None:
+                content["json"] = js
+        if self.transport.metrics:
+            self.transport.metrics.finish(info["status"], retries, sum(bytes_received))
 
+        if not self.is_request_status_ok(info):
+            content["fetch_url_retries"] = retries
 
-# pylint: disable-next=too-many-public-methods
-class NexusRepositoryHelper:
-
-    @staticmethod
-    def storage_attributes():
-        """Directly maps to StorageAttributes"""
-        return {
-            "type": "dict",
-            "apply_defaults": True,
-            "options": {
-                "blob_store_name": {"type": "str", "default": "default"},
-                "strict_content_type_validation": {"type": "bool", "default": True},
-            },
-        }
-
-    @staticmethod
-    def hosted_storage_attributes():
-        """Directly maps to HostedStorageAttributes"""
-        return {
-            "type": "dict",
-            "apply_defaults": True,
-            "options": {
-                "blob_store_name": {"type": "str", "default": "default"},
-                "strict_content_type_validation": {"type": "bool", "default": True},
-                "write_policy": {
-                    "type": "str",
-                    "choices": ["ALLOW", "ALLOW_ONCE", "DENY"],
-                    "default": "ALLOW",
-                },
-            },
-        }
-
-    @staticmethod
-    def cleanup_policy_attributes():
-        """Directly maps to CleanupPolicyAttributes"""
-        return {
-            "type": "dict",
-            "options": {
-                "policy_names": {
-                    "type": "list",
-                    "elements": "str",
-                    "required": False,
-                    "no_log": False,
-                    "default": [],
-                },
-            },
-        }
-
-    @staticmethod
-    def proxy_argument_spec():
-        """Directly maps to ProxyAttributes"""
-        return {
-            "type": "dict",
-            "options": {
-                "remote_url": {
-                    "type": "str",
-                    "no_log": False,
-                    "required": False,
-                },  # Required for create/update
-                "content_max_age": {"type": "int", "default": 1440},
-                "metadata_max_age": {"type": "int", "default": 1440},
-            },
-        }
+        self.fail_on_unusable_response(info)
 
-    @staticmethod
-    def proxy_argument_spec_3_90():
-        """Directly maps to ProxyAttributes"""
-        arg_spec = NexusRepositoryHelper.proxy_argument_spec()
-        arg_spec["options"].update({"preserve_encoded_characters": {"type": "bool", "default": False}})
-        return arg_spec
+        return info, content
 
-    @staticmethod
-    def negative_cache_attributes():
-        """Directly maps to NegativeCacheAttributes"""
-        return {
-            "type": "dict",
-            "apply_defaults": True,
-            "options": {
-                "enabled": {"type": "bool", "default": True},
-                "time_to_live": {"type": "int", "default": 1440},
-            },
-        }
+    def send_request_with_retries(self, api_url, method, data=None, headers=None):
+        """Sends a request, retrying it according to the retry policy.
 
-    @staticmethod
-    def http_client_attributes():
-        """Directly maps to HttpClientAttributes"""
-        return {
-            "type": "dict",
-            "apply_defaults": True,
-            "options": {
-                "blocked": {"type": "bool", "default": False},
-                "auto_block": {"type": "bool", "default": True},
-                "connection": NexusRepositoryHelper.http_client_connection_attributes(),
-                "authentication": NexusRepositoryHelper.http_client_connection_authentication_attributes(),
-            },
-        }
+        Returns:
+            tuple: (response, info, number of attempts made)
+        """
+        headers = headers or {}
+        if self.module.check_mode and method.upper() not in ("GET", "HEAD"):
+            self.module.fail_json(
+                msg=f"Refusing to send {method.upper()} {api_url} in check mode, only read requests are allowed."
+            )
+        if self.transport.metrics:
+            self.transport.metrics.start(method, *self.endpoint_name(api_url))
 
-    @staticmethod
-    def http_client_connection_attributes():
-        """Directly maps to HttpClientConnectionAttributes"""
-        return {
-            "type": "dict",
-            "apply_defaults": True,
-            "options": {
-                "retries": {"type": "int"},  # min 0, max 10
-                "user_agent_suffix": {"type": "str", "required": False},
-                "timeout": {"type": "int"},  # min 1, max 3600
-                "enable_circular_redirects": {"type": "bool", "default": False},
-                "enable_cookies": {"type": "bool", "default": False},
-                "use_trust_store": {"type": "bool", "default": False},
-            },
-        }
+        if not self.transport.httpapi:
+            headers.update(self.auth_headers())
 
-    @staticmethod
-    def http_client_connection_authentication_attributes():
-        """Directly maps to HttpClientConnectionAuthenticationAttributes"""
-        return {
-            "type": "dict",
-            "options": {
-                "type": {
-                    "type": "str",
-                    "choices": ["username", "ntlm", "bearerToken"],
-                    "default": "username",
-                    "required": False,
-                },
-                "username": {"type": "str", "required": False},
-                "password": {"type": "str", "no_log": True, "required": False},
-                "ntlmHost": {"type": "str", "required": False},
-                "ntlmDomain": {"type": "str", "required": False},
-                "bearerToken": {"type": "str", "required": False},
-            },
-        }
+        if isinstance(data, dict):
+            data = self.module.jsonify(data)
+            if "Content-type" not in headers:
+                headers.update(
+                    {
+                        "Content-type": "application/json",
+                    }
+                )
 
-    @staticmethod
-    def replication_attributes():
-        """Directly maps to ReplicationAttributes"""
-        return {
-            "type": "dict",
-            "options": {
-                "preemptive_pull_enabled": {"type": "bool", "default": False},
-                "asset_path_regex": {"type": "str", "required": False},
-            },
-        }
+        cacheable = self.caches.http_cache is not None and method.upper() == "GET"
+        if cacheable:
+            headers.update(self.caches.http_cache.conditional_headers(api_url))
 
-    @staticmethod
-    def component_attributes():
-        """Directly maps to ComponentAttributes"""
-        return {
-            "type": "dict",
-            "apply_defaults": True,
-            "options": {"proprietary_components": {"type": "bool", "default": False}},
-        }
+        response, info, retries = self.send_request_with_retry_policy(api_url, method, data, headers)
+        if self.transport.metrics:
+            self.transport.metrics.first_byte(info)
 
-    @staticmethod
-    def group_attributes():
-        """Directly maps to GroupAttributes"""
-        return {
-            "type": "dict",
-            "options": {
-                "member_names": {
-                    "type": "list",
-                    "elements": "str",
-                    "default": [],
-                },
-            },
-        }
+        if cacheable:
+            response, info = self.caches.http_cache.handle_response(api_url, response, info)
+        elif method.upper() != "GET":
+            self.update_caches_after_write(api_url, method, info["status"])
+        return response, info, retries
 
-    @staticmethod
-    def http_client_attributes_with_preemptive_auth():
-        """Directly maps to HttpClientAttributesWithPreemptiveAuth"""
+    def send_request_with_retry_policy(self, api_url, method, data, headers):
+        """Sends a request until the retry policy gives up, returns (response, info, number of attempts made)."""
+        retries = 1
+        retried_statuses = []
+        sleep_seconds = 0.0
+        started = time.monotonic()
+        while True:
+            if self.transport.rate_limiter:
+                self.transport.rate_limiter.acquire()
+            if self.transport.metrics and data:
+                self.transport.metrics.sent(len(data))
+            response, info = self.send_request(api_url, method, data, headers)
+            if info["status"] == 401 and self.renew_session(headers):
+                if response:
+                    response.close()
+                response, info = self.send_request(api_url, method, data, headers)
+            delay = self.transport.retry_policy.next_delay(
+                method, info, retries, time.monotonic() - started
+            )
+            if delay is None:
+                break
+            if response:
+                response.close()
+            retried_statuses.append(info["status"])
+            time.sleep(delay)
+            sleep_seconds += delay
+            retries += 1
+        self.transport.retry_policy.record(retries, sleep_seconds, retried_statuses)
+        return response, info, retries
+
+    def update_caches_after_write(self, api_url, method, status):
+        """Invalidates the cached responses and listings which a write request changes."""
+        if self.caches.http_cache:
+            self.caches.http_cache.invalidate(api_url)
+        if self.caches.state_cache:
+            self.caches.state_cache.apply_write(api_url, method.upper(), status)
+
+    def auth_headers(self) -> dict:
+        """Headers authenticating a request, with the session in session mode if Nexus created one."""
+        if self.caches.session_store:
+            with self.caches.session_lock:
+                if self.caches.session_headers is None:
+                    self.caches.session_headers = self.caches.session_store.get()
+                    if self.caches.session_headers is None:
+                        self.caches.session_headers = self.create_session()
+                    else:
+                        self.caches.session_store.stats["reused"] += 1
+            if self.caches.session_headers:
+                return dict(self.caches.session_headers)
         return {
-            "type": "dict",
-            "apply_defaults": True,
-            "options": {
-                "blocked": {"type": "bool", "default": False},
-                "auto_block": {"type": "bool", "default": True},
-                "connection": NexusRepositoryHelper.http_client_connection_attributes(),
-                "authentication": NexusRepositoryHelper.http_client_connection_authentication_attributes_with_preemptive(),
-            },
-        }
-
-    @staticmethod
-    def http_client_connection_authentication_attributes_with_preemptive():
-        """Directly maps to HttpClientConnectionAuthenticationAttributesWithPreemptive"""
-        ret_spec = (
-            NexusRepositoryHelper.http_client_connection_authentication_attributes()
-        )
-        ret_spec["options"]["preemptive"] = {
-            "type": "bool",
-            "default": False,
-            "required": False,
+            "Authorization": basic_auth_header(
+                self.module.params["username"], self.module.params["password"]
+            )
         }
-        return ret_spec
 
-    @staticmethod
-    def group_deploy_attributes():
-        """Directly maps to GroupDeployAttributes"""
-        ret_spec = NexusRepositoryHelper.group_attributes()
-        ret_spec["options"]["writable_member"] = {
-            "type": "str",
-        }
-        return ret_spec
+    def create_session(self):
+        """Logs in and stores the session, returns its headers, {} to use basic authentication instead."""
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_session
 
-    @staticmethod
-    def list_repositories(helper):
-        info, content = helper.request(
-            api_url=(helper.NEXUS_API_ENDPOINTS["repository-settings"]).format(
-                url=helper.module.params["url"],
+        session_headers, info = nexus_session.login(
+            lambda path, method, data, headers: self.transport_request(
+                self.module.params["url"].rstrip("/") + path, method, data, headers
             ),
-            method="GET",
+            self.module.params["username"],
+            self.module.params["password"],
         )
-        if info["status"] in [200]:
-            content = content["json"]
-        else:
-            helper.generic_failure_msg("Failed to list repositories", info)
-        return content
-
-    @staticmethod
-    def list_filtered_repositories(helper, list_filter=repository_name_filter):
-        content = NexusRepositoryHelper.list_repositories(helper)
-        content = list(filter(lambda item: list_filter(item, helper), content))
-        return content
-
-    @staticmethod
-    def create_repository(helper: NexusHelper, endpoint_path: str, data: dict):
-        changed = True
-        info, content = helper.request(
-            api_url=(helper.NEXUS_API_ENDPOINTS["repositories"] + endpoint_path).format(
-                url=helper.module.params["url"],
-            ),
-            method="POST",
-            data=data,
-        )
-        if info["status"] not in [201]:
+        if session_headers is None:
             if info["status"] == 401:
-                helper.generic_authn_failure_msg()
-            elif info["status"] == 403:
-                helper.generic_permission_failure_msg()
-            else:
-                helper.module.fail_json(
-                    msg=f"Failed to create repository {helper.module.params['name']}, \
-                        http_status={info['status']}, error_msg='{info['msg']}, body={info['body']}'."
-                )
+                self.fail_on_unusable_response(info)
+            self.module.warn(
+                f"No Nexus session could be created, using basic authentication: {info.get('msg')}"
+            )
+            return {}
+        self.caches.session_store.put(session_headers)
+        self.caches.session_store.stats["logins"] += 1
+        return session_headers
 
-        return content, changed
+    def renew_session(self, headers) -> bool:
+        """Replaces the session in headers, rejected by Nexus, with a new one. False if headers had no session."""
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_session import CSRF_TOKEN
 
-    @staticmethod
-    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
-    def update_repository(
-        helper: NexusHelper,
-        endpoint_path: str,
-        data: dict,
-        existing_data: dict,
-        api_response_normalization=None,
-        request_payload_normalization=None,
-    ):
-        normalized_data = helper.clean_dict_list(data)
-        normalized_existing_data = helper.clean_dict_list(existing_data)
-
-        normalized_existing_data.pop("format", None)  # type: ignore
-        normalized_existing_data.pop("type", None)  # type: ignore
-        normalized_existing_data.pop("url", None)  # type: ignore
-        if api_response_normalization:
-            normalized_existing_data = api_response_normalization(
-                normalized_existing_data
-            )
-        if request_payload_normalization:
-            normalized_data = request_payload_normalization(
-                normalized_data, normalized_existing_data
+        if not self.caches.session_store or "Cookie" not in headers:
+            return False
+        with self.caches.session_lock:
+            # Unless another thread already renewed it.
+            if self.caches.session_headers and headers["Cookie"] == self.caches.session_headers["Cookie"]:
+                self.caches.session_store.drop(self.caches.session_headers)
+                self.caches.session_headers = self.create_session()
+                self.caches.session_store.stats["renewed"] += 1
+        headers.pop("Cookie")
+        headers.pop(CSRF_TOKEN, None)
+        headers.update(self.auth_headers())
+        return True
+
+    def endpoint_name(self, api_url):
+        """Name of the endpoint in NEXUS_API_ENDPOINTS which api_url belongs to, and the rest of its path."""
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_http_cache
+
+        return nexus_http_cache.endpoint_name(api_url, self.NEXUS_API_ENDPOINTS, self.NEXUS_API_BASE_PATH)
+
+    def resource_family(self, api_url):
+        """Name of the endpoint in NEXUS_API_ENDPOINTS which api_url belongs to."""
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_http_cache
+
+        return nexus_http_cache.resource_family(api_url, self.NEXUS_API_ENDPOINTS, self.NEXUS_API_BASE_PATH)
+
+    def fail_on_unusable_response(self, info):
+        if info["status"] == 401:
+            self.module.fail_json(msg="Authentication required.")
+        elif info["status"] in [503, 500]:
+            self.module.fail_json(msg="Unavailable to service requests.")
+        elif info["status"] == -1:
+            self.module.fail_json(msg=info["msg"])
+
+    def send_request(self, api_url, method, data, headers):
+        """Sends a single request without retries, returns (response, info) like fetch_url."""
+        if not self.transport.compression:
+            return self.transport_request(api_url, method, data, headers)
+
+        encoded_data, encoded_headers = self.transport.compression.encode_request(data, headers)
+        response, info = self.transport_request(api_url, method, encoded_data, encoded_headers)
+        if self.transport.compression.is_request_encoding_rejected(encoded_headers, info):
+            encoded_data, encoded_headers = self.transport.compression.encode_request(data, headers)
+            response, info = self.transport_request(api_url, method, encoded_data, encoded_headers)
+        return self.transport.compression.decode_response(response, info), info
+
+    def transport_request(self, api_url, method, data, headers):
+        """Sends a request using the configured transport, returns (response, info) like fetch_url."""
+        if self.transport.httpapi:
+            return self.transport.httpapi.request(api_url, method, data, headers)
+        if self.transport.connection_pool:
+            return self.transport.connection_pool.request(
+                url=api_url,
+                method=method,
+                data=data,
+                headers=headers,
             )
-        # Delete password from structure because API will never return it.
-        got_password = False
-        if normalized_data.get("httpClient") and normalized_data[  # type: ignore
-            "httpClient"
-        ].get(
-            "authentication"
-        ):  # type: ignore
-            got_password = normalized_data["httpClient"]["authentication"].get("password") is not None  # type: ignore
-            normalized_data["httpClient"]["authentication"].pop("password", None)  # type: ignore
-
-        changed = not helper.is_json_data_equal(
-            normalized_data, normalized_existing_data
-        )
-        if not changed and not got_password:
-            return existing_data, False
-
-        info, content = helper.request(
-            api_url=(
-                helper.NEXUS_API_ENDPOINTS["repositories"] + "{path}/{repository}"
-            ).format(
-                url=helper.module.params["url"],
-                path=endpoint_path,
-                repository=helper.module.params["name"],
-            ),
-            method="PUT",
+        # pylint: disable-next=import-outside-toplevel
+        from ansible.module_utils.urls import fetch_url
+
+        return fetch_url(
+            module=self.module,
+            url=api_url,
+            method=method,
+            headers=headers,
             data=data,
+            force=True,
+            use_proxy=self.module.params["use_proxy"],
+            timeout=self.module.params["timeout"],
+            decompress=self.transport.compression is None,
         )
 
-        if info["status"] not in [204]:
-            if info["status"] == 401:
-                helper.generic_authn_failure_msg()
-            elif info["status"] == 403:
-                helper.generic_permission_failure_msg()
-            else:
-                helper.module.fail_json(
-                    msg=f"Failed to update repository {helper.module.params['name']}, \
-                        http_status={info['status']}, error_msg='{info['msg']}, body={info['body']}'."
-                )
-
-        return content, changed
+    def is_request_status_ok(self, info) -> bool:
+        return info["status"] in [200, 201, 204]
 
-    @staticmethod
-    def delete_repository(helper):
-        changed = True
-        info, content = helper.request(
-            api_url=(helper.NEXUS_API_ENDPOINTS["repositories"] + "/{name}").format(
-                url=helper.module.params["url"],
-                name=helper.module.params["name"],
-            ),
-            method="DELETE",
-        )
+    def generate_url_query(self, params: dict):
+        """Generates a complete URL query including question mark.
 
-        if info["status"] not in [204]:
-            if info["status"] in [404]:
-                content.pop("fetch_url_retries", None)
-                changed = False
-            elif info["status"] == 401:
-                helper.generic_authn_failure_msg()
-            elif info["status"] == 403:
-                helper.generic_permission_failure_msg()
-            else:
-                helper.module.fail_json(
-                    msg=f"Failed to delete {helper.module.params['name']}., \
-                        http_status={info['status']}, error_msg='{info['msg']}'."
-                )
+        Args:
+            params (dict): A dictionary with query parameter key and what module parameter
+                to map it with
 
-        return content, changed
+        Returns:
+            string: Returns a query as a string including question mark in front.
+        """
+        query_params = []
+        for k, v in params.items():
+            if self.module.params[v] is not None:
+                query_params.append(f"{k}={self.module.params[v]}")
+        query = "&".join(query_params)
+        return "?" + query if len(query) > 0 else ""
 
-    @staticmethod
-    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
-    def create_update_repository(
-        helper: NexusHelper,
-        endpoint_path: str,
-        data: dict,
-        existing_data: list,
-        api_response_normalization=None,
-        request_payload_normalization=None,
-    ):
-        if len(existing_data) > 0:
-            return NexusRepositoryHelper.update_repository(
-                helper=helper,
-                endpoint_path=endpoint_path,
-                data=data,
-                request_payload_normalization=request_payload_normalization,
-                existing_data=existing_data[0],
-                api_response_normalization=api_response_normalization,
-            )
-        return NexusRepositoryHelper.create_repository(helper, endpoint_path, data)
+    def is_json_data_equal(self, left_data, right_data, rules=None):
+        """Compares JSON data and is considered equal if all keys and its values matches.
 
-    @staticmethod
-    # pylint: disable-next=too-many-arguments,too-many-positional-arguments,too-many-locals
-    def generic_repository_proxy_module(
-        endpoint_path: str,
-        repository_filter=repository_name_filter,
-        api_response_normalization=None,
-        request_payload_normalization=nexus_repository_commons.proxy_repo_request_payload_normalization,
-        arg_additions=None,
-        request_data_additions=None,
-    ):
-        argument_spec = NexusHelper.nexus_argument_spec()
-        argument_spec.update(
-            {
-                "state": {
-                    "type": "str",
-                    "choices": ["online", "offline", "present", "absent"],
-                    "default": "present",
-                },
-                "name": {"type": "str", "no_log": False, "required": True},
-                "http_client": NexusRepositoryHelper.http_client_attributes(),
-                "negative_cache": NexusRepositoryHelper.negative_cache_attributes(),
-                "proxy": NexusRepositoryHelper.proxy_argument_spec_3_90(),
-                "storage": NexusRepositoryHelper.storage_attributes(),
-                # Optional
-                "cleanup": NexusRepositoryHelper.cleanup_policy_attributes(),
-                "routing_rule_name": {
-                    "type": "str",
-                    "no_log": False,
-                    "required": False,
-                },
-                "replication": NexusRepositoryHelper.replication_attributes(),
-            }
-        )
-        if arg_additions:
-            argument_spec.update(arg_additions)
+        Args:
+            rules (nexus_diff.DiffRules): Optional per-path rules, e.g. order insensitive lists.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_diff
 
-        module = AnsibleModule(
-            argument_spec=argument_spec,
-            supports_check_mode=False,
-            required_together=[("username", "password")],
-        )
+        return nexus_diff.is_equal(right_data, left_data, rules)
 
-        helper = NexusHelper(module)
+    def json_data_diff(self, before, after, rules=None):
+        """List of changes (path, before, after) between JSON data, see nexus_diff.diff."""
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_diff
 
-        changed, content = False, {}
-        existing_data = NexusRepositoryHelper.list_filtered_repositories(
-            helper, repository_filter
-        )
-        if helper.module.params["state"] == "absent":  # type: ignore
-            if len(existing_data) > 0:
-                content, changed = NexusRepositoryHelper.delete_repository(helper)
-        else:
-            # <X>ProxyRepositoryApiRequest
-            data = {
-                "name": module.params["name"],  # type: ignore
-                "online": module.params["state"] == "online" or module.params["state"] == "present",  # type: ignore
-                "httpClient": NexusHelper.camalize_param(helper, "http_client"),
-                "negativeCache": NexusHelper.camalize_param(helper, "negative_cache"),
-                "proxy": NexusHelper.camalize_param(helper, "proxy"),
-                "storage": NexusHelper.camalize_param(helper, "storage"),
-                "cleanup": NexusHelper.camalize_param(helper, "cleanup"),
-                "routingRuleName": helper.module.params["routing_rule_name"],  # type: ignore
-                "replication": NexusHelper.camalize_param(helper, "replication"),
-            }
-            if not request_data_additions:
-                request_data_additions = {}
-            for k, v in request_data_additions.items():
-                if v == "camalize":
-                    data[humps.camelize(k)] = NexusHelper.camalize_param(helper, k)
-                else:
-                    data[humps.camelize(k)] = module.params[k]
-
-            content, changed = NexusRepositoryHelper.create_update_repository(
-                helper=helper,
-                endpoint_path=endpoint_path,
-                data=data,
-                existing_data=existing_data,
-                api_response_normalization=api_response_normalization,
-                request_payload_normalization=request_payload_normalization,
-            )
-        result = NexusHelper.generate_result_struct(changed, content)
-        module.exit_json(**result)
+        return nexus_diff.diff(before, after, rules)
 
-    @staticmethod
-    def generic_repository_group_module(
-        endpoint_path: str,
-        repository_filter=repository_name_filter,
-        api_response_normalization=None,
-        arg_additions=None,
-        request_data_additions=None,
-    ):
-        argument_spec = NexusHelper.nexus_argument_spec()
-        argument_spec.update(
-            {
-                "state": {
-                    "type": "str",
-                    "choices": ["online", "offline", "present", "absent"],
-                    "default": "present",
-                },
-                "name": {"type": "str", "no_log": False, "required": True},
-                "storage": NexusRepositoryHelper.storage_attributes(),
-                "group": NexusRepositoryHelper.group_deploy_attributes(),
-            }
-        )
-        if arg_additions:
-            argument_spec.update(arg_additions)
+    def clean_dict_list(self, data_to_clean):
+        """Deep copy without empty values ("", [], {}, None), see nexus_normalize.normalize."""
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_normalize
 
-        module = AnsibleModule(
-            argument_spec=argument_spec,
-            supports_check_mode=False,
-            required_together=[("username", "password")],
-        )
+        return nexus_normalize.normalize(data_to_clean, prune_empty=True)[0]
 
-        helper = NexusHelper(module)
+    def delete_all_none_values(self, data_to_clean, do_deepcopy=False):
+        """Delete all elements in a list or keys in dicts that is set to None."""
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_normalize
 
-        changed, content = False, {}
-        existing_data = NexusRepositoryHelper.list_filtered_repositories(
-            helper, repository_filter
-        )
-        if helper.module.params["state"] == "absent":  # type: ignore
-            if len(existing_data) > 0:
-                content, changed = NexusRepositoryHelper.delete_repository(helper)
-        else:
-            # <X>GroupRepositoryApiRequest
-            data = {
-                "name": module.params["name"],  # type: ignore
-                "online": module.params["state"] == "online" or module.params["state"] == "present",  # type: ignore
-                "storage": NexusHelper.camalize_param(helper, "storage"),
-                "group": NexusHelper.camalize_param(helper, "group"),
-            }
-            if not request_data_additions:
-                request_data_additions = {}
-            for k, v in request_data_additions.items():
-                if v == "camalize":
-                    data[humps.camelize(k)] = NexusHelper.camalize_param(helper, k)
-                else:
-                    data[humps.camelize(k)] = module.params[k]
-
-            content, changed = NexusRepositoryHelper.create_update_repository(
-                helper=helper,
-                endpoint_path=endpoint_path,
-                data=data,
-                existing_data=existing_data,
-                api_response_normalization=api_response_normalization,
-            )
-        result = NexusHelper.generate_result_struct(changed, content)
+        return nexus_normalize.normalize(data_to_clean, drop_none=True, copy_leaves=do_deepcopy)[0]
 
-        module.exit_json(**result)
+    def delete_all_password_keys(self, d: dict):
+        """Delete all keys in a dict that contains word password (case insensitive)."""
+        if not isinstance(d, dict):
+            return False, d
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_normalize
 
-    @staticmethod
-    # pylint: disable-next=too-many-arguments,too-many-positional-arguments,too-many-locals
-    def generic_repository_hosted_module(
-        endpoint_path: str,
-        repository_filter=repository_name_filter,
-        request_payload_normalization=nexus_repository_commons.hosted_repo_request_payload_normalization,
-        api_response_normalization=None,
-        arg_additions=None,
-        request_data_additions=None,
-    ):
-        argument_spec = NexusHelper.nexus_argument_spec()
-        argument_spec.update(
-            {
-                "state": {
-                    "type": "str",
-                    "choices": ["online", "offline", "present", "absent"],
-                    "default": "present",
-                },
-                "name": {"type": "str", "no_log": False, "required": True},
-                "storage": NexusRepositoryHelper.hosted_storage_attributes(),
-                "cleanup": NexusRepositoryHelper.cleanup_policy_attributes(),
-                "component": NexusRepositoryHelper.component_attributes(),
-            }
-        )
-        if arg_additions:
-            argument_spec.update(arg_additions)
+        cleaned, key_deleted = nexus_normalize.normalize(d, drop_password_keys=True, copy_leaves=False)
+        return key_deleted, cleaned
 
-        module = AnsibleModule(
-            argument_spec=argument_spec,
-            supports_check_mode=False,
-            required_together=[("username", "password")],
+    def probe_nexus_version(self, nexus_base_url):
+        """Requests the Nexus server version, None if it cannot be detected."""
+        info, dummy = self.request(
+            api_url=(self.NEXUS_API_ENDPOINTS["system"] + "/node").format(
+                url=nexus_base_url,
+            ),
+            method="GET",
         )
+        self._version_probe_info = info
+        if info["status"] in [200]:
+            match = re.search(r"Nexus/([^ ]+) \(([^)]+)\)", str(info.get("server")))
+            if match:
+                return NexusVersion(version=match.group(1), edition=match.group(2))
+        return None
 
-        helper = NexusHelper(module)
+    def get_nexus_version(self, nexus_base_url) -> NexusVersion:
+        """Get Nexus server version and parse it into version and edition.
 
-        changed, content = False, {}
-        existing_data = NexusRepositoryHelper.list_filtered_repositories(
-            helper, repository_filter
-        )
-        if helper.module.params["state"] == "absent":  # type: ignore
-            if len(existing_data) > 0:
-                content, changed = NexusRepositoryHelper.delete_repository(helper)
+        Always asks the server, unlike features which may use a cached version from before an upgrade.
+        """
+        detected = self.probe_nexus_version(nexus_base_url)
+        if detected:
+            return detected
+        info = self._version_probe_info
+        if info["status"] in [200]:
+            self.module.fail_json(
+                msg="Unsupported Nexus server information format in HTTP header detected, "
+                f"server_header={info.get('server')}."
+            )
+        elif info["status"] == 403:
+            self.generic_permission_failure_msg()
         else:
-            # <X>HostedRepositoryApiRequest
-            data = {
-                "name": module.params["name"],  # type: ignore
-                "online": module.params["state"] == "online" or module.params["state"] == "present",  # type: ignore
-                "storage": NexusHelper.camalize_param(helper, "storage"),
-                "cleanup": NexusHelper.camalize_param(helper, "cleanup"),
-                "component": NexusHelper.camalize_param(helper, "component"),
-            }
-            if not request_data_additions:
-                request_data_additions = {}
-            for k, v in request_data_additions.items():
-                if v == "camalize":
-                    data[humps.camelize(k)] = NexusHelper.camalize_param(helper, k)
-                else:
-                    data[humps.camelize(k)] = module.params[k]
-
-            content, changed = NexusRepositoryHelper.create_update_repository(
-                helper=helper,
-                endpoint_path=endpoint_path,
-                data=data,
-                request_payload_normalization=request_payload_normalization,
-                existing_data=existing_data,
-                api_response_normalization=api_response_normalization,
+            self.module.fail_json(
+                msg=f"Failed to Nexus version information, http_status={info['status']}."
             )
-        result = NexusHelper.generate_result_struct(changed, content)
-
-        module.exit_json(**result)
+        return NexusVersion(version="", edition="")
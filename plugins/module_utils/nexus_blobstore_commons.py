@@ -61,8 +61,10 @@ def get_blobstore(helper, blobstore_type):
     return content
 
 
-def delete_blobstore(helper):
+def delete_blobstore(helper, existing_data=None):
     changed = True
+    if helper.record_change(existing_data, None):
+        return {}, changed
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["blobstores"] + "/{name}").format(
             url=helper.module.params["url"],
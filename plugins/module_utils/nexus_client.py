@@ -0,0 +1,181 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+"""How NexusHelper sends requests and what it caches, created from the module parameters.
+
+The optional parts are only imported when enabled.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+# pylint: disable=import-outside-toplevel
+
+import dataclasses
+import threading
+import typing
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_retry import (
+    NexusRetryPolicy,
+)
+
+
+@dataclasses.dataclass
+class NexusTransport:
+    """How requests are sent.
+
+    Attributes:
+        retry_policy: NexusRetryPolicy of the requests.
+        httpapi: NexusHttpApiTransport when the connection is the haxorof.sonatype_nexus.nexus httpapi plugin,
+            which then authenticates, pools connections and gives the URL.
+        connection_pool: NexusConnectionPool with connection_pooling, requests are otherwise sent with fetch_url.
+        shared_pool_stats: Statistics of connection_pool when the module started if the pool is shared by the
+            modules run in the same process, to report those of the module only.
+        rate_limiter: TokenBucket with requests_per_second.
+        compression: NexusCompression with compression.
+        metrics: NexusMetrics with metrics.
+    """
+
+    retry_policy: NexusRetryPolicy
+    httpapi: typing.Any = None
+    connection_pool: typing.Any = None
+    shared_pool_stats: dict = None
+    rate_limiter: typing.Any = None
+    compression: typing.Any = None
+    metrics: typing.Any = None
+
+    @classmethod
+    def from_params(cls, params, socket_path=None, shared_pools=None):
+        """Transport configured by the module parameters.
+
+        Args:
+            socket_path: Socket of the persistent connection of the module, if any.
+            shared_pools (dict): Connection pools shared by the modules run in the same process, per settings.
+        """
+        transport = cls(retry_policy=NexusRetryPolicy.from_params(params))
+        if socket_path:
+            from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_httpapi import (
+                NexusHttpApiTransport,
+            )
+
+            transport.httpapi = NexusHttpApiTransport(socket_path)
+        if params["connection_pooling"] and not transport.httpapi:
+            transport.connection_pool, transport.shared_pool_stats = connection_pool(params, shared_pools)
+        if params["requests_per_second"]:
+            from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_executor import (
+                TokenBucket,
+            )
+
+            transport.rate_limiter = TokenBucket(params["requests_per_second"])
+        if params["compression"] and not transport.httpapi:
+            from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_compression import (
+                NexusCompression,
+            )
+
+            transport.compression = NexusCompression(request_threshold=params["request_compression_threshold"])
+        if params["metrics"]:
+            from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_metrics import (
+                NexusMetrics,
+            )
+
+            transport.metrics = NexusMetrics()
+        return transport
+
+
+def connection_pool(params, shared_pools=None):
+    """Connection pool for the module parameters, taken from shared_pools if it has one with the same settings.
+
+    Returns:
+        tuple: (pool, statistics of the pool when taken from or added to shared_pools, otherwise None)
+    """
+    from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_transport import (
+        NexusConnectionPool,
+    )
+
+    settings = (params["validate_certs"], params["use_proxy"], params["timeout"], max(8, params["max_concurrency"]))
+    pool = (shared_pools or {}).get(settings)
+    if pool is None:
+        pool = NexusConnectionPool(
+            validate_certs=settings[0], use_proxy=settings[1], timeout=settings[2], max_idle_per_host=settings[3]
+        )
+    if shared_pools is None:
+        return pool, None
+    shared_pools.setdefault(settings, pool)
+    return pool, dict(pool.stats)
+
+
+@dataclasses.dataclass
+class NexusCaches:
+    """What is cached across requests and modules.
+
+    Attributes:
+        http_cache: NexusHttpCache with http_cache.
+        state_cache: NexusStateCache with state_cache.
+        session_store: NexusSessionStore with auth_mode session.
+        session_headers: Headers of the session used, loaded from session_store or created on first use.
+        session_lock: Lock of session_headers, requests may be sent concurrently.
+    """
+
+    http_cache: typing.Any = None
+    state_cache: typing.Any = None
+    session_store: typing.Any = None
+    session_headers: dict = None
+    session_lock: typing.Any = dataclasses.field(default_factory=threading.Lock)
+
+    @classmethod
+    def from_params(cls, params, family_of, sessions=True):
+        """Caches configured by the module parameters.
+
+        Args:
+            family_of: Function returning the resource family of an API URL, see NexusHelper.resource_family.
+            sessions (bool): False if the sessions are not handled by the module, e.g. by the httpapi plugin.
+        """
+        caches = cls()
+        if not (params["http_cache"] or params["state_cache"] or params["auth_mode"] == "session"):
+            return caches
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_http_cache import (
+            credential_identity,
+        )
+
+        identity = credential_identity(params["username"], params["password"])
+        if params["http_cache"]:
+            from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_http_cache import (
+                NexusHttpCache,
+            )
+
+            caches.http_cache = NexusHttpCache(
+                cache_dir=params["http_cache_dir"],
+                identity=identity,
+                family_of=family_of,
+                ttl=params["http_cache_ttl"],
+                max_size=params["http_cache_max_size"],
+            )
+        if params["state_cache"]:
+            from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_state_cache import (
+                NexusStateCache,
+            )
+
+            caches.state_cache = NexusStateCache(
+                cache_dir=params["state_cache_dir"],
+                nexus_url=params["url"],
+                identity=identity,
+                family_of=family_of,
+                max_staleness=params["state_cache_max_staleness"],
+            )
+        if params["auth_mode"] == "session" and params["username"] and sessions:
+            from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_session import (
+                NexusSessionStore,
+            )
+
+            caches.session_store = NexusSessionStore(
+                cache_dir=params["session_cache_dir"],
+                nexus_url=params["url"],
+                identity=identity,
+                lifetime=params["session_lifetime"],
+            )
+        return caches
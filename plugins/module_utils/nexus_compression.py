@@ -0,0 +1,151 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import gzip
+import io
+import threading
+import zlib
+
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Status codes telling that the server does not accept a compressed request body
+REJECTED_REQUEST_ENCODING_STATUS_CODES = (400, 415)
+
+
+class CountingReader:
+    """Wraps a binary file-like object and counts the bytes read from it."""
+
+    def __init__(self, fp, on_read):
+        self._fp = fp
+        self._on_read = on_read
+
+    def read(self, amt=None):
+        data = self._fp.read() if amt is None or amt < 0 else self._fp.read(amt)
+        if data:
+            self._on_read(len(data))
+        return data
+
+    def close(self):
+        self._fp.close()
+
+
+class DecodingReader:
+    """Incrementally decodes a gzip or deflate encoded binary file-like object."""
+
+    def __init__(self, fp, encoding, on_decoded=None):
+        self._fp = fp
+        self._on_decoded = on_decoded
+        self._pending = b""
+        self._eof = False
+        self._deflate_raw_fallback = encoding == "deflate"
+        wbits = 16 + zlib.MAX_WBITS if encoding == "gzip" else zlib.MAX_WBITS
+        self._decompressor = zlib.decompressobj(wbits)
+
+    def _decompress(self, data):
+        try:
+            return self._decompressor.decompress(data)
+        except zlib.error:
+            # Some servers send raw deflate data without zlib header.
+            if not self._deflate_raw_fallback:
+                raise
+            self._deflate_raw_fallback = False
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._decompressor.decompress(data)
+
+    def _fill(self, amt):
+        data = self._fp.read(amt)
+        if data:
+            decoded = self._decompress(data)
+            self._deflate_raw_fallback = False
+        else:
+            decoded = self._decompressor.flush()
+            self._eof = True
+        if self._on_decoded and decoded:
+            self._on_decoded(len(decoded))
+        self._pending += decoded
+
+    def read(self, amt=None):
+        if amt is None or amt < 0:
+            while not self._eof:
+                self._fill(64 * 1024)
+            data, self._pending = self._pending, b""
+            return data
+        while len(self._pending) < amt and not self._eof:
+            self._fill(amt)
+        data, self._pending = self._pending[:amt], self._pending[amt:]
+        return data
+
+    def close(self):
+        self._fp.close()
+
+
+class NexusCompression:
+    """Negotiates compressed transfers and keeps statistics of bytes on the wire versus decoded bytes."""
+
+    def __init__(self, request_threshold=0):
+        self.request_threshold = request_threshold
+        self.request_encoding_rejected = False
+        self.stats = {
+            "bytes_sent": 0,
+            "bytes_sent_decoded": 0,
+            "bytes_received": 0,
+            "bytes_received_decoded": 0,
+        }
+        self._lock = threading.Lock()
+
+    def _count(self, key, amount):
+        with self._lock:
+            self.stats[key] += amount
+
+    def encode_request(self, data, headers):
+        """Returns (data, headers) for the request, compressing the body if large enough."""
+        headers = dict(headers)
+        headers["Accept-Encoding"] = ACCEPT_ENCODING
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if not data:
+            return data, headers
+        self._count("bytes_sent_decoded", len(data))
+        if (
+            self.request_threshold > 0
+            and len(data) >= self.request_threshold
+            and not self.request_encoding_rejected
+        ):
+            data = gzip.compress(data)
+            headers["Content-Encoding"] = "gzip"
+        self._count("bytes_sent", len(data))
+        return data, headers
+
+    def is_request_encoding_rejected(self, headers, info) -> bool:
+        """True if the request body was compressed and the server did not accept it, it is then not done again."""
+        if headers.get("Content-Encoding") and info["status"] in REJECTED_REQUEST_ENCODING_STATUS_CODES:
+            self.request_encoding_rejected = True
+            return True
+        return False
+
+    def decode_response(self, response, info):
+        """Wraps response to count and decode its body, also decodes the error body in info if needed."""
+        encoding = str(info.get("content-encoding", "")).strip().lower()
+        if info.get("body"):
+            body = info["body"]
+            self._count("bytes_received", len(body))
+            if encoding in ("gzip", "deflate"):
+                body = DecodingReader(io.BytesIO(body), encoding).read()
+                info["body"] = body
+            self._count("bytes_received_decoded", len(body))
+        if not response:
+            return response
+        counted = CountingReader(response, lambda amount: self._count("bytes_received", amount))
+        if encoding in ("gzip", "deflate"):
+            return DecodingReader(
+                counted, encoding, lambda amount: self._count("bytes_received_decoded", amount)
+            )
+        return CountingReader(counted, lambda amount: self._count("bytes_received_decoded", amount))
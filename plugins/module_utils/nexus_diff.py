@@ -0,0 +1,173 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import collections
+import fnmatch
+import json
+
+Change = collections.namedtuple("Change", ["path", "before", "after"])
+
+
+class DiffRules:
+    """Per-path comparison rules.
+
+    Paths are dot separated keys, e.g. "group.memberNames", without list indices, and may contain
+    shell-style wildcards, e.g. "*.password".
+
+    Args:
+        order_insensitive: Paths of lists compared without regard to the order of their items.
+        ignored: Paths not compared at all, e.g. read-only attributes returned by the API.
+        write_only: Paths which the API never returns, e.g. passwords. They are not compared either,
+            use compare or write_only_paths to find out if the desired data contains any.
+    """
+
+    def __init__(self, order_insensitive=(), ignored=(), write_only=()):
+        self.order_insensitive = tuple(order_insensitive)
+        self.ignored = tuple(ignored)
+        self.write_only = tuple(write_only)
+        self._matches = {}
+
+    @staticmethod
+    def _match(path, patterns) -> bool:
+        return any(path == pattern or fnmatch.fnmatchcase(path, pattern) for pattern in patterns)
+
+    def is_write_only(self, path) -> bool:
+        return self._match(path, self.write_only)
+
+    def matches(self, path):
+        """Returns (order insensitive, skipped) for a path."""
+        result = self._matches.get(path)
+        if result is None:
+            result = self._matches[path] = (
+                self._match(path, self.order_insensitive),
+                self._match(path, self.ignored) or self._match(path, self.write_only),
+            )
+        return result
+
+
+NO_RULES = DiffRules()
+
+
+def _join(path, key):
+    return f"{path}.{key}" if path else str(key)
+
+
+def _canonical(value):
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _walk_dict(before, after, rules, path, report_path, write_only):
+    keys = list(before)
+    if before.keys() != after.keys():
+        keys.extend(key for key in after if key not in before)
+    for key in keys:
+        key_path = _join(path, key)
+        dummy, skipped = rules.matches(key_path)
+        if skipped:
+            if write_only is not None and after.get(key) is not None and rules.is_write_only(key_path):
+                write_only.append(key_path)
+            continue
+        key_report_path = _join(report_path, key)
+        if key not in before:
+            yield Change(key_report_path, None, after[key])
+        elif key not in after:
+            yield Change(key_report_path, before[key], None)
+        else:
+            yield from _walk(before[key], after[key], rules, key_path, key_report_path, write_only)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _walk_list(before, after, rules, path, report_path, write_only):
+    order_insensitive, dummy = rules.matches(path)
+    if order_insensitive:
+        if len(before) != len(after) or sorted(map(_canonical, before)) != sorted(map(_canonical, after)):
+            yield Change(report_path, before, after)
+        return
+    if len(before) != len(after):
+        yield Change(report_path, before, after)
+        return
+    for index, (before_item, after_item) in enumerate(zip(before, after)):
+        yield from _walk(before_item, after_item, rules, path, f"{report_path}[{index}]", write_only)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _walk(before, after, rules, path, report_path, write_only=None):
+    """Yields the changes between before and after, stopping as soon as the caller stops iterating.
+
+    Paths of the write-only values in after which are walked past are appended to write_only, if given.
+    """
+    if isinstance(before, dict) and isinstance(after, dict):
+        yield from _walk_dict(before, after, rules, path, report_path, write_only)
+    elif isinstance(before, list) and isinstance(after, list):
+        yield from _walk_list(before, after, rules, path, report_path, write_only)
+    elif before != after:
+        yield Change(report_path, before, after)
+
+
+def diff(before, after, rules=None):
+    """Returns the list of changes (path, before, after) needed to go from before to after.
+
+    A key missing on one side is reported with None as value on that side. Lists of different length,
+    and order insensitive lists with different items, are reported as a whole.
+    """
+    return list(_walk(before, after, rules or NO_RULES, "", ""))
+
+
+def is_equal(before, after, rules=None) -> bool:
+    """True if there are no changes, stops comparing at the first difference found."""
+    return next(_walk(before, after, rules or NO_RULES, "", ""), None) is None
+
+
+def compare(before, after, rules) -> tuple:
+    """Compares like is_equal and looks for write-only values in after in the same walk.
+
+    Returns:
+        tuple: (True if there are no changes, True if after has write-only values). All write-only values
+            are only walked past when there are no changes, the walk stops at the first change.
+    """
+    write_only = []
+    equal = next(_walk(before, after, rules, "", "", write_only), None) is None
+    return equal, bool(write_only)
+
+
+def write_only_paths(data, rules) -> list:
+    """Paths of write-only values, which are not None, present in data."""
+    paths = []
+
+    def visit(value, path):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                key_path = _join(path, key)
+                if rules.is_write_only(key_path):
+                    if item is not None:
+                        paths.append(key_path)
+                else:
+                    visit(item, key_path)
+        elif isinstance(value, list):
+            for item in value:
+                visit(item, path)
+
+    visit(data, "")
+    return paths
+
+
+def changes_to_diff(changes, before_header="before", after_header="after") -> dict:
+    """Converts changes to the before/after structure of Ansible's diff result, keyed by path.
+
+    Used by NexusHelper.record_change so that the diff of an update only shows what changes.
+    """
+    return {
+        "before": {change.path: change.before for change in changes},
+        "after": {change.path: change.after for change in changes},
+        "before_header": before_header,
+        "after_header": after_header,
+    }
@@ -0,0 +1,102 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import dataclasses
+import threading
+import time
+
+_worker_state = threading.local()
+
+
+class NexusExecutorError(Exception):
+    """Raised instead of failing the module when fail_json is called by a task run by NexusExecutor."""
+
+
+def in_worker() -> bool:
+    """True if the current thread is running a task of NexusExecutor."""
+    return getattr(_worker_state, "active", False)
+
+
+# Only acquire is needed by the callers, the rate and capacity are set once.
+# pylint: disable-next=too-few-public-methods
+class TokenBucket:
+    """Thread safe token bucket limiting the number of operations per second.
+
+    Up to burst operations may run at once after being idle, after that the rate is enforced.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(rate, 1))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+@dataclasses.dataclass
+class ExecutorResult:
+    item: object
+    value: object = None
+    error: str = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# pylint: disable-next=too-few-public-methods
+class NexusExecutor:
+    """Runs independent tasks, e.g. create/update/delete requests, on a bounded thread pool.
+
+    A task failing, also by calling fail_json of the module, does not stop the other tasks. Its error is
+    captured in the result instead. Results are returned in the same order as the items.
+    """
+
+    def __init__(self, max_workers=1):
+        self.max_workers = max(max_workers, 1)
+
+    @staticmethod
+    def _run_task(func, item) -> ExecutorResult:
+        _worker_state.active = True
+        try:
+            return ExecutorResult(item, value=func(item))
+        except NexusExecutorError as e:
+            return ExecutorResult(item, error=str(e))
+        # pylint: disable-next=broad-exception-caught
+        except Exception as e:
+            return ExecutorResult(item, error=f"{type(e).__name__}: {e}")
+        finally:
+            _worker_state.active = False
+
+    def run(self, func, items) -> list:
+        """Calls func for each item and returns a list of ExecutorResult in the order of items."""
+        items = list(items)
+        if self.max_workers == 1 or len(items) <= 1:
+            return [self._run_task(func, item) for item in items]
+        # Imported here since NexusHelper imports this file for every module.
+        # pylint: disable-next=import-outside-toplevel
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            return list(pool.map(lambda item: self._run_task(func, item), items))
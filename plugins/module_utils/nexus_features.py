@@ -0,0 +1,184 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import os
+import re
+import time
+
+DEFAULT_CACHE_DIR = "~/.cache/haxorof.sonatype_nexus/features"
+DEFAULT_TTL = 3600
+
+# Editions without the features of Nexus Repository Pro.
+NON_PRO_EDITIONS = ("COMMUNITY", "OSS")
+
+
+@dataclasses.dataclass(frozen=True)
+class Feature:
+    """A feature of Nexus which not all versions or editions have.
+
+    Attributes:
+        since: First version having the feature, None if all versions have it.
+        pro: Only the Pro edition has the feature.
+        module: Module not working without the feature.
+        note: Compatibility note shown by nexus_compat_check when a version does not have the feature.
+    """
+
+    since: str = None
+    pro: bool = False
+    module: str = None
+    note: str = None
+
+
+# Information may come from https://help.sonatype.com/en/release-notes.html
+FEATURES = {
+    # NEXUS-43742 – Cleanup policies in Sonatype Nexus Repository can now be created via the REST API
+    #               for all formats using "*" as the format value, ensuring support for automated,
+    #               multi-format policy management.
+    "cleanup_policies_any_format": Feature(
+        since="3.87.0",
+        note="[3.87.0] nexus_cleanup_policies will not handle '*' format correctly (NEXUS-43742).",
+    ),
+    # New Capabilities API to view, create, update, and delete capabilities.
+    "capabilities_api": Feature(
+        since="3.82.0",
+        module="nexus_capabilities",
+        note="[3.82.0] nexus_capabilities will not work due to missing Capabilities API.",
+    ),
+    # New Cleanup Policies API.
+    # https://help.sonatype.com/en/sonatype-nexus-repository-3-70-0-release-notes.html
+    "cleanup_policies_api": Feature(
+        since="3.70.0",
+        module="nexus_cleanup_policies",
+        note="[3.70.0] nexus_cleanup_policies will not work due to missing Cleanup Policies API.",
+    ),
+    "proxy_preserve_encoded_characters": Feature(since="3.90.0"),
+    # GET /v1/repositories/{format}/{type}/{name}, older versions only list all repositories.
+    "repository_direct_lookup": Feature(since="3.30.0"),
+    "cleanup_policies_pro": Feature(pro=True, module="nexus_cleanup_policies"),
+    "http_settings_pro": Feature(pro=True, module="nexus_http"),
+    "user_tokens": Feature(pro=True, module="nexus_security_user_token"),
+}
+
+
+def parse_version(version) -> tuple:
+    """Comparable version, e.g. "3.90.0-01" -> (3, 90, 0)."""
+    return tuple(int(part) for part in re.findall(r"\d+", str(version).split("-", maxsplit=1)[0]))
+
+
+def is_supported(feature, version, edition) -> bool:
+    """True if a Nexus version and edition has a feature, see FEATURES."""
+    if isinstance(feature, str):
+        feature = FEATURES[feature]
+    if feature.since and parse_version(version) < parse_version(feature.since):
+        return False
+    return not (feature.pro and edition in NON_PRO_EDITIONS)
+
+
+def compatibility_notes(version, edition) -> list:
+    """Notes about the modules which do not (fully) work with a Nexus version and edition."""
+    notes = [
+        feature.note
+        for feature in FEATURES.values()
+        if feature.note and not is_supported(feature, version, edition)
+    ]
+    pro_modules = [
+        feature.module
+        for feature in FEATURES.values()
+        if feature.pro and not is_supported(feature, version, edition)
+    ]
+    if pro_modules:
+        notes.append(
+            "Some modules will not work that requires PRO edition of Nexus: "
+            + ", ".join(sorted(set(pro_modules)))
+            + "."
+        )
+    return notes
+
+
+class NexusFeatures:
+    """Features of a Nexus server, asked for by the modules instead of guessing from response shapes.
+
+    The version and edition are detected once and cached per Nexus URL on the host running the module for ttl
+    seconds. A cached version outlives an upgrade of Nexus until it expires. If the cache cannot be read or
+    written it is only kept in memory.
+
+    Args:
+        detect: Function returning the NexusVersion of the server, None if it cannot be detected, e.g.
+            because the user lacks the permission.
+    """
+
+    def __init__(self, nexus_url, detect, cache_dir=None, ttl=DEFAULT_TTL):
+        self.nexus_url = nexus_url.rstrip("/")
+        self.detect = detect
+        self.ttl = ttl
+        self.path = None
+        self._document = None
+        if ttl > 0:
+            cache_dir = os.path.expanduser(cache_dir or DEFAULT_CACHE_DIR)
+            with contextlib.suppress(OSError):
+                os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+                name = hashlib.sha256(self.nexus_url.encode("utf-8")).hexdigest()
+                self.path = os.path.join(cache_dir, name + ".json")
+
+    def _load(self):
+        if self._document is None:
+            self._document = self._read() or {"detected_at": time.time()}
+        return self._document
+
+    def _read(self):
+        if self.path is None:
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                document = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(document, dict):
+            return None
+        detected_at = document.get("detected_at")
+        if not isinstance(detected_at, (int, float)) or time.time() - detected_at > self.ttl:
+            return None
+        return document
+
+    def _write(self):
+        if self.path is None:
+            return
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._document, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+    def version(self):
+        """(version, edition) of the server, None if it cannot be detected."""
+        document = self._load()
+        if "version" not in document:
+            detected = self.detect()
+            if detected is None:
+                return None
+            document.update(version=detected.version, edition=detected.edition)
+            self._write()
+        return document["version"], document["edition"]
+
+    def supports(self, name):
+        """True if the server has the feature, None if its version cannot be detected."""
+        version = self.version()
+        if version is None:
+            return None
+        return is_supported(FEATURES[name], *version)
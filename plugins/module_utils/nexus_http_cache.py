@@ -0,0 +1,239 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import contextlib
+import fcntl
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+DEFAULT_CACHE_DIR = "~/.cache/haxorof.sonatype_nexus/http"
+DEFAULT_TTL = 86400
+DEFAULT_MAX_SIZE = 50 * 1024 * 1024
+
+# Endpoints sharing the same resources, e.g. writes to repositories change repositorySettings.
+RESOURCE_FAMILY_ALIASES = {
+    "repository-settings": "repositories",
+    "cleanup-policies-internal": "cleanup-policies",
+}
+
+
+def credential_identity(username, password):
+    """Identity of the credentials used, the credentials themselves are never stored."""
+    return hashlib.sha256(f"{username}\0{password}".encode("utf-8")).hexdigest()
+
+
+def endpoint_name(api_url, endpoints, base_path):
+    """Returns (name of the endpoint in NexusHelper.NEXUS_API_ENDPOINTS that api_url belongs to, rest of the path)."""
+    path = urlsplit(api_url).path
+    index = path.find(base_path)
+    if index < 0:
+        return None, path
+    path = path[index + len(base_path):]
+    name, name_path = None, ""
+    for endpoint, template in endpoints.items():
+        endpoint_path = template.replace("{url}", "").replace(base_path, "", 1)
+        if (path == endpoint_path or path.startswith(endpoint_path + "/")) and len(endpoint_path) > len(
+            name_path
+        ):
+            name, name_path = endpoint, endpoint_path
+    return name, path[len(name_path):]
+
+
+def resource_family(api_url, endpoints, base_path):
+    """Returns the name of the endpoint whose resources api_url reads or writes."""
+    name = endpoint_name(api_url, endpoints, base_path)[0]
+    return RESOURCE_FAMILY_ALIASES.get(name, name)
+
+
+class CachingReader:
+    """Wraps a response and calls on_complete with the whole body once it has been read to the end."""
+
+    def __init__(self, fp, on_complete):
+        self._fp = fp
+        self._on_complete = on_complete
+        self._chunks = []
+
+    def read(self, amt=None):
+        data = self._fp.read() if amt is None or amt < 0 else self._fp.read(amt)
+        if data:
+            self._chunks.append(data)
+        if not data or amt is None or amt < 0:
+            self._complete()
+        return data
+
+    def _complete(self):
+        if self._on_complete:
+            self._on_complete(b"".join(self._chunks))
+            self._on_complete = None
+            self._chunks = []
+
+    def close(self):
+        self._fp.close()
+
+
+# pylint: disable-next=too-many-instance-attributes
+class NexusHttpCache:
+    """On-disk cache of GET responses revalidated with ETag/Last-Modified.
+
+    Entries are keyed by URL and credential identity. A cached body is only served when Nexus answers
+    304 Not Modified to a conditional request. Entries expire after the TTL of their resource family,
+    the least recently used entries are evicted when the total size exceeds max_size, and any write to a
+    resource family removes the cached entries of that family.
+    """
+
+    INDEX_FILE = "index.json"
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(self, cache_dir, identity, family_of, ttl=None, max_size=DEFAULT_MAX_SIZE):
+        self.cache_dir = os.path.expanduser(cache_dir or DEFAULT_CACHE_DIR)
+        self.identity = identity
+        self.family_of = family_of
+        self.ttl = ttl or {}
+        self.max_size = max_size
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stored": 0,
+            "invalidated": 0,
+            "evicted": 0,
+        }
+        self._stats_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def key(self, api_url):
+        return hashlib.sha256(f"{self.identity}\0{api_url}".encode("utf-8")).hexdigest()
+
+    def ttl_for(self, family):
+        return self.ttl.get(family, self.ttl.get("default", DEFAULT_TTL))
+
+    @contextlib.contextmanager
+    def _index(self):
+        """Locked read-modify-write access to the index, shared between processes."""
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        with self._index_lock:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "r+", encoding="utf-8") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    raw = f.read()
+                    try:
+                        index = json.loads(raw) if raw else {}
+                    except ValueError:
+                        index = {}
+                    original = json.dumps(index, sort_keys=True)
+                    yield index
+                    if json.dumps(index, sort_keys=True) != original:
+                        f.seek(0)
+                        f.truncate()
+                        json.dump(index, f)
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _body_path(self, key):
+        return os.path.join(self.cache_dir, key + ".body")
+
+    def _remove(self, index, key):
+        index.pop(key, None)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._body_path(key))
+
+    def conditional_headers(self, api_url):
+        """Returns the validator headers to send for api_url, empty if nothing usable is cached."""
+        key = self.key(api_url)
+        with self._index() as index:
+            entry = index.get(key)
+            if entry is None:
+                return {}
+            if time.time() - entry["stored_at"] > self.ttl_for(entry["family"]) or not os.path.exists(
+                self._body_path(key)
+            ):
+                self._remove(index, key)
+                return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def handle_response(self, api_url, response, info):
+        """Serves the cached body on 304 and stores cacheable 200 responses, returns (response, info)."""
+        key = self.key(api_url)
+        if info["status"] == 304:
+            try:
+                with open(self._body_path(key), "rb") as f:
+                    body = f.read()
+            except FileNotFoundError:
+                return response, info
+            with self._index() as index:
+                if key in index:
+                    index[key]["last_used"] = time.time()
+            self._count("hits")
+            if response:
+                response.close()
+            info.update({"status": 200, "msg": f"OK ({len(body)} bytes)", "cache": "revalidated"})
+            return io.BytesIO(body), info
+
+        self._count("misses")
+        if info["status"] != 200 or not response or not (info.get("etag") or info.get("last-modified")):
+            return response, info
+
+        entry = {
+            "url": api_url,
+            "family": self.family_of(api_url),
+            "etag": info.get("etag"),
+            "last_modified": info.get("last-modified"),
+        }
+        return CachingReader(response, lambda body: self.store(key, entry, body)), info
+
+    def store(self, key, entry, body):
+        if len(body) > self.max_size:
+            return
+        path = self._body_path(key)
+        # Other processes and threads may store the same response at the same time.
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+        now = time.time()
+        entry.update({"size": len(body), "stored_at": now, "last_used": now})
+        with self._index() as index:
+            index[key] = entry
+            total = sum(item["size"] for item in index.values())
+            for lru_key in sorted(index, key=lambda k: index[k]["last_used"]):
+                if total <= self.max_size:
+                    break
+                total -= index[lru_key]["size"]
+                self._remove(index, lru_key)
+                self._count("evicted")
+        self._count("stored")
+
+    def invalidate(self, api_url):
+        """Removes all cached entries of the resource family api_url belongs to, for any credentials."""
+        family = self.family_of(api_url)
+        parts = urlsplit(api_url)
+        base = f"{parts.scheme}://{parts.netloc}"
+        with self._index() as index:
+            for key in [k for k, v in index.items() if v["family"] == family and v["url"].startswith(base)]:
+                self._remove(index, key)
+                self._count("invalidated")
@@ -0,0 +1,62 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import base64
+import io
+
+from urllib.parse import urlsplit
+
+from ansible.module_utils._text import to_bytes, to_native, to_text
+from ansible.module_utils.connection import Connection, ConnectionError as AnsibleConnectionError
+
+
+def encode_body(data):
+    """Bodies are sent base64 encoded through the persistent connection, which only transfers JSON."""
+    if data is None:
+        return None
+    return to_text(base64.b64encode(to_bytes(data)))
+
+
+def decode_body(data):
+    if data is None:
+        return b""
+    return base64.b64decode(data)
+
+
+# Same interface as the other transports of NexusHelper.transport_request, which have a single method.
+# pylint: disable-next=too-few-public-methods
+class NexusHttpApiTransport:
+    """Sends requests through the persistent connection of the haxorof.sonatype_nexus.nexus httpapi plugin.
+
+    The connection keeps one authenticated session and its HTTP connections open across tasks, the
+    scheme, host and port of the URLs are given by the connection, only their path is used.
+    """
+
+    def __init__(self, socket_path):
+        self.connection = Connection(socket_path)
+
+    def request(self, url, method, data=None, headers=None):
+        """Sends a request, returns (response, info) like fetch_url."""
+        parts = urlsplit(url)
+        path = parts.path + ("?" + parts.query if parts.query else "")
+        try:
+            reply = self.connection.send_request(
+                encode_body(data), path=path, method=method, headers=dict(headers or {})
+            )
+        except AnsibleConnectionError as e:
+            return None, {"url": url, "status": -1, "msg": f"Connection failure: {to_native(e)}"}
+        info = dict(reply["headers"])
+        info.update({"url": url, "status": reply["status"], "msg": reply["msg"]})
+        body = decode_body(reply["body"])
+        if reply["status"] >= 400 or reply["status"] == -1:
+            info["body"] = body
+            return None, info
+        return io.BytesIO(body), info
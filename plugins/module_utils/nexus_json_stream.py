@@ -0,0 +1,125 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import codecs
+import json
+import re
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r\ufeff"
+_DECODER = json.JSONDecoder()
+# Characters which may follow a complete value, a number or literal before them cannot continue.
+_DELIMITER = re.compile(r"[ \t\n\r,\]}]")
+
+
+class JsonStreamReader:
+    """Reads text from a binary file-like object chunk by chunk and decodes JSON values from it."""
+
+    def __init__(self, fp, chunk_size=CHUNK_SIZE):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Appends the next chunk to the buffer, returns False when the end of the stream is reached."""
+        if self.eof:
+            return False
+        chunk = self._fp.read(self._chunk_size)
+        if chunk:
+            text = self._decoder.decode(chunk)
+        else:
+            self.eof = True
+            text = self._decoder.decode(b"", final=True)
+        self.buffer = self.buffer[self.pos:] + text
+        self.pos = 0
+        return bool(chunk)
+
+    def peek(self):
+        """Skips whitespace and returns next character, None at the end of the stream."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return None
+
+    def decode_value(self):
+        """Decodes the JSON value starting at current position, reading more data as required."""
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A value not followed by a delimiter yet may be a number continuing in the next chunk,
+            # e.g. 2 of 2.5e3 when the buffer ends with "2." or "2.5e".
+            if _DELIMITER.search(self.buffer, end) is None and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def read_remaining(self) -> str:
+        while self.fill():
+            pass
+        return self.buffer[self.pos:]
+
+
+def load_json(fp, item_filter=None, chunk_size=CHUNK_SIZE):
+    """Decodes a JSON document from a binary file-like object, e.g. an HTTP response.
+
+    If the document is an array, the items are decoded one at a time while data is read so that only
+    the items accepted by item_filter are kept in memory. Any other document is decoded as a whole.
+
+    Args:
+        fp: Object with a read(size) method returning bytes.
+        item_filter (callable): Optional function taking an array item, returning True to keep it.
+        chunk_size (int): Number of bytes to read at a time.
+
+    Returns:
+        The decoded document or None if there was no document.
+
+    Raises:
+        ValueError: If the data is not valid JSON.
+    """
+    reader = JsonStreamReader(fp, chunk_size)
+    first = reader.peek()
+    if first is None:
+        return None
+    if first != "[":
+        return json.loads(reader.read_remaining())
+
+    reader.pos += 1
+    items = []
+    if reader.peek() == "]":
+        reader.pos += 1
+    else:
+        while True:
+            reader.peek()
+            item = reader.decode_value()
+            if item_filter is None or item_filter(item):
+                items.append(item)
+            separator = reader.peek()
+            if separator == "]":
+                reader.pos += 1
+                break
+            if separator != ",":
+                raise ValueError(f"Expecting ',' delimiter or ']' in JSON array, got {separator!r}")
+            reader.pos += 1
+
+    if reader.read_remaining().strip(_WHITESPACE):
+        raise ValueError("Extra data after JSON array")
+    return items
@@ -0,0 +1,120 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import math
+import threading
+import time
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of values, None if there are no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+class NexusMetrics:
+    """Records timing, size and retries of each call to Nexus made through NexusHelper.
+
+    A call starts when the request is sent and ends when the response body has been read. Calls made
+    from different threads are recorded independently.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.calls = []
+        self._lock = threading.Lock()
+        self._current = threading.local()
+
+    def start(self, method, endpoint, path):
+        """Starts recording a call, endpoint is the name in NEXUS_API_ENDPOINTS and path the rest of the URL."""
+        self._current.call = {
+            "method": method.upper(),
+            "endpoint": endpoint,
+            "path": path,
+            "status": None,
+            "connect_seconds": None,
+            "first_byte_seconds": None,
+            "total_seconds": None,
+            "bytes_sent": 0,
+            "bytes_received": 0,
+            "retries": 0,
+            "_started": time.monotonic(),
+        }
+
+    def _call(self):
+        return getattr(self._current, "call", None)
+
+    def sent(self, amount):
+        call = self._call()
+        if call is not None:
+            call["bytes_sent"] += amount
+
+    def first_byte(self, info):
+        """Marks that response headers have been received, info is the response info of the last attempt."""
+        call = self._call()
+        if call is not None:
+            call["first_byte_seconds"] = round(time.monotonic() - call["_started"], 6)
+            if info.get("connect_seconds") is not None:
+                call["connect_seconds"] = round(info["connect_seconds"], 6)
+
+    def finish(self, status, retries, bytes_received):
+        call = self._call()
+        if call is None:
+            return
+        self._current.call = None
+        call.update(
+            {
+                "status": status,
+                "retries": retries - 1,
+                "bytes_received": bytes_received,
+                "total_seconds": round(time.monotonic() - call.pop("_started"), 6),
+            }
+        )
+        with self._lock:
+            self.calls.append(call)
+
+    def summary(self) -> dict:
+        """Aggregated metrics for the module result.
+
+        http_seconds is the sum of the total time of all calls, local_seconds the rest of the time since
+        the helper was created. Calls made concurrently can make http_seconds exceed wall_seconds.
+        """
+        with self._lock:
+            calls = list(self.calls)
+        wall_seconds = time.monotonic() - self.started
+        totals = [call["total_seconds"] for call in calls]
+        http_seconds = sum(totals)
+        endpoints = {}
+        for call in calls:
+            endpoints.setdefault(f"{call['method']} {call['endpoint']}", []).append(call["total_seconds"])
+        return {
+            "calls": len(calls),
+            "retries": sum(call["retries"] for call in calls),
+            "bytes_sent": sum(call["bytes_sent"] for call in calls),
+            "bytes_received": sum(call["bytes_received"] for call in calls),
+            "wall_seconds": round(wall_seconds, 6),
+            "http_seconds": round(http_seconds, 6),
+            "local_seconds": round(max(wall_seconds - http_seconds, 0.0), 6),
+            "p50_seconds": percentile(totals, 50),
+            "p95_seconds": percentile(totals, 95),
+            "endpoints": {
+                name: {
+                    "calls": len(values),
+                    "total_seconds": round(sum(values), 6),
+                    "p50_seconds": percentile(values, 50),
+                    "p95_seconds": percentile(values, 95),
+                }
+                for name, values in sorted(endpoints.items())
+            },
+            "requests": calls,
+        }
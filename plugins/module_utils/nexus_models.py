@@ -0,0 +1,279 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+"""Typed models of Nexus API objects, a lighter alternative to nested dicts for large listings.
+
+Models are dataclasses with __slots__ (Python 3.10 and later). Attributes are the snake_case names of the
+API keys, keys a model does not know are kept in extra so that to_api() gives back what from_api() was given.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import dataclasses
+import functools
+import sys
+import typing
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_normalize
+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def api_field(key=None, model=None):
+    """Field of a model, key is the API key if it is not the camelCase attribute name.
+
+    Args:
+        model: Model of the value, or of the items if the value is a list.
+    """
+    # pylint: disable-next=invalid-field-call
+    return dataclasses.field(default=None, metadata={"api_key": key, "model": model})
+
+
+class NexusModel:
+    """Base of the models, see from_api and to_api."""
+
+    __slots__ = ()
+
+    @classmethod
+    def codec(cls):
+        """(attribute, API key, model) per field, extra excluded, compiled once per model."""
+        codec = _codecs.get(cls)
+        if codec is None:
+            codec = _codecs[cls] = tuple(
+                (
+                    field.name,
+                    field.metadata.get("api_key") or nexus_normalize.camelize_key(field.name),
+                    field.metadata.get("model"),
+                )
+                for field in dataclasses.fields(cls)
+                if field.name != "extra"
+            )
+        return codec
+
+    @classmethod
+    def from_api(cls, data):
+        """Model of an API object, None stays None."""
+        if data is None:
+            return None
+        values = []
+        for dummy, key, model in cls.codec():
+            value = data.get(key)
+            if model is not None and value is not None:
+                value = [model.from_api(item) for item in value] if isinstance(value, list) else model.from_api(value)
+            values.append(value)
+        known = _known_keys(cls)
+        if not data.keys() <= known:
+            values.append({key: value for key, value in data.items() if key not in known})
+        return cls(*values)
+
+    @classmethod
+    def from_api_list(cls, items) -> list:
+        return [cls.from_api(item) for item in items]
+
+    def to_api(self) -> dict:
+        """API object of the model, attributes which are None, e.g. null in the API object, are left out."""
+        data = {}
+        for attribute, key, model in self.codec():
+            value = getattr(self, attribute)
+            if value is None:
+                continue
+            if model is not None:
+                value = [item.to_api() for item in value] if isinstance(value, list) else value.to_api()
+            data[key] = value
+        # pylint: disable-next=no-member
+        extra = self.extra
+        if extra:
+            data.update(extra)
+        return data
+
+    def get(self, key, default=None):
+        """Value of an API key, like dict.get, for code written for the API objects as dicts."""
+        attribute = _attributes(type(self)).get(key)
+        if attribute is None:
+            # pylint: disable-next=no-member
+            return (self.extra or {}).get(key, default)
+        value = getattr(self, attribute)
+        return default if value is None else value
+
+
+_codecs = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _known_keys(model) -> frozenset:
+    return frozenset(key for dummy, key, dummy in model.codec())
+
+
+@functools.lru_cache(maxsize=None)
+def _attributes(model) -> dict:
+    return {key: attribute for attribute, key, dummy in model.codec()}
+
+
+@dataclasses.dataclass(**_DATACLASS_OPTIONS)
+class SoftQuota(NexusModel):
+    type: str = None
+    limit: int = None
+    extra: dict = None
+
+
+# The models have one attribute per key of the API object, too-many-instance-attributes is disabled for
+# those having more keys than pylint allows attributes.
+@dataclasses.dataclass(**_DATACLASS_OPTIONS)
+# pylint: disable-next=too-many-instance-attributes
+class BlobStore(NexusModel):
+    """Blob store as listed by /v1/blobstores, or a file blob store from /v1/blobstores/file/{name}."""
+
+    name: str = None
+    type: str = None
+    path: str = None
+    soft_quota: SoftQuota = api_field(model=SoftQuota)
+    unavailable: bool = None
+    blob_count: int = None
+    total_size_in_bytes: int = None
+    available_space_in_bytes: int = None
+    extra: dict = None
+
+
+@dataclasses.dataclass(**_DATACLASS_OPTIONS)
+# pylint: disable-next=too-many-instance-attributes
+class Role(NexusModel):
+    id: str = None
+    source: str = None
+    name: str = None
+    description: str = None
+    read_only: bool = None
+    privileges: typing.List[str] = None
+    roles: typing.List[str] = None
+    extra: dict = None
+
+
+@dataclasses.dataclass(**_DATACLASS_OPTIONS)
+# pylint: disable-next=too-many-instance-attributes
+class User(NexusModel):
+    user_id: str = None
+    first_name: str = None
+    last_name: str = None
+    email_address: str = None
+    source: str = None
+    status: str = None
+    read_only: bool = None
+    roles: typing.List[str] = None
+    external_roles: typing.List[str] = None
+    extra: dict = None
+
+
+@dataclasses.dataclass(**_DATACLASS_OPTIONS)
+# pylint: disable-next=too-many-instance-attributes
+class Task(NexusModel):
+    id: str = None
+    name: str = None
+    type: str = None
+    message: str = None
+    current_state: str = None
+    last_run_result: str = None
+    next_run: str = None
+    last_run: str = None
+    extra: dict = None
+
+
+@dataclasses.dataclass(**_DATACLASS_OPTIONS)
+class Capability(NexusModel):
+    id: str = None
+    type: str = None
+    notes: str = None
+    enabled: bool = None
+    properties: dict = None
+    extra: dict = None
+
+
+@dataclasses.dataclass(**_DATACLASS_OPTIONS)
+class Repository(NexusModel):
+    """Attributes common to all repositories, for formats without a model of their own."""
+
+    name: str = None
+    format: str = None
+    type: str = None
+    url: str = None
+    online: bool = None
+    extra: dict = None
+
+
+def _model_fields(argument_spec, class_name):
+    fields = []
+    for name, (key, table) in nexus_normalize.compile_key_table(argument_spec).items():
+        model = None
+        if table is not None:
+            model = _make_model(class_name + key[:1].upper() + key[1:], argument_spec[name]["options"])
+        fields.append((name, typing.Any, api_field(model=model)))
+    return fields
+
+
+def _extra_field():
+    """Last field of the models, the keys of the API object which the model does not know."""
+    # pylint: disable-next=invalid-field-call
+    return ("extra", dict, dataclasses.field(default=None))
+
+
+def _make_model(class_name, argument_spec):
+    return dataclasses.make_dataclass(
+        class_name,
+        _model_fields(argument_spec, class_name) + [_extra_field()],
+        bases=(NexusModel,),
+        **_DATACLASS_OPTIONS,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def repository_model(repository_format, repository_type):
+    """Model of a repository of a format and type, generated from the options of its module.
+
+    The attributes are those of Repository followed by the options of the module, e.g. storage and maven.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_repository_formats
+
+    argument_spec = {
+        name: option
+        for name, option in nexus_repository_formats.cached_repository_argument_spec(
+            repository_format, repository_type
+        ).items()
+        if name not in ("name", "state")
+    }
+    class_name = f"{repository_format.capitalize()}{repository_type.capitalize()}Repository"
+    common = [
+        (field.name, field.type, api_field()) for field in dataclasses.fields(Repository) if field.name != "extra"
+    ]
+    return dataclasses.make_dataclass(
+        class_name,
+        common + _model_fields(argument_spec, class_name) + [_extra_field()],
+        bases=(NexusModel,),
+        **_DATACLASS_OPTIONS,
+    )
+
+
+def parse_repository(data):
+    """Model of a repository as returned by the API, the model of its format and type if there is one."""
+    # pylint: disable-next=import-outside-toplevel
+    from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_repository_formats
+
+    repository_format = _module_formats().get(data.get("format"), data.get("format"))
+    if nexus_repository_formats.is_supported(repository_format, data.get("type")):
+        return repository_model(repository_format, data["type"]).from_api(data)
+    return Repository.from_api(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _module_formats() -> dict:
+    """Format names of the modules per format name returned by the API, e.g. maven2 -> maven."""
+    # pylint: disable-next=import-outside-toplevel
+    from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_repository_commons import (
+        REPOSITORY_FORMAT_ALIASES,
+    )
+
+    return {api_format: module_format for module_format, api_format in REPOSITORY_FORMAT_ALIASES.items()}
@@ -0,0 +1,144 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import copy
+import re
+
+from collections.abc import Mapping
+
+EMPTY_VALUES = ("", [], {}, None)
+
+# Values which are never copied, deepcopy would return them as is anyway.
+_ATOMIC_TYPES = (str, int, float, bool, type(None), bytes)
+
+# Same as humps.UNDERSCORE_RE, pyhumps is not needed on managed hosts.
+_UNDERSCORE_RE = re.compile(r"(?<=[^\-_])[\-_]+[^\-_]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_camelized_keys = {}
+
+
+def _camelize(key):
+    # Same steps as humps.camelize for a single key.
+    text = "" if key is None else _WHITESPACE_RE.sub("", str(key))
+    if text.isupper() or text.isnumeric():
+        return key
+    if text and not text[:2].isupper():
+        text = text[0].lower() + text[1:]
+    return _UNDERSCORE_RE.sub(lambda match: match.group(0)[-1].upper(), text)
+
+
+def camelize_key(key):
+    """Same as humps.camelize(key), computed once per key."""
+    camelized = _camelized_keys.get(key)
+    if camelized is None:
+        camelized = _camelized_keys[key] = _camelize(key)
+    return camelized
+
+
+def compile_key_table(argument_spec) -> dict:
+    """Compiles an argument spec into a table of option name -> (camelCase name, table of its suboptions).
+
+    Options without suboptions, e.g. free-form dicts, have None as table.
+    """
+    return {
+        name: (
+            camelize_key(name),
+            compile_key_table(spec["options"]) if spec.get("options") else None,
+        )
+        for name, spec in argument_spec.items()
+    }
+
+
+def translate_keys(value, key_table):
+    """Translates the keys of dicts, also within lists, to camelCase in one pass using a compiled key table.
+
+    Keys which the table does not know about are kept as they are. Without a table, e.g. for free-form
+    dicts, all keys are camelized as by humps.camelize.
+    """
+    if key_table is None:
+        return normalize(value, camelize_keys=True, copy_leaves=False)[0]
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            entry = key_table.get(key)
+            if entry is None:
+                result[key] = item
+            else:
+                result[entry[0]] = translate_keys(item, entry[1])
+        return result
+    if isinstance(value, list):
+        return [translate_keys(item, key_table) for item in value]
+    return value
+
+
+def is_password_key(key) -> bool:
+    # Keys being (case insensitive) part of the word password, as NexusHelper.delete_all_password_keys.
+    return isinstance(key, str) and key.lower() in "password"
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def normalize(
+    data,
+    prune_empty=False,
+    drop_none=False,
+    drop_password_keys=False,
+    camelize_keys=False,
+    copy_leaves=True,
+):
+    """Normalizes a request payload or API response in one traversal, always returning new dicts and lists.
+
+    The steps give exactly the same result as the functions they replace:
+
+    - camelize_keys: humps.camelize, keys of all dicts, also within lists, are camelized.
+    - drop_password_keys: NexusHelper.delete_all_password_keys, keys being part of the word password
+      are removed from dicts, but not from dicts within lists.
+    - drop_none: NexusHelper.delete_all_none_values, None values are removed from dicts and lists.
+    - prune_empty: NexusHelper.clean_dict_list, values of dicts which are empty ("", [], {}, None) after
+      being normalized are removed, while items of lists are removed if empty before being normalized.
+
+    Args:
+        copy_leaves (bool): Deep copy values which are neither dicts, lists nor atomic, e.g. tuples.
+
+    Returns:
+        tuple: (normalized data, True if any password key was removed)
+    """
+    password_removed = [False]
+
+    def visit(value, in_list):
+        if isinstance(value, dict):
+            result = {}
+            for key, item in value.items():
+                if camelize_keys:
+                    key = camelize_key(key)
+                if drop_password_keys and not in_list and is_password_key(key):
+                    password_removed[0] = True
+                    continue
+                if drop_none and item is None:
+                    continue
+                item = visit(item, in_list)
+                if prune_empty and item in EMPTY_VALUES:
+                    continue
+                result[key] = item
+            return result
+        if isinstance(value, list):
+            return [
+                visit(item, True)
+                for item in value
+                if not (drop_none and item is None) and not (prune_empty and item in EMPTY_VALUES)
+            ]
+        if camelize_keys and isinstance(value, Mapping):
+            return {camelize_key(key): visit(item, in_list) for key, item in value.items()}
+        if copy_leaves and not isinstance(value, _ATOMIC_TYPES):
+            return copy.deepcopy(value)
+        return value
+
+    return visit(data, False), password_removed[0]
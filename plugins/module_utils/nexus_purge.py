@@ -0,0 +1,190 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import dataclasses
+import fnmatch
+import typing
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_models
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_scheduler import (
+    dependency_waves,
+    referenced_names,
+    reversed_dependencies,
+)
+
+DEFAULT_MAX_DELETIONS = 10
+
+
+# Read-only description of a kind, each attribute is an independent option.
+@dataclasses.dataclass(frozen=True)
+# pylint: disable-next=too-many-instance-attributes
+class PurgeKind:
+    """Objects of a kind which can be purged.
+
+    Attributes:
+        endpoint: Key of NexusHelper.NEXUS_API_ENDPOINTS, DELETE <endpoint>/<name> deletes an object.
+        parse_item: Model of the listed objects, see nexus_models.
+        list_endpoint: Key of the endpoint listing the objects, if other than endpoint.
+        name_key: Key of the name in the listed objects.
+        references: Path of the names of objects of the same kind a listed object refers to, the object is
+            deleted before those, e.g. group repositories before their members.
+        protected: Names which are never deleted, e.g. the built-in admin user.
+        default_source_only: Only objects of the default source are listed, e.g. not LDAP users.
+        internal_endpoint: Key of the endpoint of the internal API used instead with use_internal_api.
+        feature: Feature of nexus_features.FEATURES which endpoint requires, e.g. the Pro edition.
+    """
+
+    endpoint: str
+    parse_item: typing.Callable = None
+    list_endpoint: str = None
+    name_key: str = "name"
+    references: tuple = ()
+    protected: tuple = ()
+    default_source_only: bool = False
+    internal_endpoint: str = None
+    feature: str = None
+
+
+KINDS = {
+    # The repository settings contain the members of groups.
+    "repositories": PurgeKind(
+        "repositories",
+        nexus_models.parse_repository,
+        list_endpoint="repository-settings",
+        references=("group", "memberNames"),
+    ),
+    "roles": PurgeKind(
+        "roles",
+        nexus_models.Role.from_api,
+        name_key="id",
+        references=("roles",),
+        protected=("nx-admin", "nx-anonymous"),
+        default_source_only=True,
+    ),
+    "users": PurgeKind(
+        "users",
+        nexus_models.User.from_api,
+        name_key="userId",
+        protected=("admin", "anonymous"),
+        default_source_only=True,
+    ),
+    "routing_rules": PurgeKind("routing-rules"),
+    # The public API of cleanup policies is only in the Pro edition.
+    "cleanup_policies": PurgeKind(
+        "cleanup-policies",
+        internal_endpoint="cleanup-policies-internal",
+        feature="cleanup_policies_pro",
+    ),
+    "scripts": PurgeKind("script"),
+}
+
+
+def purge_argument_spec(prefix="") -> dict:
+    """Options limiting what a purge deletes, shared by the modules which can purge."""
+    return {
+        prefix + "protect": {"type": "list", "elements": "str", "default": [], "no_log": False},
+        prefix + "max_deletions": {"type": "int", "default": DEFAULT_MAX_DELETIONS},
+    }
+
+
+def is_protected(name, protect) -> bool:
+    """True if a name matches one of the names or shell-style patterns, e.g. "maven-*"."""
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in protect)
+
+
+def purge_candidates(live_names, desired_names, protect) -> tuple:
+    """Names of the live objects which are not desired.
+
+    Returns:
+        tuple: (names to delete, names which are not desired but protected), in the order of live_names
+    """
+    desired_names = set(desired_names)
+    extras = [name for name in live_names if name not in desired_names]
+    return (
+        [name for name in extras if not is_protected(name, protect)],
+        [name for name in extras if is_protected(name, protect)],
+    )
+
+
+def deletion_limit_message(names, max_deletions):
+    """Message about the safety limit being exceeded, None if names may be deleted."""
+    if max_deletions < 0 or len(names) <= max_deletions:
+        return None
+    return (
+        f"Purge would delete {len(names)} objects which is more than max_deletions={max_deletions}, "
+        + f"nothing was deleted: {', '.join(names)}"
+    )
+
+
+def endpoint(helper, kind, listing=False) -> str:
+    """URL template of the endpoint deleting, or with listing listing, objects of a kind."""
+    purge_kind = KINDS[kind]
+    if purge_kind.internal_endpoint and helper.module.params.get("use_internal_api"):
+        return helper.NEXUS_API_ENDPOINTS[purge_kind.internal_endpoint]
+    return helper.NEXUS_API_ENDPOINTS[(listing and purge_kind.list_endpoint) or purge_kind.endpoint]
+
+
+def unsupported_message(helper, kind):
+    """Message about the server not having the API to purge a kind, None if it has it or is not known."""
+    purge_kind = KINDS[kind]
+    if not purge_kind.feature or (purge_kind.internal_endpoint and helper.module.params.get("use_internal_api")):
+        return None
+    if helper.features.supports(purge_kind.feature) is not False:
+        return None
+    message = f"Purging {kind.replace('_', ' ')} is not supported by this version or edition of Nexus"
+    if purge_kind.internal_endpoint:
+        message += ", set use_internal_api to use the internal API instead"
+    return message + "."
+
+
+def list_objects(helper, kind) -> dict:
+    """Live objects of a kind per name, fetched with one request."""
+    purge_kind = KINDS[kind]
+    info, content = helper.request_json_list(
+        endpoint(helper, kind, listing=True).format(url=helper.module.params["url"]),
+        item_filter=(
+            (lambda item: item.get("source", "default") == "default") if purge_kind.default_source_only else None
+        ),
+        parse_item=purge_kind.parse_item,
+    )
+    if info["status"] != 200:
+        helper.generic_failure_msg(f"Failed to list {kind.replace('_', ' ')}", info)
+    return {item.get(purge_kind.name_key): item for item in content.get("json") or []}
+
+
+def deletion_waves(kind, live_objects, names) -> list:
+    """Waves of names to delete, objects are deleted before the objects they refer to.
+
+    Raises:
+        DependencyCycleError: If objects to delete refer to each other.
+    """
+    path = KINDS[kind].references
+    dependencies = {
+        name: [reference for reference in referenced_names(live_objects[name], path) if reference in names]
+        if path
+        else []
+        for name in names
+    }
+    return dependency_waves(reversed_dependencies(dependencies))
+
+
+def delete_object(helper, kind, name):
+    """Deletes one object, returns an error message or None. Objects already deleted are fine."""
+    info, dummy = helper.request(
+        api_url=(endpoint(helper, kind) + "/{name}").format(url=helper.module.params["url"], name=name),
+        method="DELETE",
+    )
+    if info["status"] in [200, 204, 404]:
+        return None
+    if info["status"] == 403:
+        return "The user does not have permission to perform the operation."
+    return f"http_status={info['status']}, error_msg='{info['msg']}', body={info.get('body')}"
@@ -9,6 +9,24 @@ from __future__ import absolute_import, division, print_function
 # pylint: disable-next=invalid-name
 __metaclass__ = type
 
+# Format names used in repository API paths which differ from the format returned by the API
+REPOSITORY_FORMAT_ALIASES = {
+    "maven": "maven2",
+}
+
+# Request payload fields which Nexus only has since a version, (section, field, feature in nexus_features.FEATURES)
+VERSIONED_PAYLOAD_FIELDS = (
+    ("proxy", "preserveEncodedCharacters", "proxy_preserve_encoded_characters"),
+)
+
+def drop_unsupported_payload_fields(input_data, features):
+    """Drops the VERSIONED_PAYLOAD_FIELDS which the Nexus version is known not to have."""
+    for section, field, feature in VERSIONED_PAYLOAD_FIELDS:
+        if isinstance(input_data.get(section), dict) and field in input_data[section]:
+            if features.supports(feature) is False:
+                input_data[section].pop(field)
+    return input_data
+
 def hosted_repo_request_payload_normalization(input_data, existing_data = None):
     # This is required because API in some Nexus versions will only return latestPolicy if
     # writePolicy is set to ALLOW_ONCE (Disable redeploy).
@@ -21,7 +39,7 @@ def hosted_repo_request_payload_normalization(input_data, existing_data = None):
     return input_data
 
 def proxy_repo_request_payload_normalization(input_data, existing_data = None):
-    # preserveEncodedCharacters added since 3.90
+    # preserveEncodedCharacters added since 3.90, see VERSIONED_PAYLOAD_FIELDS if the version is known
     if (
         input_data.get("proxy")  # type: ignore
         and existing_data is not None
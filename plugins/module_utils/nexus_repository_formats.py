@@ -0,0 +1,393 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import functools
+
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import (
+    nexus_normalize,
+    nexus_repository_commons,
+    nexus_repository_docker_commons,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
+    NexusHelper,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_repository_helper import (
+    NexusRepositoryHelper,
+)
+
+REPOSITORY_TYPES = ("hosted", "proxy", "group")
+
+
+def storage_write_policy_normalization(normalized_existing_data):
+    # The API returns writePolicy for some repositories even though it cannot be set for them.
+    if normalized_existing_data.get("storage"):  # type: ignore
+        normalized_existing_data["storage"].pop("writePolicy", None)  # type: ignore
+    return normalized_existing_data
+
+
+def maven_attributes():
+    """Directly maps to MavenAttributes"""
+    return {
+        "type": "dict",
+        "apply_defaults": True,
+        "options": {
+            "version_policy": {
+                "type": "str",
+                "choices": ["RELEASE", "SNAPSHOT", "MIXED"],
+                "default": "RELEASE",
+            },
+            "layout_policy": {
+                "type": "str",
+                "choices": ["STRICT", "PERMISSIVE"],
+                "default": "STRICT",
+            },
+            "content_disposition": {
+                "type": "str",
+                "choices": ["INLINE", "ATTACHMENT"],
+                "default": "INLINE",
+            },
+        },
+    }
+
+
+def raw_attributes(content_disposition):
+    """Directly maps to RawAttributes"""
+    return {
+        "type": "dict",
+        "apply_defaults": True,
+        "options": {
+            "content_disposition": {
+                "type": "str",
+                "choices": ["ATTACHMENT", "INLINE"],
+                "default": content_disposition,
+            },
+        },
+    }
+
+
+def remove_quarantined_attributes():
+    """Directly maps to NpmAttributes and PyPiProxyAttributes"""
+    return {
+        "type": "dict",
+        "apply_defaults": True,
+        "options": {
+            "remove_quarantined": {"type": "bool", "default": False},
+        },
+    }
+
+
+def nuget_proxy_attributes():
+    """Directly maps to NugetAttributes"""
+    return {
+        "type": "dict",
+        "apply_defaults": True,
+        "options": {
+            "query_cache_item_max_age": {"type": "int", "default": 3600},
+            "nuget_version": {
+                "type": "str",
+                "choices": ["V2", "V3"],
+                "default": "V3",
+            },
+        },
+    }
+
+
+def docker_hosted_storage_attributes():
+    """Directly maps to DockerHostedStorageAttributes"""
+    ret_spec = NexusRepositoryHelper.hosted_storage_attributes()
+    ret_spec["options"]["latest_policy"] = {
+        "type": "bool",
+        "default": False,
+    }
+    return ret_spec
+
+
+def docker_proxy_attributes():
+    """Directly maps to DockerProxyAttributes"""
+    return {
+        "type": "dict",
+        "apply_defaults": True,
+        "options": {
+            "index_type": {
+                "type": "str",
+                "choices": ["HUB", "REGISTRY", "CUSTOM"],
+                "default": "REGISTRY",
+            },
+            "index_url": {"type": "str", "required": False, "no_log": False},
+            "cache_foreign_layers": {"type": "bool", "default": False},
+            "foreign_layer_url_whitelist": {"type": "list", "elements": "str", "no_log": False, "default": []},
+        },
+    }
+
+
+# Format specific additions to the generic repository modules, per format and repository type.
+# arg_additions map argument names to functions building their spec, called when a spec is needed.
+REPOSITORY_FORMATS = {
+    "docker": {
+        "group": {
+            "arg_additions": {"docker": nexus_repository_docker_commons.docker_attributes},
+            "request_data_additions": {"docker": "camalize"},
+        },
+        "hosted": {
+            "arg_additions": {
+                "docker": nexus_repository_docker_commons.docker_attributes,
+                "storage": docker_hosted_storage_attributes,
+            },
+            "request_data_additions": {"docker": "camalize"},
+        },
+        "proxy": {
+            # Possibly this is returned for Docker proxy repos because it is based
+            # on same storage class as Docker hosted repos.
+            "api_response_normalization": storage_write_policy_normalization,
+            "arg_additions": {
+                "docker": nexus_repository_docker_commons.docker_attributes,
+                "docker_proxy": docker_proxy_attributes,
+            },
+            "request_data_additions": {"docker": "camalize", "docker_proxy": "camalize"},
+        },
+    },
+    "go": {
+        "group": {},
+        "proxy": {},
+    },
+    "helm": {
+        "hosted": {},
+        "proxy": {},
+    },
+    "maven": {
+        "group": {},
+        "hosted": {
+            "arg_additions": {"maven": maven_attributes},
+            "request_data_additions": {"maven": "camalize"},
+        },
+        "proxy": {
+            "api_response_normalization": storage_write_policy_normalization,
+            "arg_additions": {"maven": maven_attributes},
+            "request_data_additions": {"maven": "camalize"},
+        },
+    },
+    "npm": {
+        "group": {},
+        "hosted": {},
+        "proxy": {
+            "api_response_normalization": storage_write_policy_normalization,
+            "arg_additions": {"npm": remove_quarantined_attributes},
+            "request_data_additions": {"npm": "camalize"},
+        },
+    },
+    "nuget": {
+        "group": {},
+        "hosted": {},
+        "proxy": {
+            "api_response_normalization": storage_write_policy_normalization,
+            "arg_additions": {"nuget_proxy": nuget_proxy_attributes},
+            "request_data_additions": {"nuget_proxy": "camalize"},
+        },
+    },
+    "p2": {
+        "proxy": {},
+    },
+    "pypi": {
+        "group": {},
+        "hosted": {},
+        "proxy": {
+            "api_response_normalization": storage_write_policy_normalization,
+            "arg_additions": {"pypi": remove_quarantined_attributes},
+            "request_data_additions": {"pypi": "camalize"},
+        },
+    },
+    "raw": {
+        "group": {
+            "api_response_normalization": storage_write_policy_normalization,
+            "arg_additions": {"raw": functools.partial(raw_attributes, "INLINE")},
+            "request_data_additions": {"raw": "camalize"},
+        },
+        "hosted": {
+            "arg_additions": {"raw": functools.partial(raw_attributes, "ATTACHMENT")},
+            "request_data_additions": {"raw": "camalize"},
+        },
+        "proxy": {
+            "api_response_normalization": storage_write_policy_normalization,
+            "arg_additions": {"raw": functools.partial(raw_attributes, "ATTACHMENT")},
+            "request_data_additions": {"raw": "camalize"},
+        },
+    },
+    "rubygems": {
+        "group": {},
+        "hosted": {},
+        "proxy": {},
+    },
+}
+
+# Request payload normalization used unless a format defines its own
+DEFAULT_REQUEST_PAYLOAD_NORMALIZATIONS = {
+    "hosted": nexus_repository_commons.hosted_repo_request_payload_normalization,
+    "proxy": nexus_repository_commons.proxy_repo_request_payload_normalization,
+}
+
+
+def is_supported(repository_format, repository_type) -> bool:
+    return repository_type in REPOSITORY_FORMATS.get(repository_format, {})
+
+
+def supported_formats():
+    return sorted(REPOSITORY_FORMATS)
+
+
+def repository_definition(repository_format, repository_type) -> dict:
+    """Everything needed to manage a repository of the given format and type.
+
+    Returns:
+        dict: endpoint_path, api_response_normalization, request_payload_normalization,
+            arg_additions and request_data_additions.
+    """
+    definition = REPOSITORY_FORMATS[repository_format][repository_type]
+    return {
+        "endpoint_path": f"/{repository_format}/{repository_type}",
+        "api_response_normalization": definition.get("api_response_normalization"),
+        "request_payload_normalization": definition.get(
+            "request_payload_normalization",
+            DEFAULT_REQUEST_PAYLOAD_NORMALIZATIONS.get(repository_type),
+        ),
+        "arg_additions": {name: build() for name, build in definition.get("arg_additions", {}).items()},
+        "request_data_additions": dict(definition.get("request_data_additions", {})),
+    }
+
+
+def repository_argument_spec(repository_format, repository_type) -> dict:
+    """Arguments of a repository of the given format and type, excluding the common Nexus arguments.
+
+    Returns a new dict which callers may extend, the option specs in it are shared and must not be modified.
+    """
+    return dict(cached_repository_argument_spec(repository_format, repository_type))
+
+
+@functools.lru_cache(maxsize=None)
+def cached_repository_argument_spec(repository_format, repository_type) -> dict:
+    argument_spec = NexusRepositoryHelper.repository_argument_spec(repository_type)
+    argument_spec.update(repository_definition(repository_format, repository_type)["arg_additions"])
+    return argument_spec
+
+
+@functools.lru_cache(maxsize=None)
+def repository_key_table(repository_format, repository_type) -> dict:
+    """Compiled key table of the repository argument spec, see nexus_normalize.compile_key_table."""
+    return nexus_normalize.compile_key_table(cached_repository_argument_spec(repository_format, repository_type))
+
+
+def generic_module_arguments(repository_format, repository_type) -> dict:
+    """Keyword arguments for NexusRepositoryHelper.generic_repository_<type>_module."""
+    arguments = repository_definition(repository_format, repository_type)
+    if repository_type == "group":
+        arguments.pop("request_payload_normalization")
+    return arguments
+
+
+def generic_repository_module(repository_format, repository_type):
+    """Runs the thin module managing a single repository of the given format and type."""
+    generic_module = {
+        "group": NexusRepositoryHelper.generic_repository_group_module,
+        "hosted": NexusRepositoryHelper.generic_repository_hosted_module,
+        "proxy": NexusRepositoryHelper.generic_repository_proxy_module,
+    }[repository_type]
+    generic_module(**generic_module_arguments(repository_format, repository_type))
+
+
+def _merge_options(options, argument_spec):
+    for name, spec in argument_spec.items():
+        merged = options.setdefault(name, {key: spec[key] for key in ("type", "elements", "no_log") if key in spec})
+        if spec.get("options"):
+            _merge_options(merged.setdefault("options", {}), spec["options"])
+    return options
+
+
+@functools.lru_cache(maxsize=None)
+def repository_options() -> dict:
+    """Options of the repositories of all formats and types, suboptions included, for AnsibleModule.
+
+    Each option only has the type, elements and no_log of its spec, so that AnsibleModule masks secrets such as
+    http_client.authentication.password before logging the invocation. Defaults and choices of the format and
+    type are applied by validate_repository_params. Suboptions which are not given are None, see drop_none.
+    """
+    options = {}
+    for repository_format, types in REPOSITORY_FORMATS.items():
+        for repository_type in types:
+            argument_spec = cached_repository_argument_spec(repository_format, repository_type)
+            _merge_options(
+                options, {name: spec for name, spec in argument_spec.items() if name not in ("name", "state")}
+            )
+    return options
+
+
+def drop_none(value):
+    """value without the dict entries which are None, also in nested dicts and lists."""
+    if isinstance(value, dict):
+        return {key: drop_none(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [drop_none(item) for item in value]
+    return value
+
+
+def validate_repository_params(module, repository_format, repository_type) -> dict:
+    """Validates the repository options of the nexus_repository module against those of the format and type.
+
+    Returns:
+        dict: Module parameters with the repository options validated and their defaults applied.
+    """
+    argument_spec = cached_repository_argument_spec(repository_format, repository_type)
+    unsupported = sorted(
+        name for name in repository_options() if module.params.get(name) is not None and name not in argument_spec
+    )
+    if unsupported:
+        module.fail_json(
+            msg=f"Unsupported parameters for {repository_format} {repository_type} repositories: "
+            + ", ".join(unsupported)
+        )
+    result = ArgumentSpecValidator(argument_spec).validate(
+        drop_none({name: module.params[name] for name in argument_spec if name in module.params})
+    )
+    if result.error_messages:
+        module.fail_json(msg="; ".join(result.error_messages))
+    params = dict(module.params)
+    params.update(result.validated_parameters)
+    return params
+
+
+def repository_module():
+    """Runs the nexus_repository module managing a single repository of any format and type."""
+    common = NexusRepositoryHelper.cached_repository_argument_spec("group")
+    argument_spec = {
+        "format": {"type": "str", "required": True, "choices": supported_formats()},
+        "type": {"type": "str", "required": True, "choices": list(REPOSITORY_TYPES)},
+        "name": common["name"],
+        "state": common["state"],
+    }
+    argument_spec.update(repository_options())
+    module = NexusRepositoryHelper.module_with_nexus_arguments(argument_spec)
+    repository_format, repository_type = module.params["format"], module.params["type"]
+    if not is_supported(repository_format, repository_type):
+        module.fail_json(
+            msg=f"Unsupported format/type {repository_format}/{repository_type}, "
+            + f"{repository_format} supports {', '.join(REPOSITORY_FORMATS[repository_format])}"
+        )
+    module.params = validate_repository_params(module, repository_format, repository_type)
+
+    definition = repository_definition(repository_format, repository_type)
+    NexusRepositoryHelper.manage_repository(
+        NexusHelper(module),
+        repository_type,
+        definition["endpoint_path"],
+        api_response_normalization=definition["api_response_normalization"],
+        request_payload_normalization=definition["request_payload_normalization"],
+        request_data_additions=definition["request_data_additions"],
+        key_table=repository_key_table(repository_format, repository_type),
+    )
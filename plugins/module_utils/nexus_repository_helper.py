@@ -0,0 +1,699 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import collections
+import functools
+
+from ansible.module_utils.basic import AnsibleModule
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import (
+    nexus_diff,
+    nexus_normalize,
+    nexus_repository_commons,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
+    NexusHelper,
+)
+
+
+def repository_name_filter(item, helper):
+    return item["name"] == helper.module.params["name"]
+
+
+# Result of NexusRepositoryHelper.compare_repository, before and after are the normalized repositories.
+RepositoryComparison = collections.namedtuple("RepositoryComparison", ["changed", "got_password", "before", "after"])
+
+# Attributes returned by the repositories API which are not part of requests, and the
+# remote password which the API never returns.
+REPOSITORY_DIFF_RULES = nexus_diff.DiffRules(
+    ignored=("format", "type", "url"),
+    write_only=("httpClient.authentication.password",),
+)
+
+
+# pylint: disable-next=too-many-public-methods
+class NexusRepositoryHelper:
+
+    @staticmethod
+    def storage_attributes():
+        """Directly maps to StorageAttributes"""
+        return {
+            "type": "dict",
+            "apply_defaults": True,
+            "options": {
+                "blob_store_name": {"type": "str", "default": "default"},
+                "strict_content_type_validation": {"type": "bool", "default": True},
+            },
+        }
+
+    @staticmethod
+    def hosted_storage_attributes():
+        """Directly maps to HostedStorageAttributes"""
+        return {
+            "type": "dict",
+            "apply_defaults": True,
+            "options": {
+                "blob_store_name": {"type": "str", "default": "default"},
+                "strict_content_type_validation": {"type": "bool", "default": True},
+                "write_policy": {
+                    "type": "str",
+                    "choices": ["ALLOW", "ALLOW_ONCE", "DENY"],
+                    "default": "ALLOW",
+                },
+            },
+        }
+
+    @staticmethod
+    def cleanup_policy_attributes():
+        """Directly maps to CleanupPolicyAttributes"""
+        return {
+            "type": "dict",
+            "options": {
+                "policy_names": {
+                    "type": "list",
+                    "elements": "str",
+                    "required": False,
+                    "no_log": False,
+                    "default": [],
+                },
+            },
+        }
+
+    @staticmethod
+    def proxy_argument_spec():
+        """Directly maps to ProxyAttributes"""
+        return {
+            "type": "dict",
+            "options": {
+                "remote_url": {
+                    "type": "str",
+                    "no_log": False,
+                    "required": False,
+                },  # Required for create/update
+                "content_max_age": {"type": "int", "default": 1440},
+                "metadata_max_age": {"type": "int", "default": 1440},
+            },
+        }
+
+    @staticmethod
+    def proxy_argument_spec_3_90():
+        """Directly maps to ProxyAttributes"""
+        arg_spec = NexusRepositoryHelper.proxy_argument_spec()
+        arg_spec["options"].update({"preserve_encoded_characters": {"type": "bool", "default": False}})
+        return arg_spec
+
+    @staticmethod
+    def negative_cache_attributes():
+        """Directly maps to NegativeCacheAttributes"""
+        return {
+            "type": "dict",
+            "apply_defaults": True,
+            "options": {
+                "enabled": {"type": "bool", "default": True},
+                "time_to_live": {"type": "int", "default": 1440},
+            },
+        }
+
+    @staticmethod
+    def http_client_attributes():
+        """Directly maps to HttpClientAttributes"""
+        return {
+            "type": "dict",
+            "apply_defaults": True,
+            "options": {
+                "blocked": {"type": "bool", "default": False},
+                "auto_block": {"type": "bool", "default": True},
+                "connection": NexusRepositoryHelper.http_client_connection_attributes(),
+                "authentication": NexusRepositoryHelper.http_client_connection_authentication_attributes(),
+            },
+        }
+
+    @staticmethod
+    def http_client_connection_attributes():
+        """Directly maps to HttpClientConnectionAttributes"""
+        return {
+            "type": "dict",
+            "apply_defaults": True,
+            "options": {
+                "retries": {"type": "int"},  # min 0, max 10
+                "user_agent_suffix": {"type": "str", "required": False},
+                "timeout": {"type": "int"},  # min 1, max 3600
+                "enable_circular_redirects": {"type": "bool", "default": False},
+                "enable_cookies": {"type": "bool", "default": False},
+                "use_trust_store": {"type": "bool", "default": False},
+            },
+        }
+
+    @staticmethod
+    def http_client_connection_authentication_attributes():
+        """Directly maps to HttpClientConnectionAuthenticationAttributes"""
+        return {
+            "type": "dict",
+            "options": {
+                "type": {
+                    "type": "str",
+                    "choices": ["username", "ntlm", "bearerToken"],
+                    "default": "username",
+                    "required": False,
+                },
+                "username": {"type": "str", "required": False},
+                "password": {"type": "str", "no_log": True, "required": False},
+                "ntlmHost": {"type": "str", "required": False},
+                "ntlmDomain": {"type": "str", "required": False},
+                "bearerToken": {"type": "str", "no_log": True, "required": False},
+            },
+        }
+
+    @staticmethod
+    def replication_attributes():
+        """Directly maps to ReplicationAttributes"""
+        return {
+            "type": "dict",
+            "options": {
+                "preemptive_pull_enabled": {"type": "bool", "default": False},
+                "asset_path_regex": {"type": "str", "required": False},
+            },
+        }
+
+    @staticmethod
+    def component_attributes():
+        """Directly maps to ComponentAttributes"""
+        return {
+            "type": "dict",
+            "apply_defaults": True,
+            "options": {"proprietary_components": {"type": "bool", "default": False}},
+        }
+
+    @staticmethod
+    def group_attributes():
+        """Directly maps to GroupAttributes"""
+        return {
+            "type": "dict",
+            "options": {
+                "member_names": {
+                    "type": "list",
+                    "elements": "str",
+                    "default": [],
+                },
+            },
+        }
+
+    @staticmethod
+    def http_client_attributes_with_preemptive_auth():
+        """Directly maps to HttpClientAttributesWithPreemptiveAuth"""
+        return {
+            "type": "dict",
+            "apply_defaults": True,
+            "options": {
+                "blocked": {"type": "bool", "default": False},
+                "auto_block": {"type": "bool", "default": True},
+                "connection": NexusRepositoryHelper.http_client_connection_attributes(),
+                "authentication": (
+                    NexusRepositoryHelper.http_client_connection_authentication_attributes_with_preemptive()
+                ),
+            },
+        }
+
+    @staticmethod
+    def http_client_connection_authentication_attributes_with_preemptive():
+        """Directly maps to HttpClientConnectionAuthenticationAttributesWithPreemptive"""
+        ret_spec = (
+            NexusRepositoryHelper.http_client_connection_authentication_attributes()
+        )
+        ret_spec["options"]["preemptive"] = {
+            "type": "bool",
+            "default": False,
+            "required": False,
+        }
+        return ret_spec
+
+    @staticmethod
+    def group_deploy_attributes():
+        """Directly maps to GroupDeployAttributes"""
+        ret_spec = NexusRepositoryHelper.group_attributes()
+        ret_spec["options"]["writable_member"] = {
+            "type": "str",
+        }
+        return ret_spec
+
+    @staticmethod
+    def repository_argument_spec(repository_type):
+        """Arguments of a repository of the given type (hosted, proxy or group), excluding format specific ones.
+
+        Returns a new dict which callers may extend, the option specs in it are shared and must not be modified.
+        """
+        return dict(NexusRepositoryHelper.cached_repository_argument_spec(repository_type))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def cached_repository_argument_spec(repository_type):
+        argument_spec = {
+            "state": {
+                "type": "str",
+                "choices": ["online", "offline", "present", "absent"],
+                "default": "present",
+            },
+            "name": {"type": "str", "no_log": False, "required": True},
+        }
+        if repository_type == "proxy":
+            argument_spec.update(
+                {
+                    "http_client": NexusRepositoryHelper.http_client_attributes(),
+                    "negative_cache": NexusRepositoryHelper.negative_cache_attributes(),
+                    "proxy": NexusRepositoryHelper.proxy_argument_spec_3_90(),
+                    "storage": NexusRepositoryHelper.storage_attributes(),
+                    # Optional
+                    "cleanup": NexusRepositoryHelper.cleanup_policy_attributes(),
+                    "routing_rule_name": {
+                        "type": "str",
+                        "no_log": False,
+                        "required": False,
+                    },
+                    "replication": NexusRepositoryHelper.replication_attributes(),
+                }
+            )
+        elif repository_type == "group":
+            argument_spec.update(
+                {
+                    "storage": NexusRepositoryHelper.storage_attributes(),
+                    "group": NexusRepositoryHelper.group_deploy_attributes(),
+                }
+            )
+        elif repository_type == "hosted":
+            argument_spec.update(
+                {
+                    "storage": NexusRepositoryHelper.hosted_storage_attributes(),
+                    "cleanup": NexusRepositoryHelper.cleanup_policy_attributes(),
+                    "component": NexusRepositoryHelper.component_attributes(),
+                }
+            )
+        return argument_spec
+
+    @staticmethod
+    def repository_request_data(repository_type, params, request_data_additions=None, key_table=None):
+        """Builds <X><Type>RepositoryApiRequest from module parameters or a validated repository spec.
+
+        key_table is the compiled key table of the argument spec, see nexus_normalize.compile_key_table.
+        Without it all keys are camelized.
+        """
+        key_table = key_table or {}
+
+        def camelize(name):
+            entry = key_table.get(name)
+            return NexusHelper.camalize_value(params[name], key_table=entry[1] if entry else None)
+
+        data = {
+            "name": params["name"],
+            "online": params["state"] == "online" or params["state"] == "present",
+        }
+        if repository_type == "proxy":
+            data.update(
+                {
+                    "httpClient": camelize("http_client"),
+                    "negativeCache": camelize("negative_cache"),
+                    "proxy": camelize("proxy"),
+                    "storage": camelize("storage"),
+                    "cleanup": camelize("cleanup"),
+                    "routingRuleName": params["routing_rule_name"],
+                    "replication": camelize("replication"),
+                }
+            )
+        elif repository_type == "group":
+            data.update(
+                {
+                    "storage": camelize("storage"),
+                    "group": camelize("group"),
+                }
+            )
+        elif repository_type == "hosted":
+            data.update(
+                {
+                    "storage": camelize("storage"),
+                    "cleanup": camelize("cleanup"),
+                    "component": camelize("component"),
+                }
+            )
+        for k, v in (request_data_additions or {}).items():
+            key = key_table[k][0] if k in key_table else nexus_normalize.camelize_key(k)
+            data[key] = camelize(k) if v == "camalize" else params[k]
+        return data
+
+    @staticmethod
+    def list_repositories(helper, list_filter=None):
+        info, content = helper.request_json_list(
+            api_url=(helper.NEXUS_API_ENDPOINTS["repository-settings"]).format(
+                url=helper.module.params["url"],
+            ),
+            item_filter=(lambda item: list_filter(item, helper)) if list_filter else None,
+        )
+        if info["status"] in [200]:
+            content = content["json"]
+        else:
+            helper.generic_failure_msg("Failed to list repositories", info)
+        return content
+
+    @staticmethod
+    def repository_index(helper):
+        """Index of all repositories, see nexus_repository_index.RepositoryIndex."""
+        # pylint: disable-next=import-outside-toplevel
+        from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_repository_index import (
+            RepositoryIndex,
+        )
+
+        return RepositoryIndex(NexusRepositoryHelper.list_repositories(helper))
+
+    @staticmethod
+    def list_filtered_repositories(helper, list_filter=repository_name_filter):
+        return NexusRepositoryHelper.list_repositories(helper, list_filter)
+
+    @staticmethod
+    def get_repository(helper, endpoint_path, repository_filter=repository_name_filter):
+        """Looks up the repository named by the module, for the generic repository modules.
+
+        The repository is fetched directly by format, type and name unless the Nexus version is known not to
+        have the endpoint, a 404 meaning it does not exist. The full listing is used instead on older versions,
+        if the endpoint is not allowed (405) or implemented (501), and when the state cache is enabled since a
+        shared snapshot of the listing is cheaper than one request per task.
+
+        Args:
+            endpoint_path (str): Format and type of the repository, e.g. "/maven/hosted".
+            repository_filter: Applied to the repository found, as to each item of the listing.
+
+        Returns:
+            list: The repository, empty if it does not exist.
+        """
+        # None if the version cannot be detected, e.g. without permission to read it.
+        supported = helper.features.supports("repository_direct_lookup")
+        if helper.caches.state_cache or supported is False:
+            return NexusRepositoryHelper.list_filtered_repositories(helper, repository_filter)
+
+        info, content = helper.request(
+            api_url=(helper.NEXUS_API_ENDPOINTS["repositories"] + "{path}/{name}").format(
+                url=helper.module.params["url"],
+                path=endpoint_path,
+                name=helper.module.params["name"],
+            ),
+            method="GET",
+        )
+        if info["status"] == 200:
+            return [content] if repository_filter(content, helper) else []
+        if info["status"] == 404:
+            # Also when the version is unknown, versions without the endpoint are detected when readable.
+            return []
+        if info["status"] not in [405, 501]:
+            helper.generic_failure_msg(
+                f"Failed to get repository {helper.module.params['name']}", info
+            )
+        return NexusRepositoryHelper.list_filtered_repositories(helper, repository_filter)
+
+    @staticmethod
+    def create_repository(helper: NexusHelper, endpoint_path: str, data: dict):
+        changed = True
+        if helper.record_change(None, helper.clean_dict_list(data)):
+            return data, changed
+        info, content = helper.request(
+            api_url=(helper.NEXUS_API_ENDPOINTS["repositories"] + endpoint_path).format(
+                url=helper.module.params["url"],
+            ),
+            method="POST",
+            data=data,
+        )
+        if info["status"] not in [201]:
+            if info["status"] == 401:
+                helper.generic_authn_failure_msg()
+            elif info["status"] == 403:
+                helper.generic_permission_failure_msg()
+            else:
+                helper.module.fail_json(
+                    msg=f"Failed to create repository {helper.module.params['name']}, \
+                        http_status={info['status']}, error_msg='{info['msg']}, body={info['body']}'."
+                )
+
+        return content, changed
+
+    @staticmethod
+    def comparable_repository(helper: NexusHelper, existing_data: dict) -> dict:
+        """Repository returned by the API without empty values and attributes which are not part of requests."""
+        return {
+            k: v
+            for k, v in helper.clean_dict_list(existing_data).items()
+            if k not in REPOSITORY_DIFF_RULES.ignored
+        }
+
+    @staticmethod
+    def compare_repository(
+        helper: NexusHelper,
+        data: dict,
+        existing_data: dict,
+        api_response_normalization=None,
+        request_payload_normalization=None,
+    ):
+        """Compares request data with the repository returned by the API.
+
+        Both are normalized once, the result has them for the diff of the update.
+
+        Returns:
+            RepositoryComparison: changed is True if the repository differs, got_password is True if data
+                contains a password which cannot be compared.
+        """
+        normalized_data = helper.clean_dict_list(data)
+        normalized_existing_data = helper.clean_dict_list(existing_data)
+
+        if api_response_normalization:
+            normalized_existing_data = api_response_normalization(
+                normalized_existing_data
+            )
+        normalized_data = nexus_repository_commons.drop_unsupported_payload_fields(normalized_data, helper.features)
+        if request_payload_normalization:
+            normalized_data = request_payload_normalization(
+                normalized_data, normalized_existing_data
+            )
+        # The password cannot be compared because API will never return it.
+        equal, got_password = nexus_diff.compare(normalized_existing_data, normalized_data, REPOSITORY_DIFF_RULES)
+        return RepositoryComparison(not equal, got_password, normalized_existing_data, normalized_data)
+
+    @staticmethod
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def update_repository(
+        helper: NexusHelper,
+        endpoint_path: str,
+        data: dict,
+        existing_data: dict,
+        api_response_normalization=None,
+        request_payload_normalization=None,
+    ):
+        comparison = NexusRepositoryHelper.compare_repository(
+            helper,
+            data,
+            existing_data,
+            api_response_normalization,
+            request_payload_normalization,
+        )
+        if not comparison.changed and not comparison.got_password:
+            return existing_data, False
+        if helper.record_change(comparison.before, comparison.after, REPOSITORY_DIFF_RULES):
+            return data, True
+
+        info, content = helper.request(
+            api_url=(
+                helper.NEXUS_API_ENDPOINTS["repositories"] + "{path}/{repository}"
+            ).format(
+                url=helper.module.params["url"],
+                path=endpoint_path,
+                repository=helper.module.params["name"],
+            ),
+            method="PUT",
+            data=data,
+        )
+
+        if info["status"] not in [204]:
+            if info["status"] == 401:
+                helper.generic_authn_failure_msg()
+            elif info["status"] == 403:
+                helper.generic_permission_failure_msg()
+            else:
+                helper.module.fail_json(
+                    msg=f"Failed to update repository {helper.module.params['name']}, \
+                        http_status={info['status']}, error_msg='{info['msg']}, body={info['body']}'."
+                )
+
+        return content, comparison.changed
+
+    @staticmethod
+    def delete_repository(helper, existing_data=None):
+        changed = True
+        if helper.record_change(
+            NexusRepositoryHelper.comparable_repository(helper, existing_data or {}), None
+        ):
+            return {}, changed
+        info, content = helper.request(
+            api_url=(helper.NEXUS_API_ENDPOINTS["repositories"] + "/{name}").format(
+                url=helper.module.params["url"],
+                name=helper.module.params["name"],
+            ),
+            method="DELETE",
+        )
+
+        if info["status"] not in [204]:
+            if info["status"] in [404]:
+                content.pop("fetch_url_retries", None)
+                changed = False
+            elif info["status"] == 401:
+                helper.generic_authn_failure_msg()
+            elif info["status"] == 403:
+                helper.generic_permission_failure_msg()
+            else:
+                helper.module.fail_json(
+                    msg=f"Failed to delete {helper.module.params['name']}., \
+                        http_status={info['status']}, error_msg='{info['msg']}'."
+                )
+
+        return content, changed
+
+    @staticmethod
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def create_update_repository(
+        helper: NexusHelper,
+        endpoint_path: str,
+        data: dict,
+        existing_data: list,
+        api_response_normalization=None,
+        request_payload_normalization=None,
+    ):
+        if len(existing_data) > 0:
+            return NexusRepositoryHelper.update_repository(
+                helper=helper,
+                endpoint_path=endpoint_path,
+                data=data,
+                request_payload_normalization=request_payload_normalization,
+                existing_data=existing_data[0],
+                api_response_normalization=api_response_normalization,
+            )
+        return NexusRepositoryHelper.create_repository(helper, endpoint_path, data)
+
+    @staticmethod
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def manage_repository(
+        helper: NexusHelper,
+        repository_type: str,
+        endpoint_path: str,
+        repository_filter=repository_name_filter,
+        api_response_normalization=None,
+        request_payload_normalization=None,
+        request_data_additions=None,
+        key_table=None,
+    ):
+        """Creates, updates or deletes the repository described by the module parameters and exits the module.
+
+        key_table is the compiled key table of the repository arguments, the one of the module's argument spec
+        if not given.
+        """
+        changed, content = False, {}
+        existing_data = NexusRepositoryHelper.get_repository(
+            helper, endpoint_path, repository_filter
+        )
+        if helper.module.params["state"] == "absent":  # type: ignore
+            if len(existing_data) > 0:
+                content, changed = NexusRepositoryHelper.delete_repository(
+                    helper, existing_data[0]
+                )
+        else:
+            data = NexusRepositoryHelper.repository_request_data(
+                repository_type, helper.module.params, request_data_additions, key_table or helper.key_table
+            )
+            content, changed = NexusRepositoryHelper.create_update_repository(
+                helper=helper,
+                endpoint_path=endpoint_path,
+                data=data,
+                existing_data=existing_data,
+                api_response_normalization=api_response_normalization,
+                request_payload_normalization=request_payload_normalization,
+            )
+        result = NexusHelper.generate_result_struct(changed, content)
+        helper.module.exit_json(**result)
+
+    @staticmethod
+    def module_with_nexus_arguments(argument_spec):
+        """AnsibleModule supporting check mode with the common Nexus arguments and argument_spec."""
+        module_argument_spec = NexusHelper.nexus_argument_spec()
+        module_argument_spec.update(argument_spec)
+        return AnsibleModule(
+            argument_spec=module_argument_spec,
+            supports_check_mode=True,
+            required_together=[("username", "password")],
+        )
+
+    @staticmethod
+    def repository_module(repository_type, arg_additions=None):
+        """Module with the arguments of a repository of the given type and the format specific arg_additions."""
+        argument_spec = NexusRepositoryHelper.repository_argument_spec(repository_type)
+        argument_spec.update(arg_additions or {})
+        return NexusRepositoryHelper.module_with_nexus_arguments(argument_spec)
+
+    @staticmethod
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def generic_repository_proxy_module(
+        endpoint_path: str,
+        repository_filter=repository_name_filter,
+        api_response_normalization=None,
+        request_payload_normalization=nexus_repository_commons.proxy_repo_request_payload_normalization,
+        arg_additions=None,
+        request_data_additions=None,
+    ):
+        module = NexusRepositoryHelper.repository_module("proxy", arg_additions)
+        NexusRepositoryHelper.manage_repository(
+            NexusHelper(module),
+            "proxy",
+            endpoint_path,
+            repository_filter=repository_filter,
+            api_response_normalization=api_response_normalization,
+            request_payload_normalization=request_payload_normalization,
+            request_data_additions=request_data_additions,
+        )
+
+    @staticmethod
+    def generic_repository_group_module(
+        endpoint_path: str,
+        repository_filter=repository_name_filter,
+        api_response_normalization=None,
+        arg_additions=None,
+        request_data_additions=None,
+    ):
+        module = NexusRepositoryHelper.repository_module("group", arg_additions)
+        NexusRepositoryHelper.manage_repository(
+            NexusHelper(module),
+            "group",
+            endpoint_path,
+            repository_filter=repository_filter,
+            api_response_normalization=api_response_normalization,
+            request_data_additions=request_data_additions,
+        )
+
+    @staticmethod
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def generic_repository_hosted_module(
+        endpoint_path: str,
+        repository_filter=repository_name_filter,
+        request_payload_normalization=nexus_repository_commons.hosted_repo_request_payload_normalization,
+        api_response_normalization=None,
+        arg_additions=None,
+        request_data_additions=None,
+    ):
+        module = NexusRepositoryHelper.repository_module("hosted", arg_additions)
+        NexusRepositoryHelper.manage_repository(
+            NexusHelper(module),
+            "hosted",
+            endpoint_path,
+            repository_filter=repository_filter,
+            api_response_normalization=api_response_normalization,
+            request_payload_normalization=request_payload_normalization,
+            request_data_additions=request_data_additions,
+        )
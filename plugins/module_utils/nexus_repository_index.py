@@ -0,0 +1,109 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+from collections.abc import Mapping
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_repository_commons import (
+    REPOSITORY_FORMAT_ALIASES,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_scheduler import referenced_names
+
+# Path of the values a repository is indexed by, per criterion of RepositoryIndex.select.
+INDEXED_PATHS = {
+    "format": ("format",),
+    "type": ("type",),
+    "blob_store": ("storage", "blobStoreName"),
+    "cleanup_policy": ("cleanup", "policyNames"),
+    "routing_rule": ("routingRuleName",),
+}
+GROUP_MEMBERS = ("group", "memberNames")
+
+
+class RepositoryIndex(Mapping):
+    """Repositories of a listing per name, indexed by format, type, the objects they use and group membership.
+
+    The index is built in one pass over the listing, e.g. of GET /v1/repositorySettings, lookups do not scan it.
+    Repositories are dicts, or models from nexus_models, and are returned in the order of the listing.
+    """
+
+    def __init__(self, repositories):
+        self._repositories = {}
+        self._positions = {}
+        self._index = {criterion: {} for criterion in INDEXED_PATHS}
+        # Names of the members per group and of the groups per member.
+        self._index["member_of"] = {}
+        self._index["contains"] = {}
+        for repository in repositories:
+            name = repository.get("name")
+            self._repositories[name] = repository
+            self._positions[name] = len(self._positions)
+            for criterion, path in INDEXED_PATHS.items():
+                for value in referenced_names(repository, path):
+                    self._index[criterion].setdefault(value, []).append(name)
+            for member in referenced_names(repository, GROUP_MEMBERS):
+                self._index["member_of"].setdefault(name, []).append(member)
+                self._index["contains"].setdefault(member, []).append(name)
+
+    def __getitem__(self, name):
+        return self._repositories[name]
+
+    def __iter__(self):
+        return iter(self._repositories)
+
+    def __len__(self):
+        return len(self._repositories)
+
+    def names(self, criterion, value) -> list:
+        """Names of the repositories matching one criterion of select, e.g. ("blob_store", "default")."""
+        if criterion == "name":
+            return [value] if value in self._repositories else []
+        if criterion == "format":
+            value = REPOSITORY_FORMAT_ALIASES.get(value, value)
+        return self._index[criterion].get(value, [])
+
+    def select(self, **criteria) -> list:
+        """Repositories matching all criteria, those which are None are ignored.
+
+        Args:
+            name: Name of the repository.
+            format: Format as returned by the API or as named by the modules, e.g. maven2 or maven.
+            type: hosted, proxy or group.
+            blob_store: Name of the blob store the repositories use.
+            cleanup_policy: Name of a cleanup policy of the repositories.
+            routing_rule: Name of the routing rule the repositories use.
+            member_of: Name of a group, its members which exist are selected.
+            contains: Name of a repository, the groups it is a direct member of are selected.
+        """
+        candidates = [self.names(criterion, value) for criterion, value in criteria.items() if value is not None]
+        if not candidates:
+            return list(self._repositories.values())
+        candidates.sort(key=len)
+        others = [set(names) for names in candidates[1:]]
+        selected = {
+            name for name in candidates[0] if name in self._repositories and all(name in names for names in others)
+        }
+        return [self._repositories[name] for name in sorted(selected, key=self._positions.get)]
+
+    def members(self, group) -> list:
+        """Names of the members of a group, including members which do not exist."""
+        return list(self._index["member_of"].get(group, []))
+
+    def groups_containing(self, name, transitive=False) -> list:
+        """Names of the groups a repository is a member of, with transitive also through other groups."""
+        groups = list(self._index["contains"].get(name, []))
+        if transitive:
+            seen = set(groups) | {name}
+            for group in groups:
+                for outer in self._index["contains"].get(group, []):
+                    if outer not in seen:
+                        seen.add(outer)
+                        groups.append(outer)
+        return groups
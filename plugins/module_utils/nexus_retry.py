@@ -0,0 +1,129 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import random
+import threading
+import time
+
+from email.utils import parsedate_to_datetime
+
+
+# pylint: disable-next=too-many-instance-attributes
+class NexusRetryPolicy:
+    """Decides if and when a request to Nexus shall be retried.
+
+    Connection failures and timeouts (status -1) and the HTTP status codes listed in status_codes are
+    retried for idempotent methods, since a POST may have been processed before the connection failed.
+    Status codes meaning the request was rejected before being processed (429) are retried for any method.
+    Delays grow exponentially from sleep, or DEFAULT_BASE_DELAY if sleep is 0, with backoff_factor, are capped
+    by max_sleep, randomized with jitter and never shorter than a Retry-After header sent by Nexus.
+    """
+
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    NOT_PROCESSED_STATUS_CODES = (429,)
+    DEFAULT_BASE_DELAY = 1.0
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        attempts=1,
+        sleep=0,
+        backoff_factor=2.0,
+        max_sleep=60,
+        jitter=True,
+        status_codes=None,
+        deadline=None,
+    ):
+        self.attempts = max(attempts, 1)
+        self.sleep = sleep
+        self.backoff_factor = backoff_factor
+        self.max_sleep = max_sleep
+        self.jitter = jitter
+        self.status_codes = status_codes or []
+        self.deadline = deadline
+        self.stats = {
+            "requests": 0,
+            "requests_retried": 0,
+            "retries": 0,
+            "sleep_seconds": 0.0,
+            "retried_status_codes": {},
+        }
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def from_params(params):
+        return NexusRetryPolicy(
+            attempts=params["retries"],
+            sleep=params["sleep"],
+            backoff_factor=params["retry_backoff_factor"],
+            max_sleep=params["retry_max_sleep"],
+            jitter=params["retry_jitter"],
+            status_codes=params["retry_status_codes"],
+            deadline=params["retry_deadline"],
+        )
+
+    def is_retryable(self, method, status) -> bool:
+        if status != -1 and status not in self.status_codes:
+            return False
+        return method.upper() in self.IDEMPOTENT_METHODS or status in self.NOT_PROCESSED_STATUS_CODES
+
+    @staticmethod
+    def retry_after(info):
+        """Returns seconds to wait according to the Retry-After header, None if not present or invalid."""
+        value = info.get("retry-after")
+        if not value:
+            return None
+        value = str(value).strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    def backoff(self, attempt):
+        """Delay before the given retry attempt (1 = first retry)."""
+        base_delay = self.sleep or self.DEFAULT_BASE_DELAY
+        delay = min(base_delay * (self.backoff_factor ** (attempt - 1)), self.max_sleep)
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+        return delay
+
+    def next_delay(self, method, info, attempt, elapsed):
+        """Returns seconds to sleep before next attempt, or None if the request shall not be retried.
+
+        Args:
+            method (str): HTTP method of the request.
+            info (dict): Information about the response as returned by fetch_url.
+            attempt (int): Number of attempts made so far.
+            elapsed (float): Seconds since the first attempt.
+        """
+        if attempt >= self.attempts or not self.is_retryable(method, info["status"]):
+            return None
+        delay = self.backoff(attempt)
+        retry_after = self.retry_after(info)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+    def record(self, attempts, sleep_seconds, retried_statuses):
+        with self._lock:
+            self.stats["requests"] += 1
+            if attempts <= 1:
+                return
+            self.stats["requests_retried"] += 1
+            self.stats["retries"] += attempts - 1
+            self.stats["sleep_seconds"] = round(self.stats["sleep_seconds"] + sleep_seconds, 3)
+            for status in retried_statuses:
+                key = str(status)
+                self.stats["retried_status_codes"][key] = self.stats["retried_status_codes"].get(key, 0) + 1
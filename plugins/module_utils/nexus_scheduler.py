@@ -0,0 +1,100 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_models import NexusModel
+
+
+class DependencyCycleError(Exception):
+    """Objects depend on each other, the cycle is e.g. ["a", "b", "a"]."""
+
+    def __init__(self, cycle):
+        super().__init__("Dependency cycle: " + " -> ".join(str(node) for node in cycle))
+        self.cycle = cycle
+
+
+def find_cycle(dependencies):
+    """A cycle in the graph, None if there is none.
+
+    Args:
+        dependencies (dict): The nodes each node depends on, per node. Dependencies which are not nodes
+            of the graph are ignored.
+    """
+    visiting, visited = [], set()
+
+    def visit(node):
+        if node in visiting:
+            return visiting[visiting.index(node):] + [node]
+        if node in visited or node not in dependencies:
+            return None
+        visiting.append(node)
+        for dependency in dependencies[node]:
+            cycle = visit(dependency)
+            if cycle:
+                return cycle
+        visiting.pop()
+        visited.add(node)
+        return None
+
+    for node in dependencies:
+        cycle = visit(node)
+        if cycle:
+            return cycle
+    return None
+
+
+def dependency_waves(dependencies) -> list:
+    """Orders the nodes of a graph in waves, each node comes after the nodes it depends on.
+
+    The nodes of a wave do not depend on each other and may be processed concurrently, nodes keep their
+    order within a wave.
+
+    Args:
+        dependencies (dict): The nodes each node depends on, per node. Dependencies which are not nodes
+            of the graph are ignored, e.g. objects which already exist.
+
+    Raises:
+        DependencyCycleError: If nodes depend on each other.
+    """
+    remaining = {node: {d for d in deps if d in dependencies and d != node} for node, deps in dependencies.items()}
+    for node, deps in dependencies.items():
+        if node in deps:
+            raise DependencyCycleError([node, node])
+    waves = []
+    while remaining:
+        wave = [node for node, deps in remaining.items() if not deps]
+        if not wave:
+            raise DependencyCycleError(find_cycle(remaining))
+        for node in wave:
+            del remaining[node]
+        for deps in remaining.values():
+            deps.difference_update(wave)
+        waves.append(wave)
+    return waves
+
+
+def reversed_dependencies(dependencies) -> dict:
+    """The graph with its edges reversed, e.g. to delete objects before the objects they depend on."""
+    reverse = {node: [] for node in dependencies}
+    for node, deps in dependencies.items():
+        for dependency in deps:
+            if dependency in reverse and node not in reverse[dependency]:
+                reverse[dependency].append(node)
+    return reverse
+
+
+def referenced_names(data, path) -> list:
+    """Names of the objects referred to at a path of data, e.g. ("group", "memberNames")."""
+    value = data
+    for key in path:
+        value = value.get(key) if isinstance(value, (dict, NexusModel)) else None
+    if not value:
+        return []
+    return value if isinstance(value, list) else [value]
@@ -9,12 +9,12 @@ from __future__ import absolute_import, division, print_function
 # pylint: disable-next=invalid-name
 __metaclass__ = type
 
-def list_scripts(helper):
-    info, content = helper.request(
+def list_scripts(helper, script_filter=None):
+    info, content = helper.request_json_list(
         api_url=helper.NEXUS_API_ENDPOINTS["script"].format(
             url=helper.module.params["url"]
         ),
-        method="GET",
+        item_filter=script_filter,
     )
     if info["status"] in [200]:
         content = content["json"]
@@ -0,0 +1,135 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import secrets
+import time
+
+from urllib.parse import urlencode
+
+from ansible.module_utils._text import to_bytes, to_text
+
+DEFAULT_CACHE_DIR = "~/.cache/haxorof.sonatype_nexus/sessions"
+DEFAULT_LIFETIME = 600
+
+SESSION_PATH = "/service/rapture/session"
+SESSION_COOKIE = "NXSESSIONID"
+CSRF_TOKEN = "NX-ANTI-CSRF-TOKEN"
+
+
+def login_request(username, password):
+    """Request creating a Nexus session, the same as the login of the Nexus UI.
+
+    Returns:
+        tuple: (form data, headers, anti-CSRF token to send with the session cookie)
+    """
+    data = urlencode(
+        {
+            "username": to_text(base64.b64encode(to_bytes(username))),
+            "password": to_text(base64.b64encode(to_bytes(password or ""))),
+        }
+    )
+    csrf_token = secrets.token_hex(16)
+    headers = {
+        "Content-Type": "application/x-www-form-urlencoded",
+        "X-Nexus-UI": "true",
+        CSRF_TOKEN: csrf_token,
+        "Cookie": f"{CSRF_TOKEN}={csrf_token}",
+    }
+    return data, headers, csrf_token
+
+
+def session_headers(info, csrf_token):
+    """Headers authenticating requests with the session created, None if no session was created.
+
+    Args:
+        info (dict): Information about the response to login_request, as returned by fetch_url.
+    """
+    if info["status"] not in (200, 204):
+        return None
+    session_id = None
+    # Multiple Set-Cookie headers are joined with ", ", which may also be part of a cookie's Expires.
+    for cookie in info.get("set-cookie", "").split(","):
+        name, dummy, value = cookie.split(";")[0].strip().partition("=")
+        if name == SESSION_COOKIE and value:
+            session_id = value
+    if not session_id:
+        return None
+    return {
+        CSRF_TOKEN: csrf_token,
+        "Cookie": f"{SESSION_COOKIE}={session_id}; {CSRF_TOKEN}={csrf_token}",
+    }
+
+
+def login(send, username, password):
+    """Creates a Nexus session.
+
+    Args:
+        send: Function sending a request, send(path, method, data, headers), returning (response, info)
+            like fetch_url.
+
+    Returns:
+        tuple: (headers authenticating with the session, None if no session was created, info of the response)
+    """
+    data, headers, csrf_token = login_request(username, password)
+    response, info = send(SESSION_PATH, "POST", data, headers)
+    if response:
+        response.read()
+        response.close()
+    return session_headers(info, csrf_token), info
+
+
+class NexusSessionStore:
+    """Nexus sessions shared by all module invocations on the controller.
+
+    One session per Nexus URL and credentials is kept in a file readable only by the user, for at most
+    lifetime seconds, which should be shorter than the session timeout configured in Nexus.
+    """
+
+    def __init__(self, cache_dir, nexus_url, identity, lifetime=DEFAULT_LIFETIME):
+        self.cache_dir = os.path.expanduser(cache_dir or DEFAULT_CACHE_DIR)
+        self.lifetime = lifetime
+        name = hashlib.sha256(f"{identity}\0{nexus_url.rstrip('/')}".encode("utf-8")).hexdigest()
+        self.path = os.path.join(self.cache_dir, name + ".json")
+        self.stats = {
+            "logins": 0,
+            "reused": 0,
+            "renewed": 0,
+        }
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+
+    def get(self):
+        """Headers of the stored session, None if there is none or it is older than lifetime."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                session = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if time.time() - session["created_at"] > self.lifetime:
+            return None
+        return session["headers"]
+
+    def put(self, headers):
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"created_at": time.time(), "headers": headers}, f)
+        os.replace(tmp_path, self.path)
+
+    def drop(self, headers):
+        """Removes the stored session if it is still the one given, e.g. when Nexus rejected it."""
+        if self.get() == headers:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.path)
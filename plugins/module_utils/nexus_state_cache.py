@@ -0,0 +1,163 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+DEFAULT_CACHE_DIR = "~/.cache/haxorof.sonatype_nexus/state"
+DEFAULT_MAX_STALENESS = 300
+
+_REPOSITORY_DELETE = re.compile(r"/v1/repositories/(?P<name>[^/]+)$")
+
+
+# pylint: disable-next=too-many-instance-attributes
+class NexusStateCache:
+    """Snapshots of list endpoints shared by all module invocations of a play.
+
+    The first task reading e.g. repositorySettings stores the whole list, later tasks reuse the snapshot
+    as long as it is not older than max_staleness seconds. Writes made through the cache owner drop the
+    snapshots of the resource family written to, repository deletes are applied to the snapshots instead.
+    A snapshot fetched before a write was made to its family is never stored, so parallel forks cannot store
+    a list missing their own writes.
+    """
+
+    LOCK_FILE = "state.lock"
+    WRITES_FILE = "writes.json"
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(self, cache_dir, nexus_url, identity, family_of, max_staleness=DEFAULT_MAX_STALENESS):
+        self.cache_dir = os.path.expanduser(cache_dir or DEFAULT_CACHE_DIR)
+        self.nexus_url = nexus_url.rstrip("/")
+        self.identity = identity
+        self.family_of = family_of
+        self.max_staleness = max_staleness
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stored": 0,
+            "applied": 0,
+            "invalidated": 0,
+        }
+        self._stats_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def key(self, api_url):
+        return hashlib.sha256(f"{self.identity}\0{api_url}".encode("utf-8")).hexdigest()
+
+    def snapshot_name(self, api_url):
+        return self.key(api_url) + ".json"
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Exclusive access to the cache directory, shared between processes."""
+        with self._file_lock:
+            fd = os.open(os.path.join(self.cache_dir, self.LOCK_FILE), os.O_RDWR | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "r+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _read(self, name):
+        try:
+            with open(os.path.join(self.cache_dir, name), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write(self, name, document):
+        path = os.path.join(self.cache_dir, name)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(document, f)
+        os.chmod(path + ".tmp", 0o600)
+        os.replace(path + ".tmp", path)
+
+    def _snapshots(self, family):
+        """Yields (file name, snapshot) of all snapshots of a resource family on this Nexus."""
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json") or name == self.WRITES_FILE:
+                continue
+            snapshot = self._read(name)
+            if snapshot and snapshot["family"] == family and snapshot["nexus_url"] == self.nexus_url:
+                yield name, snapshot
+
+    def get(self, api_url):
+        """Returns the items of the snapshot of api_url, None if there is no usable snapshot."""
+        with self._locked():
+            snapshot = self._read(self.snapshot_name(api_url))
+        if snapshot is None or time.time() - snapshot["taken_at"] > self.max_staleness:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return snapshot["items"]
+
+    def put(self, api_url, items, fetched_at):
+        """Stores a snapshot of api_url unless its family was written to after fetched_at."""
+        family = self.family_of(api_url)
+        with self._locked():
+            writes = self._read(self.WRITES_FILE) or {}
+            if writes.get(f"{self.nexus_url} {family}", 0) >= fetched_at:
+                return
+            self._write(
+                self.snapshot_name(api_url),
+                {
+                    "nexus_url": self.nexus_url,
+                    "url": api_url,
+                    "family": family,
+                    "taken_at": fetched_at,
+                    "items": items,
+                },
+            )
+        self._count("stored")
+
+    def apply_write(self, api_url, method, status):
+        """Drops the snapshots affected by a POST/PUT/DELETE to api_url.
+
+        Deleted repositories are removed from the repositorySettings snapshots instead, the state of other
+        writes is only known by reading it again.
+        """
+        family = self.family_of(api_url)
+        deleted = self._deleted_repository(api_url, method, status)
+        with self._locked():
+            writes = self._read(self.WRITES_FILE) or {}
+            writes[f"{self.nexus_url} {family}"] = time.time()
+            self._write(self.WRITES_FILE, writes)
+            for name, snapshot in self._snapshots(family):
+                if deleted and urlsplit(snapshot["url"]).path.rstrip("/").endswith("/v1/repositorySettings"):
+                    snapshot["items"] = [item for item in snapshot["items"] if item.get("name") != deleted]
+                    self._write(name, snapshot)
+                    self._count("applied")
+                else:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(os.path.join(self.cache_dir, name))
+                    self._count("invalidated")
+
+    @staticmethod
+    def _deleted_repository(api_url, method, status):
+        """Name of the repository deleted by a write, None if the write is not a repository delete."""
+        if method != "DELETE" or status not in (204, 404):
+            return None
+        match = _REPOSITORY_DELETE.search(urlsplit(api_url).path.rstrip("/"))
+        return match.group("name") if match else None
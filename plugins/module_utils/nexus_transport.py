@@ -0,0 +1,317 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import base64
+import http.client
+import selectors
+import socket
+import ssl
+import threading
+import time
+
+from urllib.parse import urljoin, urlsplit, unquote
+from urllib.request import getproxies, proxy_bypass
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.urls import get_user_agent
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_retry import NexusRetryPolicy
+
+# Errors raised when a kept-alive connection has been closed by the server (or a load balancer)
+# while it was idle in the pool. An idempotent request failing like this on a reused connection is
+# retried once on a fresh connection.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+REDIRECT_STATUS_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 10
+
+
+class PooledResponse:
+    """Response of a pooled request, the connection is given back to the pool when the body is consumed."""
+
+    def __init__(self, pool, key, connection, response):
+        self._pool = pool
+        self._key = key
+        self._connection = connection
+        self._response = response
+        self.status = response.status
+        self.headers = response.headers
+
+    def read(self, amt=None):
+        data = self._response.read(amt)
+        if self._response.isclosed():
+            self._release()
+        return data
+
+    def close(self):
+        if self._connection is None:
+            return
+        if self._response.isclosed():
+            self._release()
+        else:
+            # Body not fully read, the connection cannot be reused.
+            self._response.close()
+            self._connection.close()
+            self._connection = None
+
+    def _release(self):
+        if self._connection is not None:
+            if self._response.will_close:
+                self._connection.close()
+            else:
+                self._pool.release(self._key, self._connection)
+            self._connection = None
+
+
+# pylint: disable-next=too-many-instance-attributes
+class NexusConnectionPool:
+    """HTTP/1.1 keep-alive connection pool reusing connections per host.
+
+    The pool is thread safe, a connection is only used by one request at a time and is given back to
+    the pool when the response has been read.
+    """
+
+    def __init__(self, validate_certs=True, use_proxy=True, timeout=10, max_idle_per_host=8):
+        self.validate_certs = validate_certs
+        self.use_proxy = use_proxy
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.stats = {
+            "requests": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+        }
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._ssl_context = None
+
+    def ssl_context(self):
+        if self._ssl_context is None:
+            context = ssl.create_default_context()
+            if not self.validate_certs:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            self._ssl_context = context
+        return self._ssl_context
+
+    def proxy_for(self, scheme, host):
+        """Returns proxy URL for host based on the *_proxy environment variables, None if not proxied."""
+        if not self.use_proxy:
+            return None
+        proxy = getproxies().get(scheme)
+        if not proxy or proxy_bypass(host):
+            return None
+        return proxy
+
+    def _new_connection(self, key):
+        scheme, host, port, proxy = key
+        if proxy:
+            proxy_parts = urlsplit(proxy if "://" in proxy else "http://" + proxy)
+            proxy_port = proxy_parts.port or (443 if proxy_parts.scheme == "https" else 80)
+            tunnel_headers = {}
+            if proxy_parts.username:
+                tunnel_headers["Proxy-Authorization"] = self.proxy_authorization(proxy_parts)
+            if scheme == "https":
+                connection = http.client.HTTPSConnection(
+                    proxy_parts.hostname, proxy_port, timeout=self.timeout, context=self.ssl_context()
+                )
+                connection.set_tunnel(host, port, headers=tunnel_headers)
+            else:
+                connection = http.client.HTTPConnection(proxy_parts.hostname, proxy_port, timeout=self.timeout)
+        elif scheme == "https":
+            connection = http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self.ssl_context())
+        else:
+            connection = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        with self._lock:
+            self.stats["connections_opened"] += 1
+        return connection
+
+    @staticmethod
+    def _connect(connection):
+        """Connects a new connection, including TLS handshake and proxy tunnel, and returns the time it took."""
+        started = time.monotonic()
+        connection.connect()
+        return time.monotonic() - started
+
+    @staticmethod
+    def proxy_authorization(proxy_parts):
+        credentials = f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+        return "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def is_dropped(connection) -> bool:
+        """True if an idle connection has been closed by the server, which makes its socket readable."""
+        if connection.sock is None:
+            return True
+        with selectors.DefaultSelector() as selector:
+            selector.register(connection.sock, selectors.EVENT_READ)
+            return bool(selector.select(0))
+
+    def acquire(self, key):
+        """Returns an idle connection for key, or a new one, and if it was reused."""
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    break
+                connection = idle.pop()
+            if not self.is_dropped(connection):
+                with self._lock:
+                    self.stats["connections_reused"] += 1
+                return connection, True
+            connection.close()
+        return self._new_connection(key), False
+
+    def release(self, key, connection):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        with self._lock:
+            for connections in self._idle.values():
+                for connection in connections:
+                    connection.close()
+            self._idle = {}
+
+    def _route(self, url, headers):
+        """Returns the pool key of url and the request target, adding proxy authorization to headers if needed."""
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        proxy = self.proxy_for(scheme, parts.hostname)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        if proxy and scheme == "http":
+            target = url
+            proxy_parts = urlsplit(proxy if "://" in proxy else "http://" + proxy)
+            if proxy_parts.username:
+                headers["Proxy-Authorization"] = self.proxy_authorization(proxy_parts)
+        return (scheme, parts.hostname, port, proxy), target
+
+    def _send(self, key, method, send, info):
+        """Returns the connection and the response of send(connection) on a pooled connection.
+
+        A request failing on a reused connection, which the server may have closed while it was idle, is sent
+        again on a new connection if the method is idempotent.
+        """
+        connection, reused = self.acquire(key)
+        try:
+            info["connect_seconds"] = 0.0 if reused else self._connect(connection)
+            return connection, send(connection)
+        except STALE_CONNECTION_ERRORS:
+            connection.close()
+            if not reused or method.upper() not in NexusRetryPolicy.IDEMPOTENT_METHODS:
+                raise
+        except (socket.error, http.client.HTTPException):
+            connection.close()
+            raise
+        connection = self._new_connection(key)
+        try:
+            info["connect_seconds"] = self._connect(connection)
+            return connection, send(connection)
+        except (socket.error, http.client.HTTPException):
+            connection.close()
+            raise
+
+    def request(self, url, method, data=None, headers=None):
+        """Sends a request over a pooled connection.
+
+        Returns a tuple of (response, info) following the same conventions as fetch_url, which means that
+        for HTTP errors (status >= 400) the response is None and the body is available as info['body'].
+        info['connect_seconds'] tells how long it took to connect, 0 if a pooled connection was reused.
+
+        Redirects are followed for GET and HEAD requests, up to MAX_REDIRECTS. A redirect of any other
+        request is returned as an error, as it cannot be followed without changing the method or resending
+        the body to another location.
+        """
+        headers = dict(headers or {})
+        headers.setdefault("User-Agent", get_user_agent())
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        for dummy in range(MAX_REDIRECTS + 1):
+            response, info = self._request_once(url, method, data, headers)
+            location = info.get("location")
+            if info["status"] not in REDIRECT_STATUS_CODES or not location:
+                return response, info
+            response.read()
+            response.close()
+            location = urljoin(url, location)
+            if method.upper() not in ("GET", "HEAD"):
+                info.update({"msg": f"Redirect of {method} request to {location} is not followed", "url": url})
+                return None, info
+            if urlsplit(location).netloc != urlsplit(url).netloc:
+                headers.pop("Authorization", None)
+                headers.pop("Cookie", None)
+            url = location
+        info["msg"] = f"Too many redirects, more than {MAX_REDIRECTS}"
+        return None, info
+
+    def _request_once(self, url, method, data, headers):
+        request_headers = dict(headers)
+        key, target = self._route(url, request_headers)
+
+        def send(connection):
+            connection.request(method, target, body=data, headers=request_headers)
+            return connection.getresponse()
+
+        with self._lock:
+            self.stats["requests"] += 1
+        info = {"url": url, "status": -1}
+        try:
+            connection, response = self._send(key, method, send, info)
+        except ssl.SSLError as e:
+            info.update({"msg": f"Request failed: {to_native(e)}", "status": -1})
+            return None, info
+        except (socket.error, http.client.HTTPException) as e:
+            info.update({"msg": f"Connection failure: {to_native(e)}", "status": -1})
+            return None, info
+        return self._response(response, PooledResponse(self, key, connection, response), info)
+
+    @staticmethod
+    def _response(response, pooled_response, info):
+        """Returns (response, info) like fetch_url for a response received by _send."""
+        # Lowercase header names and join duplicate headers the same way as fetch_url
+        response_headers = {}
+        for name, value in response.headers.items():
+            name = name.lower()
+            response_headers[name] = ", ".join((response_headers[name], value)) if name in response_headers else value
+        info.update(response_headers)
+        if response.status >= 400:
+            body = pooled_response.read()
+            pooled_response.close()
+            info.update(
+                {
+                    "msg": f"HTTP Error {response.status}: {response.reason}",
+                    "body": body,
+                    "status": response.status,
+                }
+            )
+            return None, info
+
+        info.update(
+            {
+                "msg": f"OK ({response.headers.get('Content-Length', 'unknown')} bytes)",
+                "status": response.status,
+            }
+        )
+        return pooled_response, info
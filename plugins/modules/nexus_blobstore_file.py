@@ -43,6 +43,8 @@ def create_blobstore(helper):
             else helper.module.params["name"]
         ),
     }
+    if helper.record_change(None, data):
+        return data, changed
 
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["blobstores"] + "/" + blobstore_type).format(
@@ -86,6 +88,8 @@ def update_blobstore(helper, current_data):
 
     if changed is False:
         return current_data, False
+    if helper.record_change(normalized_current_data[0], normalized_data):
+        return data, changed
 
     info, content = helper.request(
         api_url=(
@@ -131,7 +135,7 @@ def main():
     argument_spec.update(nexus_blobstore_commons.file_blob_store_api_model())
     module = AnsibleModule(
         argument_spec=argument_spec,
-        supports_check_mode=False,
+        supports_check_mode=True,
         required_together=[("username", "password")],
     )
 
@@ -156,7 +160,9 @@ def main():
             content, changed = create_blobstore(helper)
     else:
         if existing_blobstore:
-            content, changed = nexus_blobstore_commons.delete_blobstore(helper)
+            content, changed = nexus_blobstore_commons.delete_blobstore(
+                helper, existing_blobstore[0]
+            )
         else:
             changed = False
     result["json"] = content
@@ -28,11 +28,11 @@ RETURN = r"""
 
 
 def get_capability(helper, match_type):
-    _, content = helper.request(
+    _, content = helper.request_json_list(
         api_url=(helper.NEXUS_API_ENDPOINTS["capabilities"]).format(
             url=helper.module.params["url"],
         ),
-        method="GET",
+        item_filter=lambda item: item["type"] == match_type,
     )
 
     content_list = content["json"]
@@ -54,6 +54,8 @@ def create_capability(helper):
         "enabled": helper.module.params["enabled"],
         "properties": helper.module.params["properties"],
     }
+    if helper.record_change(None, data):
+        return data, changed
 
     info, content = helper.request(
         api_url=helper.NEXUS_API_ENDPOINTS["capabilities"].format(
@@ -96,6 +98,8 @@ def update_capability(helper, existing_data, capability_id):
 
     if changed is False:
         return existing_data, False
+    if helper.record_change(normalized_existing_data, normalized_data):
+        return data, changed
 
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["capabilities"] + "/{capability_id}").format(
@@ -121,8 +125,10 @@ def update_capability(helper, existing_data, capability_id):
     return content, changed
 
 
-def delete_capability(helper, capability_id):
+def delete_capability(helper, capability_id, existing_data):
     changed = True
+    if helper.record_change(existing_data, None):
+        return {}, changed
 
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["capabilities"] + "/{capability_id}").format(
@@ -164,7 +170,7 @@ def main():
 
     module = AnsibleModule(
         argument_spec=argument_spec,
-        supports_check_mode=False,
+        supports_check_mode=True,
         required_together=[("username", "password")],
     )
 
@@ -194,7 +200,7 @@ def main():
             content, changed = create_capability(helper)
     else:
         if capability_exists is True:
-            content, changed = delete_capability(helper, capability_id)
+            content, changed = delete_capability(helper, capability_id, existing_capability)
         else:
             changed = False
 
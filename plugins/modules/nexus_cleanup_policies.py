@@ -65,6 +65,8 @@ def create_cleanup_policy(helper):
                 "criteriaAssetRegex": helper.module.params["criteria_asset_regex"],
             }
         )
+    if helper.record_change(None, data):
+        return data, changed
 
     info, content = helper.request(
         api_url=get_api_endpoint(helper).format(url=helper.module.params["url"]),
@@ -122,6 +124,8 @@ def update_cleanup_policy(helper, existing_data):
 
     if changed is False:
         return existing_data, False
+    if helper.record_change(normalized_existing_data, normalized_data):
+        return data, changed
 
     info, content = helper.request(
         api_url=(get_api_endpoint(helper) + "/{name}").format(
@@ -147,7 +151,9 @@ def update_cleanup_policy(helper, existing_data):
     return content, changed
 
 
-def delete_cleanup_policy(helper):
+def delete_cleanup_policy(helper, existing_data):
+    if helper.record_change(existing_data, None):
+        return {}, True
     info, content = helper.request(
         api_url=(get_api_endpoint(helper) + "/{name}").format(
             url=helper.module.params["url"],
@@ -205,7 +211,7 @@ def main():
 
     module = AnsibleModule(
         argument_spec=argument_spec,
-        supports_check_mode=False,
+        supports_check_mode=True,
         required_together=[("username", "password")],
     )
 
@@ -230,7 +236,7 @@ def main():
             content, changed = create_cleanup_policy(helper)
     else:
         if policy_exists is True:
-            content, changed = delete_cleanup_policy(helper)
+            content, changed = delete_cleanup_policy(helper, existing_policy)
         else:
             changed = False
 
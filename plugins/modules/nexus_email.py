@@ -82,6 +82,8 @@ def update_email_setting(helper, existing_data):
 
     if not changed and not helper.module.params["authentication"]["password"]:
         return existing_data, False
+    if helper.record_change(normalized_current_data, normalized_data):
+        return data, changed
 
     info, content = helper.request(
         api_url=helper.NEXUS_API_ENDPOINTS["email"].format(
@@ -111,6 +113,8 @@ def delete_email_setting(helper, existing_data):
 
     if not existing_data["enabled"]:
         return existing_data, False
+    if helper.record_change(existing_data, None):
+        return {}, changed
 
     info, content = helper.request(
         api_url=helper.NEXUS_API_ENDPOINTS["email"].format(
@@ -175,7 +179,7 @@ def main():
     )
     module = AnsibleModule(
         argument_spec=argument_spec,
-        supports_check_mode=False,
+        supports_check_mode=True,
         required_together=[("username", "password")],
     )
 
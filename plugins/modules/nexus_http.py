@@ -104,6 +104,8 @@ def update_http_setting(helper: NexusHelper, existing_data):
     changed = not helper.is_json_data_equal(normalized_data, existing_data)
     if changed is False and not passwords_removed and not existing_passwords_removed:
         return existing_data, False
+    if helper.record_change(existing_data, normalized_data):
+        return data, changed
 
     info, content = helper.request(
         api_url=helper.NEXUS_API_ENDPOINTS["http"].format(
@@ -128,7 +130,9 @@ def update_http_setting(helper: NexusHelper, existing_data):
     return content, changed
 
 
-def delete_http_setting(helper: NexusHelper):
+def delete_http_setting(helper: NexusHelper, existing_data):
+    if helper.record_change(existing_data, None):
+        return {}, True
     info, content = helper.request(
         api_url=helper.NEXUS_API_ENDPOINTS["http"].format(
             url=helper.module.params["url"]
@@ -205,7 +209,7 @@ def main():
 
     module = AnsibleModule(
         argument_spec=argument_spec,
-        supports_check_mode=False,
+        supports_check_mode=True,
         required_together=[("username", "password")],
     )
 
@@ -218,7 +222,7 @@ def main():
     if module.params["state"] == "present":  # type: ignore
         content, changed = update_http_setting(helper, existing_setting)
     else:
-        content, changed = delete_http_setting(helper)
+        content, changed = delete_http_setting(helper, existing_setting)
     result = NexusHelper.generate_result_struct(changed, content)
 
     module.exit_json(**result)
@@ -0,0 +1,124 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
+    NexusHelper,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_purge
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_scheduler import DependencyCycleError
+
+DOCUMENTATION = r"""
+---
+module: nexus_purge
+short_description: Delete objects which are not in a set of names
+description:
+  - Lists the objects of O(kind) once and deletes those not named in O(names), up to O(max_concurrency) at the same time.
+    Group repositories are deleted before their members and roles before the roles they contain.
+  - Objects matching O(protect), the built-in admin and anonymous users and roles, and the user running the module
+    are never deleted. Only users and roles of the default source are deleted.
+  - Nothing is deleted if more than O(max_deletions) objects would be, -1 removes the limit.
+  - Cleanup policies are purged with the API of Nexus Repository Pro, set O(use_internal_api) to use the internal API
+    of the other editions at own risk, like M(haxorof.sonatype_nexus.nexus_cleanup_policies).
+  - Supports check mode and diff mode.
+"""
+
+EXAMPLES = r"""
+- name: Delete repositories which are not managed
+  haxorof.sonatype_nexus.nexus_purge:
+    kind: repositories
+    names: "{{ nexus_repositories | map(attribute='name') }}"
+    protect:
+      - maven-*
+    max_deletions: 5
+"""
+
+RETURN = r"""
+json:
+  description: Names of the objects deleted, or to delete in check mode, and of those kept because protected.
+  returned: always
+  type: dict
+"""
+
+
+def delete_in_waves(helper, kind, waves) -> tuple:
+    """Deletes the objects wave by wave, returns the errors per name and the names deleted."""
+    executor = helper.executor()
+    errors, deleted = {}, []
+    for wave in waves:
+        errors.update(
+            (outcome.item, outcome.value or outcome.error)
+            for outcome in executor.run(lambda name: nexus_purge.delete_object(helper, kind, name), wave)
+            if not outcome.ok or outcome.value
+        )
+        deleted.extend(name for name in wave if name not in errors)
+        # Objects referred to by an object which could not be deleted are still in use.
+        if errors:
+            break
+    return errors, deleted
+
+
+def main():
+    argument_spec = NexusHelper.nexus_argument_spec()
+    argument_spec.update(
+        {
+            "kind": {"type": "str", "required": True, "choices": list(nexus_purge.KINDS)},
+            "names": {"type": "list", "elements": "str", "required": True, "no_log": False},
+            "use_internal_api": {"type": "bool", "default": False},  # Use internal API at own risk
+        }
+    )
+    argument_spec.update(nexus_purge.purge_argument_spec())
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        required_together=[("username", "password")],
+    )
+
+    helper = NexusHelper(module)
+    kind = module.params["kind"]
+    unsupported_message = nexus_purge.unsupported_message(helper, kind)
+    if unsupported_message:
+        module.fail_json(msg=unsupported_message)
+    protect = list(module.params["protect"]) + list(nexus_purge.KINDS[kind].protected)
+    if kind == "users" and module.params["username"]:
+        protect.append(module.params["username"])
+
+    live_objects = nexus_purge.list_objects(helper, kind)
+    extras, protected = nexus_purge.purge_candidates(list(live_objects), module.params["names"], protect)
+    limit_message = nexus_purge.deletion_limit_message(extras, module.params["max_deletions"])
+    if limit_message:
+        module.fail_json(msg=limit_message)
+    try:
+        waves = nexus_purge.deletion_waves(kind, live_objects, extras)
+    except DependencyCycleError as e:
+        module.fail_json(msg=f"Cannot order the deletions: {e}")
+
+    content = {"deleted": extras, "protected": protected}
+    if extras and helper.record_change(
+        {"names": sorted(live_objects)}, {"names": sorted(set(live_objects) - set(extras))}
+    ):
+        module.exit_json(**NexusHelper.generate_result_struct(bool(extras), content))
+
+    errors, deleted = delete_in_waves(helper, kind, waves)
+    if errors:
+        content["deleted"] = deleted
+        module.fail_json(
+            msg=f"Failed to delete {len(errors)} of {len(extras)} {kind.replace('_', ' ')}: "
+            + "; ".join(f"{name}: {error}" for name, error in errors.items()),
+            changed=bool(content["deleted"]),
+            json=content,
+        )
+
+    module.exit_json(**NexusHelper.generate_result_struct(bool(extras), content))
+
+
+if __name__ == "__main__":
+    main()
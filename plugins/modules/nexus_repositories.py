@@ -0,0 +1,469 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
+    NexusHelper,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_repository_helper import (
+    REPOSITORY_DIFF_RULES,
+    NexusRepositoryHelper,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import (
+    nexus_diff,
+    nexus_purge,
+    nexus_repository_formats,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_repository_commons import (
+    REPOSITORY_FORMAT_ALIASES,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_repository_index import GROUP_MEMBERS
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_scheduler import (
+    DependencyCycleError,
+    dependency_waves,
+    referenced_names,
+    reversed_dependencies,
+)
+
+DOCUMENTATION = r"""
+---
+module: nexus_repositories
+short_description: Manage many repositories of mixed formats and types in one task
+description:
+  - Each item of O(repositories) takes the same options as the corresponding
+    C(nexus_repository_<format>_<type>) module plus O(repositories[].format) and O(repositories[].type).
+  - Existing repositories are listed once, then only the repositories which differ are created, updated or deleted.
+  - Repositories are created and updated in waves, group repositories after their members. Repositories are
+    deleted after that, group repositories before their members.
+  - Group members, blob stores, cleanup policies and routing rules referred to must exist or be created by the
+    same task, otherwise nothing is changed, in check mode a warning is given instead. Nothing is changed either
+    if group repositories are members of each other.
+  - Up to O(max_concurrency) repositories of a wave are created, updated or deleted at the same time.
+  - With O(purge), repositories which are not in O(repositories) are deleted, except those matching
+    O(purge_protect). Nothing is changed if more than O(purge_max_deletions) repositories would be purged,
+    -1 removes the limit.
+  - Supports check mode and diff mode, the diff contains one entry per repository to be changed.
+"""
+
+EXAMPLES = r"""
+- name: Manage repositories
+  haxorof.sonatype_nexus.nexus_repositories:
+    repositories:
+      - name: maven-releases
+        format: maven
+        type: hosted
+      - name: maven-central
+        format: maven
+        type: proxy
+        proxy:
+          remote_url: https://repo1.maven.org/maven2/
+      - name: maven-public
+        format: maven
+        type: group
+        group:
+          member_names:
+            - maven-releases
+            - maven-central
+      - name: npm-legacy
+        format: npm
+        type: hosted
+        state: absent
+
+- name: Manage repositories and delete all others, except the Docker repositories
+  haxorof.sonatype_nexus.nexus_repositories:
+    repositories:
+      - name: maven-releases
+        format: maven
+        type: hosted
+    purge: true
+    purge_protect:
+      - docker-*
+    purge_max_deletions: 20
+"""
+
+RETURN = r"""
+json:
+  description: Result per repository in the same order as O(repositories), followed by the repositories purged.
+  returned: always
+  type: list
+  elements: dict
+summary:
+  description: Number of repositories created, updated, deleted, unchanged and failed.
+  returned: always
+  type: dict
+"""
+
+# Objects other than repositories referred to by the request data: (kind, path of the names, endpoint).
+REFERENCES = (
+    ("blob store", ("storage", "blobStoreName"), "blobstores"),
+    ("cleanup policy", ("cleanup", "policyNames"), "cleanup-policies"),
+    ("routing rule", ("routingRuleName",), "routing-rules"),
+)
+
+
+def validate_repository_specs(module, repository_specs):
+    """Validates each repository spec against the options of its format and type.
+
+    Values of no_log options, e.g. proxy passwords, are added to the values masked in the module output.
+
+    Returns:
+        tuple: (list of validated parameters, list of error messages)
+    """
+    validated, errors, names = [], [], set()
+    for index, repository_spec in enumerate(repository_specs):
+        repository_format = repository_spec.get("format")
+        repository_type = repository_spec.get("type")
+        if not nexus_repository_formats.is_supported(repository_format, repository_type):
+            errors.append(
+                f"repositories[{index}]: unsupported format/type {repository_format}/{repository_type}, "
+                + f"supported formats are {', '.join(nexus_repository_formats.supported_formats())}"
+            )
+            continue
+        argument_spec = nexus_repository_formats.repository_argument_spec(repository_format, repository_type)
+        argument_spec.update(
+            {
+                "format": {"type": "str", "required": True},
+                "type": {"type": "str", "required": True},
+            }
+        )
+        result = ArgumentSpecValidator(argument_spec).validate(repository_spec)
+        # pylint: disable-next=protected-access
+        module.no_log_values.update(result._no_log_values)
+        if result.error_messages:
+            errors.extend(f"repositories[{index}]: {message}" for message in result.error_messages)
+            continue
+        params = result.validated_parameters
+        if params["name"] in names:
+            errors.append(f"repositories[{index}]: repository {params['name']} is listed more than once")
+            continue
+        names.add(params["name"])
+        validated.append(params)
+    return validated, errors
+
+
+def plan_repository(helper, params, existing_repositories):
+    """Decides what to do with one repository.
+
+    Returns:
+        dict: Result of the repository including action (create, update, delete or none) and
+            the request data if anything shall be done.
+    """
+    repository_format, repository_type = params["format"], params["type"]
+    definition = nexus_repository_formats.repository_definition(repository_format, repository_type)
+    existing = existing_repositories.get(params["name"])
+    result = {
+        "name": params["name"],
+        "format": repository_format,
+        "type": repository_type,
+        "action": "none",
+        "changed": False,
+    }
+    if params["state"] == "absent":
+        if existing is not None:
+            result.update({"action": "delete", "changed": True})
+        return result
+
+    if existing is not None and (
+        existing["format"] != REPOSITORY_FORMAT_ALIASES.get(repository_format, repository_format)
+        or existing["type"] != repository_type
+    ):
+        result["failed"] = True
+        result["msg"] = (
+            f"Repository {params['name']} exists as {existing['format']}/{existing['type']}, "
+            + "the format and type of a repository cannot be changed"
+        )
+        return result
+
+    data = NexusRepositoryHelper.repository_request_data(
+        repository_type,
+        params,
+        definition["request_data_additions"],
+        nexus_repository_formats.repository_key_table(repository_format, repository_type),
+    )
+    result["data"] = data
+    result["endpoint_path"] = definition["endpoint_path"]
+    if existing is None:
+        result.update({"action": "create", "changed": True})
+        return result
+
+    comparison = NexusRepositoryHelper.compare_repository(
+        helper,
+        data,
+        existing,
+        definition["api_response_normalization"],
+        definition["request_payload_normalization"],
+    )
+    if comparison.changed or comparison.got_password:
+        result.update({"action": "update", "changed": comparison.changed, "comparison": comparison})
+    return result
+
+
+def apply_repository(helper, result):
+    """Sends the request of a planned action and records the outcome in the result."""
+    repositories_endpoint = helper.NEXUS_API_ENDPOINTS["repositories"]
+    if result["action"] == "create":
+        api_url = (repositories_endpoint + "{path}").format(
+            url=helper.module.params["url"], path=result["endpoint_path"]
+        )
+        method, expected_status = "POST", [201]
+    elif result["action"] == "update":
+        api_url = (repositories_endpoint + "{path}/{name}").format(
+            url=helper.module.params["url"], path=result["endpoint_path"], name=result["name"]
+        )
+        method, expected_status = "PUT", [204]
+    else:
+        api_url = (repositories_endpoint + "/{name}").format(
+            url=helper.module.params["url"], name=result["name"]
+        )
+        method, expected_status = "DELETE", [204]
+
+    info, dummy = helper.request(api_url=api_url, method=method, data=result.get("data"))
+    if info["status"] in expected_status:
+        return
+    if result["action"] == "delete" and info["status"] == 404:
+        result["changed"] = False
+        return
+    result["changed"] = False
+    result["failed"] = True
+    if info["status"] == 403:
+        result["msg"] = "The user does not have permission to perform the operation."
+    else:
+        result["msg"] = (
+            f"Failed to {result['action']} repository {result['name']}, "
+            + f"http_status={info['status']}, error_msg='{info['msg']}', body={info.get('body')}"
+        )
+
+
+def check_references(helper, results, existing_repositories) -> list:
+    """Error messages about objects referred to by the repositories to create or update which do not exist.
+
+    Blob stores, cleanup policies and routing rules are only checked if Nexus allows listing them.
+    """
+    writes = [result for result in results if result["action"] in ("create", "update") and not result.get("failed")]
+    deleted = {result["name"] for result in results if result["action"] == "delete"}
+    created = {result["name"] for result in writes if result["action"] == "create"}
+    repositories = (set(existing_repositories) - deleted) | created
+    errors = [
+        f"repository {result['name']}: group member {member} does not exist"
+        + (" after it is deleted" if member in deleted else "")
+        for result in writes
+        for member in referenced_names(result["data"], GROUP_MEMBERS)
+        if member not in repositories
+    ]
+    for kind, path, endpoint in REFERENCES:
+        referring = [(result["name"], name) for result in writes for name in referenced_names(result["data"], path)]
+        if not referring:
+            continue
+        info, content = helper.request_json_list(
+            helper.NEXUS_API_ENDPOINTS[endpoint].format(url=helper.module.params["url"])
+        )
+        if info["status"] != 200:
+            continue
+        existing = {item["name"] for item in content.get("json") or []}
+        errors.extend(
+            f"repository {repository}: {kind} {name} does not exist"
+            for repository, name in referring
+            if name not in existing
+        )
+    return errors
+
+
+def action_waves(results, existing_repositories) -> list:
+    """Waves of actions to apply, the actions of a wave do not depend on each other.
+
+    Repositories are created and updated after the members of their group, then deleted before the members
+    of their group.
+
+    Raises:
+        DependencyCycleError: If group repositories are members of each other.
+
+    Returns:
+        list: (wave, names of the repositories which must have been changed first per repository name)
+    """
+    writes = {
+        result["name"]: result
+        for result in results
+        if result["action"] in ("create", "update") and not result.get("failed")
+    }
+    deletes = {
+        result["name"]: result for result in results if result["action"] == "delete" and not result.get("failed")
+    }
+    write_dependencies = {name: referenced_names(result["data"], GROUP_MEMBERS) for name, result in writes.items()}
+    delete_dependencies = reversed_dependencies(
+        {
+            name: [member for member in existing_repositories.members(name) if member in deletes]
+            for name in deletes
+        }
+    )
+    waves = []
+    for actions, dependencies in ((writes, write_dependencies), (deletes, delete_dependencies)):
+        waves.extend(
+            ([actions[name] for name in wave], dependencies) for wave in dependency_waves(dependencies)
+        )
+    return waves
+
+
+def repository_diff(helper, result, existing):
+    """Before/after diff of one planned repository action, without passwords."""
+    if result["action"] == "update":
+        # Normalized by compare_repository.
+        before, after = result["comparison"].before, result["comparison"].after
+    else:
+        before = NexusRepositoryHelper.comparable_repository(helper, existing) if existing else {}
+        after = helper.clean_dict_list(result["data"]) if result["action"] != "delete" else {}
+    before = helper.delete_all_password_keys(before)[1]
+    after = helper.delete_all_password_keys(after)[1]
+    if result["action"] == "update":
+        return nexus_diff.changes_to_diff(
+            helper.json_data_diff(before, after, REPOSITORY_DIFF_RULES), result["name"], result["name"]
+        )
+    return {
+        "before_header": result["name"],
+        "after_header": result["name"],
+        "before": before,
+        "after": after,
+    }
+
+
+def summarize(results):
+    summary = {"created": 0, "updated": 0, "deleted": 0, "unchanged": 0, "failed": 0}
+    for result in results:
+        if result.get("failed"):
+            summary["failed"] += 1
+        elif result["changed"]:
+            summary[{"create": "created", "update": "updated", "delete": "deleted"}[result["action"]]] += 1
+        else:
+            summary["unchanged"] += 1
+    return summary
+
+
+def purge_results(module, repository_params, existing_repositories) -> list:
+    """Results of the repositories to delete because they are not in O(repositories)."""
+    extras, dummy = nexus_purge.purge_candidates(
+        list(existing_repositories),
+        [params["name"] for params in repository_params],
+        module.params["purge_protect"],
+    )
+    limit_message = nexus_purge.deletion_limit_message(extras, module.params["purge_max_deletions"])
+    if limit_message:
+        module.fail_json(msg=limit_message)
+    return [
+        {
+            "name": name,
+            "format": existing_repositories[name]["format"],
+            "type": existing_repositories[name]["type"],
+            "action": "delete",
+            "changed": True,
+            "purged": True,
+        }
+        for name in extras
+    ]
+
+
+def apply_waves(helper, waves):
+    """Applies the actions wave by wave, actions depending on a failed action are not applied."""
+    executor = helper.executor()
+    failed = set()
+    for wave, dependencies in waves:
+        for result in wave:
+            failed_dependencies = [name for name in dependencies[result["name"]] if name in failed]
+            if failed_dependencies:
+                result.update(
+                    changed=False,
+                    failed=True,
+                    msg=f"Not {result['action']}d, depends on failed repositories {', '.join(failed_dependencies)}",
+                )
+        ready = [result for result in wave if not result.get("failed")]
+        for outcome in executor.run(lambda result: apply_repository(helper, result), ready):
+            if not outcome.ok:
+                outcome.item.update({"changed": False, "failed": True, "msg": outcome.error})
+        failed.update(result["name"] for result in wave if result.get("failed"))
+
+
+def main():
+    module = NexusRepositoryHelper.module_with_nexus_arguments(
+        {
+            # The options of all formats and types, so that secrets are masked before anything is logged, each
+            # repository is validated against the options of its format and type by validate_repository_specs.
+            "repositories": {
+                "type": "list",
+                "elements": "dict",
+                "required": True,
+                "options": dict(
+                    nexus_repository_formats.repository_options(),
+                    name={"type": "str", "no_log": False},
+                    format={"type": "str"},
+                    type={"type": "str"},
+                    state={"type": "str"},
+                ),
+            },
+            "purge": {"type": "bool", "default": False},
+            **nexus_purge.purge_argument_spec("purge_"),
+        }
+    )
+    helper = NexusHelper(module)
+
+    repository_params, errors = validate_repository_specs(
+        module, [nexus_repository_formats.drop_none(spec) for spec in module.params["repositories"]]
+    )
+    if errors:
+        module.fail_json(msg="Invalid repositories: " + "; ".join(errors))
+
+    existing_repositories = NexusRepositoryHelper.repository_index(helper)
+    results = [plan_repository(helper, params, existing_repositories) for params in repository_params]
+    if module.params["purge"]:
+        results.extend(purge_results(module, repository_params, existing_repositories))
+
+    # pylint: disable-next=protected-access
+    if module._diff:
+        helper.diff = [
+            repository_diff(helper, result, existing_repositories.get(result["name"]))
+            for result in results
+            if result["action"] != "none" and not result.get("failed")
+        ]
+
+    # Nothing is changed unless all references are known to be fine. In check mode earlier tasks may not
+    # have created the objects referred to.
+    errors = check_references(helper, results, existing_repositories)
+    if errors and module.check_mode:
+        for error in errors:
+            module.warn(f"Invalid reference: {error}")
+    elif errors:
+        module.fail_json(msg="Invalid references: " + "; ".join(errors))
+    try:
+        waves = action_waves(results, existing_repositories)
+    except DependencyCycleError as e:
+        module.fail_json(msg=f"Group repositories are members of each other: {e}")
+
+    # In check mode the planned actions are only reported.
+    if not module.check_mode:
+        apply_waves(helper, waves)
+
+    for result in results:
+        result.pop("data", None)
+        result.pop("endpoint_path", None)
+        result.pop("comparison", None)
+    changed = any(result["changed"] for result in results)
+    summary = summarize(results)
+    if summary["failed"]:
+        module.fail_json(
+            msg=f"Failed to reconcile {summary['failed']} of {len(results)} repositories",
+            changed=changed,
+            json=results,
+            summary=summary,
+        )
+
+    result = NexusHelper.generate_result_struct(changed, results, result_additions={"summary": summary})
+    module.exit_json(**result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import (
+    nexus_repository_formats,
+)
+
+DOCUMENTATION = r"""
+---
+module: nexus_repository
+short_description: Manage repositories of any format and type
+description:
+  - Manages one repository of O(format) and O(type), taking the same options as the corresponding
+    C(nexus_repository_<format>_<type>) module. Options which do not apply to the format and type are an error.
+  - Supports check mode and diff mode.
+"""
+
+EXAMPLES = r"""
+- name: Create a Maven proxy repository
+  haxorof.sonatype_nexus.nexus_repository:
+    format: maven
+    type: proxy
+    name: maven-central
+    proxy:
+      remote_url: https://repo1.maven.org/maven2/
+"""
+
+RETURN = r"""
+"""
+
+
+def main():
+    nexus_repository_formats.repository_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,11 +9,8 @@ from __future__ import absolute_import, division, print_function
 # pylint: disable-next=invalid-name
 __metaclass__ = type
 
-from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
-    NexusRepositoryHelper,
-)
 from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import (
-    nexus_repository_docker_commons,
+    nexus_repository_formats,
 )
 
 DOCUMENTATION = r"""
@@ -30,15 +27,7 @@ RETURN = r"""
 
 
 def main():
-    NexusRepositoryHelper.generic_repository_group_module(
-        endpoint_path="/docker/group",
-        arg_additions={
-            "docker": nexus_repository_docker_commons.docker_attributes(),
-        },
-        request_data_additions={
-            "docker": "camalize",
-        },
-    )
+    nexus_repository_formats.generic_repository_module("docker", "group")
 
 
 if __name__ == "__main__":
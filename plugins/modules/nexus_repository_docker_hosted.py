@@ -9,11 +9,8 @@ from __future__ import absolute_import, division, print_function
 # pylint: disable-next=invalid-name
 __metaclass__ = type
 
-from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
-    NexusRepositoryHelper,
-)
 from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import (
-    nexus_repository_docker_commons,
+    nexus_repository_formats,
 )
 
 DOCUMENTATION = r"""
@@ -29,27 +26,8 @@ RETURN = r"""
 """
 
 
-def docker_hosted_storage_attributes():
-    """Directly maps to DockerHostedStorageAttributes"""
-    ret_spec = NexusRepositoryHelper.hosted_storage_attributes()
-    ret_spec["options"]["latest_policy"] = {
-        "type": "bool",
-        "default": False,
-    }
-    return ret_spec
-
-
 def main():
-    NexusRepositoryHelper.generic_repository_hosted_module(
-        endpoint_path="/docker/hosted",
-        arg_additions={
-            "docker": nexus_repository_docker_commons.docker_attributes(),
-            "storage": docker_hosted_storage_attributes(),
-        },
-        request_data_additions={
-            "docker": "camalize",
-        },
-    )
+    nexus_repository_formats.generic_repository_module("docker", "hosted")
 
 
 if __name__ == "__main__":
@@ -9,11 +9,8 @@ from __future__ import absolute_import, division, print_function
 # pylint: disable-next=invalid-name
 __metaclass__ = type
 
-from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
-    NexusRepositoryHelper,
-)
 from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import (
-    nexus_repository_docker_commons,
+    nexus_repository_formats,
 )
 
 DOCUMENTATION = r"""
@@ -29,50 +26,8 @@ RETURN = r"""
 """
 
 
-def api_response_normalization(input_data):
-    if input_data.get("storage"):  # type: ignore
-        # Possibly this is returned for Docker proxy repos because it is based
-        # on same storage class as Docker hosted repos.
-        input_data["storage"].pop("writePolicy", None)  # type: ignore
-    return input_data
-
-
-def docker_proxy_attributes():
-    return {
-        "type": "dict",
-        "apply_defaults": True,
-        "options": {
-            "index_type": {
-                "type": "str",
-                "choices": ["HUB", "REGISTRY", "CUSTOM"],
-                "default": "REGISTRY",
-            },
-            "index_url": {"type": "str", "required": False, "no_log": False},
-            "cache_foreign_layers": {"type": "bool", "default": False},
-            "foreign_layer_url_whitelist": {
-                "type": "list",
-                "elements": "str",
-                "required": False,
-                "no_log": False,
-                "default": [],
-            },
-        },
-    }
-
-
 def main():
-    NexusRepositoryHelper.generic_repository_proxy_module(
-        endpoint_path="/docker/proxy",
-        api_response_normalization=api_response_normalization,
-        arg_additions={
-            "docker": nexus_repository_docker_commons.docker_attributes(),
-            "docker_proxy": docker_proxy_attributes(),
-        },
-        request_data_additions={
-            "docker": "camalize",
-            "docker_proxy": "camalize",
-        },
-    )
+    nexus_repository_formats.generic_repository_module("docker", "proxy")
 
 
 if __name__ == "__main__":
@@ -9,8 +9,8 @@ from __future__ import absolute_import, division, print_function
 # pylint: disable-next=invalid-name
 __metaclass__ = type
 
-from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
-    NexusRepositoryHelper,
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import (
+    nexus_repository_formats,
 )
 
 DOCUMENTATION = r"""
@@ -27,9 +27,7 @@ RETURN = r"""
 
 
 def main():
-    NexusRepositoryHelper.generic_repository_proxy_module(
-        endpoint_path="/helm/proxy",
-    )
+    nexus_repository_formats.generic_repository_module("helm", "proxy")
 
 
 if __name__ == "__main__":
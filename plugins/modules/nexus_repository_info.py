@@ -12,6 +12,8 @@ __metaclass__ = type
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
     NexusHelper,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_repository_helper import (
     NexusRepositoryHelper,
 )
 
@@ -19,32 +21,32 @@ DOCUMENTATION = r"""
 ---
 module: nexus_repository_info
 short_description: List repositories
+description:
+  - Lists the repositories matching all the given filters, e.g. those using a blob store, cleanup policy or
+    routing rule, the members of a group or the groups containing a repository.
 """
 
 EXAMPLES = r"""
+- name: Repositories using the default blob store
+  haxorof.sonatype_nexus.nexus_repository_info:
+    blob_store: default
 """
 
 RETURN = r"""
 """
 
 
-def generic_repositories_filter(item, helper):
-    match = True
-    if helper.module.params["type"] is not None:
-        match &= item["type"] == helper.module.params["type"]
-    if helper.module.params["format"] is not None:
-        match &= item["format"] == helper.module.params["format"]
-    if helper.module.params["name"] is not None:
-        match &= item["name"] == helper.module.params["name"]
-    return match
-
-
 def main():
     argument_spec = NexusHelper.nexus_argument_spec()
     argument_spec.update(
         name={"type": "str", "required": False, "no_log": False},
         type={"type": "str", "required": False, "no_log": False},
         format={"type": "str", "required": False, "no_log": False},
+        blob_store={"type": "str", "required": False, "no_log": False},
+        cleanup_policy={"type": "str", "required": False, "no_log": False},
+        routing_rule={"type": "str", "required": False, "no_log": False},
+        member_of={"type": "str", "required": False, "no_log": False},
+        contains={"type": "str", "required": False, "no_log": False},
     )
     module = AnsibleModule(
         argument_spec=argument_spec,
@@ -54,8 +56,13 @@ def main():
 
     helper = NexusHelper(module)
 
-    content = NexusRepositoryHelper.list_filtered_repositories(
-        helper, generic_repositories_filter
+    content = NexusRepositoryHelper.repository_index(helper).select(
+        **{
+            criterion: module.params[criterion]
+            for criterion in (
+                "name", "type", "format", "blob_store", "cleanup_policy", "routing_rule", "member_of", "contains"
+            )
+        }
     )
     result = NexusHelper.generate_result_struct(False, content)
 
@@ -9,11 +9,8 @@ from __future__ import absolute_import, division, print_function
 # pylint: disable-next=invalid-name
 __metaclass__ = type
 
-from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
-    NexusRepositoryHelper,
-)
 from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import (
-    nexus_repository_commons,
+    nexus_repository_formats,
 )
 
 DOCUMENTATION = r"""
@@ -30,36 +27,7 @@ RETURN = r"""
 
 
 def main():
-    NexusRepositoryHelper.generic_repository_hosted_module(
-        endpoint_path="/maven/hosted",
-        request_payload_normalization=nexus_repository_commons.hosted_repo_request_payload_normalization,
-        arg_additions={
-            "maven": {
-                "type": "dict",
-                "apply_defaults": True,
-                "options": {
-                    "version_policy": {
-                        "type": "str",
-                        "choices": ["RELEASE", "SNAPSHOT", "MIXED"],
-                        "default": "RELEASE",
-                    },
-                    "layout_policy": {
-                        "type": "str",
-                        "choices": ["STRICT", "PERMISSIVE"],
-                        "default": "STRICT",
-                    },
-                    "content_disposition": {
-                        "type": "str",
-                        "choices": ["INLINE", "ATTACHMENT"],
-                        "default": "INLINE",
-                    },
-                },
-            },
-        },
-        request_data_additions={
-            "maven": "camalize",
-        },
-    )
+    nexus_repository_formats.generic_repository_module("maven", "hosted")
 
 
 if __name__ == "__main__":
@@ -9,8 +9,8 @@ from __future__ import absolute_import, division, print_function
 # pylint: disable-next=invalid-name
 __metaclass__ = type
 
-from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
-    NexusRepositoryHelper,
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import (
+    nexus_repository_formats,
 )
 
 DOCUMENTATION = r"""
@@ -27,25 +27,7 @@ RETURN = r"""
 
 
 def main():
-    NexusRepositoryHelper.generic_repository_hosted_module(
-        endpoint_path="/raw/hosted",
-        arg_additions={
-            "raw": {
-                "type": "dict",
-                "apply_defaults": True,
-                "options": {
-                    "content_disposition": {
-                        "type": "str",
-                        "choices": ["ATTACHMENT", "INLINE"],
-                        "default": "ATTACHMENT",
-                    },
-                },
-            },
-        },
-        request_data_additions={
-            "raw": "camalize",
-        },
-    )
+    nexus_repository_formats.generic_repository_module("raw", "hosted")
 
 
 if __name__ == "__main__":
@@ -9,8 +9,8 @@ from __future__ import absolute_import, division, print_function
 # pylint: disable-next=invalid-name
 __metaclass__ = type
 
-from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
-    NexusRepositoryHelper,
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import (
+    nexus_repository_formats,
 )
 
 DOCUMENTATION = r"""
@@ -26,31 +26,8 @@ RETURN = r"""
 """
 
 
-def api_response_normalization(normalized_existing_data):
-    if normalized_existing_data.get("storage"):  # type: ignore
-        normalized_existing_data["storage"].pop("writePolicy", None)  # type: ignore
-    return normalized_existing_data
-
-
 def main():
-    NexusRepositoryHelper.generic_repository_proxy_module(
-        endpoint_path="/raw/proxy",
-        api_response_normalization=api_response_normalization,
-        arg_additions={
-            "raw": {
-                "type": "dict",
-                "apply_defaults": True,
-                "options": {
-                    "content_disposition": {
-                        "type": "str",
-                        "choices": ["ATTACHMENT", "INLINE"],
-                        "default": "ATTACHMENT",
-                    },
-                },
-            },
-        },
-        request_data_additions={"raw": "camalize"},
-    )
+    nexus_repository_formats.generic_repository_module("raw", "proxy")
 
 
 if __name__ == "__main__":
@@ -13,6 +13,9 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
     NexusHelper,
 )
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_diff import (
+    DiffRules,
+)
 
 DOCUMENTATION = r"""
 ---
@@ -38,6 +41,9 @@ RETURN = r"""
 """
 
 
+ROLE_DIFF_RULES = DiffRules(order_insensitive=("privileges", "roles"))
+
+
 def list_role(helper, role_id):
     """Fetch a role's details from Nexus, ensuring source=default is included."""
     info, content = helper.request(
@@ -72,6 +78,8 @@ def create_role(helper):
         "privileges": helper.module.params["privileges"],
         "roles": helper.module.params["roles"],
     }
+    if helper.record_change(None, data):
+        return data, changed
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["roles"]).format(
             url=helper.module.params["url"]
@@ -91,9 +99,11 @@ def create_role(helper):
     return content, changed
 
 
-def delete_role(helper):
+def delete_role(helper, existing_role):
     """Delete an existing role from Nexus."""
     changed = True
+    if helper.record_change(existing_role, None):
+        return {}, changed
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["roles"] + "/{id}").format(
             url=helper.module.params["url"],
@@ -132,21 +142,17 @@ def update_role(helper, existing_role):
         data["description"] = helper.module.params["description"]
     if helper.module.params["privileges"]:
         data["privileges"] = helper.module.params["privileges"]
-        data["privileges"].sort()
     if helper.module.params["roles"]:
         data["roles"] = helper.module.params["roles"]
-        data["roles"].sort()
 
     existing_role.pop("readOnly", None)
     existing_role.pop("source", None)
-    if existing_role["privileges"]:
-        existing_role["privileges"].sort()
-    if existing_role["roles"]:
-        existing_role["roles"].sort()
 
-    changed = not helper.is_json_data_equal(data, existing_role)
+    changed = not helper.is_json_data_equal(data, existing_role, ROLE_DIFF_RULES)
     if not changed:
         return existing_role, changed
+    if helper.record_change(existing_role, data):
+        return data, changed
 
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["roles"] + "/{id}").format(
@@ -202,7 +208,7 @@ def main():
 
     module = AnsibleModule(
         argument_spec=argument_spec,
-        supports_check_mode=False,
+        supports_check_mode=True,
         required_together=[("username", "password")],
     )
 
@@ -220,7 +226,7 @@ def main():
             content, changed = create_role(helper)
     else:
         if existing_role:
-            content, changed = delete_role(helper)
+            content, changed = delete_role(helper, existing_role)
 
     result = NexusHelper.generate_result_struct(changed, content)
 
@@ -52,11 +52,10 @@ def get_role(helper):
 
 
 def list_roles(helper):
-    info, content = helper.request(
+    info, content = helper.request_json_list(
         api_url=(helper.NEXUS_API_ENDPOINTS["roles"]).format(
             url=helper.module.params["url"],
         ),
-        method="GET",
     )
     if info["status"] in [200]:
         content = content["json"]
@@ -48,6 +48,8 @@ def create_routing_rule(helper: NexusHelper):
         "mode": helper.module.params["mode"],
         "matchers": helper.module.params["matchers"],
     }
+    if helper.record_change(None, data):
+        return data, changed
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["routing-rules"]).format(
             url=helper.module.params["url"],
@@ -74,8 +76,10 @@ def create_routing_rule(helper: NexusHelper):
     return content, changed
 
 
-def delete_routing_rule(helper: NexusHelper):
+def delete_routing_rule(helper: NexusHelper, current_data):
     changed = True
+    if helper.record_change(current_data, None):
+        return {}, changed
 
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["routing-rules"] + "/{name}").format(
@@ -110,6 +114,10 @@ def update_routing_rule(helper: NexusHelper, current_data):
         "matchers": helper.module.params["matchers"],
     }
     changed = not helper.is_json_data_equal(data, current_data)
+    if not changed:
+        return current_data, changed
+    if helper.record_change(current_data, data):
+        return data, changed
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["routing-rules"] + "/{name}").format(
             url=helper.module.params["url"],
@@ -170,7 +178,7 @@ def main():
     )
     module = AnsibleModule(
         argument_spec=argument_spec,
-        supports_check_mode=False,
+        supports_check_mode=True,
         required_together=[("username", "password")],
     )
 
@@ -186,7 +194,7 @@ def main():
             content, changed = create_routing_rule(helper)
     else:
         if rule_exists:
-            content, changed = delete_routing_rule(helper)
+            content, changed = delete_routing_rule(helper, existing_rule)
         else:
             changed = False
     result = NexusHelper.generate_result_struct(
@@ -35,6 +35,8 @@ def create_script(helper):
         "type": "groovy",
         "content": helper.module.params["content"],
     }
+    if helper.record_change(None, data):
+        return data, changed
     info, content = helper.request(
         api_url=helper.NEXUS_API_ENDPOINTS["script"].format(
             url=helper.module.params["url"]
@@ -54,8 +56,10 @@ def create_script(helper):
     return content, changed
 
 
-def delete_script(helper):
+def delete_script(helper, existing_script):
     changed = True
+    if helper.record_change(existing_script, None):
+        return {}, changed
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["script"] + "/{name}").format(
             url=helper.module.params["url"],
@@ -87,6 +91,8 @@ def update_script(helper, existing_script):
     }
     if helper.is_json_data_equal(data, existing_script):
         return existing_script, False
+    if helper.record_change(existing_script, data):
+        return data, changed
 
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["script"] + "/{name}").format(
@@ -116,7 +122,9 @@ def manage_script(helper):
     changed = True
 
     if state == "present":
-        existing_scripts = nexus_script_commons.list_scripts(helper)
+        existing_scripts = nexus_script_commons.list_scripts(
+            helper, lambda script: script["name"] == helper.module.params["name"]
+        )
         existing_script = next(
             (
                 script
@@ -130,7 +138,7 @@ def manage_script(helper):
         else:
             content, changed = create_script(helper)
     else:
-        content, changed = delete_script(helper)
+        content, changed = delete_script(helper, None)
 
     return content, changed
 
@@ -150,7 +158,7 @@ def main():
     )
     module = AnsibleModule(
         argument_spec=argument_spec,
-        supports_check_mode=False,
+        supports_check_mode=True,
         required_together=[("username", "password")],
     )
 
@@ -159,22 +167,24 @@ def main():
     content = {}
     changed = False
 
+    existing_scripts = nexus_script_commons.list_scripts(
+        helper, lambda script: script["name"] == module.params["name"]  # type: ignore
+    )
+    existing_script = next(
+        (
+            script
+            for script in existing_scripts
+            if script["name"] == module.params["name"]  # type: ignore
+        ),
+        None,
+    )
     if module.params["state"] == "present":  # type: ignore
-        existing_scripts = nexus_script_commons.list_scripts(helper)
-        existing_script = next(
-            (
-                script
-                for script in existing_scripts
-                if script["name"] == module.params["name"]  # type: ignore
-            ),
-            None,
-        )
         if existing_script:
             content, changed = update_script(helper, existing_script)
         else:
             content, changed = create_script(helper)
-    else:
-        content, changed = delete_script(helper)
+    elif existing_script:
+        content, changed = delete_script(helper, existing_script)
 
     result = NexusHelper.generate_result_struct(changed, content)
 
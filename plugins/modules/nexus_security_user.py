@@ -13,6 +13,9 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import (
     NexusHelper,
 )
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_diff import (
+    DiffRules,
+)
 
 DOCUMENTATION = r"""
 ---
@@ -27,15 +30,17 @@ RETURN = r"""
 """
 
 
+USER_DIFF_RULES = DiffRules(order_insensitive=("roles",))
+
+
 def list_users(helper):
-    info, content = helper.request(
+    info, content = helper.request_json_list(
         api_url=(
             helper.NEXUS_API_ENDPOINTS["users"]
             + helper.generate_url_query({"userId": "user_id", "source": "source"})
         ).format(
             url=helper.module.params["url"],
         ),
-        method="GET",
     )
     if info["status"] in [200]:
         content = content["json"]
@@ -60,6 +65,8 @@ def create_user(helper):
         "status": helper.module.params["status"],
         "userId": helper.module.params["user_id"],
     }
+    if helper.record_change(None, data):
+        return data, changed
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["users"]).format(
             url=helper.module.params["url"],
@@ -79,8 +86,10 @@ def create_user(helper):
     return content, changed
 
 
-def delete_user(helper):
+def delete_user(helper, existing_user):
     changed = True
+    if helper.record_change(existing_user, None):
+        return {}, changed
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["users"] + "/{user_id}").format(
             url=helper.module.params["url"],
@@ -171,8 +180,10 @@ def update_user(helper, existing_user):
                 "roles": existing_user["roles"],
             }
         )
-    if helper.is_json_data_equal(data, existing_user):
+    if helper.is_json_data_equal(data, existing_user, USER_DIFF_RULES):
         return existing_user, False
+    if helper.record_change(existing_user, data):
+        return data, changed
 
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["users"] + "/{user_id}").format(
@@ -234,7 +245,7 @@ def main():
     )
     module = AnsibleModule(
         argument_spec=argument_spec,
-        supports_check_mode=False,
+        supports_check_mode=True,
         required_together=[("username", "password")],
     )
 
@@ -247,7 +258,7 @@ def main():
         if module.params["state"] == "present":  # type: ignore
             content, changed = update_user(helper, existing_user[0])
         else:
-            content, changed = delete_user(helper)
+            content, changed = delete_user(helper, existing_user[0])
     else:
         if module.params["state"] == "present":  # type: ignore
             content, changed = create_user(helper)
@@ -28,7 +28,7 @@ RETURN = r"""
 
 
 def list_users(helper):
-    info, content = helper.request(
+    info, content = helper.request_json_list(
         api_url=(
             helper.NEXUS_API_ENDPOINTS["users"]
             + helper.generate_url_query(
@@ -40,7 +40,6 @@ def list_users(helper):
         ).format(
             url=helper.module.params["url"],
         ),
-        method="GET",
     )
     if info["status"] in [200]:
         content = content["json"]
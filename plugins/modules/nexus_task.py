@@ -76,6 +76,8 @@ def create_task(helper):
         },
         "properties": NexusHelper.camalize_param(helper, "properties"),
     }
+    if helper.record_change(None, data):
+        return data, True
     info, content = helper.request(
         api_url=helper.NEXUS_API_ENDPOINTS["tasks"].format(
             url=helper.module.params["url"]
@@ -116,6 +118,11 @@ def update_task(helper, task_id, existing_data):
         changed = False
     else:
         changed = True
+    if changed:
+        if helper.record_change(existing_data, data):
+            return data, changed
+    elif helper.module.check_mode:
+        return existing_data, changed
 
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["tasks"] + "/{task_id}").format(
@@ -138,7 +145,9 @@ def update_task(helper, task_id, existing_data):
     return content, changed
 
 
-def delete_task(helper, task_id):
+def delete_task(helper, task_id, existing_data):
+    if helper.record_change(existing_data, None):
+        return {}, True
     info, content = helper.request(
         api_url=(helper.NEXUS_API_ENDPOINTS["tasks"] + "/{task_id}").format(
             url=helper.module.params["url"],
@@ -206,7 +215,7 @@ def main():
     )
     module = AnsibleModule(
         argument_spec=argument_spec,
-        supports_check_mode=False,
+        supports_check_mode=True,
         required_together=[("username", "password")],
     )
 
@@ -223,7 +232,7 @@ def main():
             content, changed = create_task(helper)
     else:
         if task_exists is True:
-            content, changed = delete_task(helper, task_id)
+            content, changed = delete_task(helper, task_id, existing_task)
         else:
             changed = False
 
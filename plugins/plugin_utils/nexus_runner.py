@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+"""Runs the modules of the collection in the current process, used on the controller only.
+
+This relies on private parts of ansible-core, which AnsiballZ otherwise sets up in a new process: the module
+arguments are given through ansible.module_utils.basic._ANSIBLE_ARGS and the warnings of the previous module are
+cleared from ansible.module_utils.common.warnings._global_warnings and _global_deprecations. These are only known
+to work with the ansible-core versions in SUPPORTED_ANSIBLE_CORE, check is_supported() before run_module().
+"""
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable-next=invalid-name
+__metaclass__ = type
+
+import contextlib
+import importlib
+import io
+import json
+
+from ansible.module_utils import basic
+from ansible.module_utils.common import warnings
+from ansible.module_utils.common.json import AnsibleJSONEncoder
+from ansible.module_utils.common.text.converters import to_bytes
+from ansible.release import __version__ as ansible_core_version
+
+MODULES_PACKAGE = "ansible_collections.haxorof.sonatype_nexus.plugins.modules"
+
+# Range of ansible-core versions, (minimum, maximum exclusive), with the private parts used here.
+# ansible-core 2.19 changed how modules load their arguments and how warnings are kept.
+SUPPORTED_ANSIBLE_CORE = ((2, 16), (2, 19))
+
+
+def is_supported(version=ansible_core_version):
+    """True if run_module() supports the ansible-core version."""
+    try:
+        major_minor = tuple(int(part) for part in version.split(".")[:2])
+    except ValueError:
+        return False
+    return SUPPORTED_ANSIBLE_CORE[0] <= major_minor < SUPPORTED_ANSIBLE_CORE[1]
+
+
+def run_module(module_name, module_args):
+    """Runs module main() with module_args like AnsiballZ would.
+
+    Returns:
+        tuple: (module output, exit code)
+    """
+    module = importlib.import_module(f"{MODULES_PACKAGE}.{module_name}")
+    # Warnings and deprecations of previous modules run in this process.
+    # pylint: disable=protected-access
+    del warnings._global_warnings[:]
+    del warnings._global_deprecations[:]
+    basic._ANSIBLE_ARGS = to_bytes(
+        json.dumps({"ANSIBLE_MODULE_ARGS": module_args}, cls=AnsibleJSONEncoder, vault_to_text=True)
+    )
+    # pylint: enable=protected-access
+    output = io.StringIO()
+    exit_code = 0
+    with contextlib.redirect_stdout(output):
+        try:
+            module.main()
+        except SystemExit as exit_exception:
+            exit_code = exit_exception.code or 0
+    return output.getvalue(), exit_code
@@ -17,8 +17,11 @@ SAMPLES=(
     "nexus_cleanup_policies_internal"
     "nexus_email"
     "nexus_license"
+    "nexus_purge"
     #"nexus_read_only"
     "nexus_repository_info"
+    "nexus_repositories"
+    "nexus_repository"
     "nexus_repository_docker_hosted"
     "nexus_repository_docker_proxy"
     "nexus_repository_docker_group"
@@ -58,6 +61,12 @@ SAMPLES=(
     "nexus_security_user_sources_info"
     "nexus_security_user"
     "nexus_status_info"
+    "connection_pooling"
+    "json_streaming"
+    "compression"
+    "http_cache"
+    "state_cache"
+    "auth_mode_session"
 )
 
 SAMPLES_PRO=(
@@ -0,0 +1,472 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+"""Plans and applies a desired-state file of Nexus resources without Ansible playbooks.
+
+Usage:
+    python -m ansible_collections.haxorof.sonatype_nexus.scripts.nexus_apply plan|apply STATE_FILE
+
+Runs on the controller, with ansible-core installed, and the collection must be importable, e.g. with
+PYTHONPATH=~/.ansible/collections. Each resource of the state file is managed by the module of its section,
+run in this process with shared connections and a snapshot of the list endpoints, plan runs the modules in
+check mode.
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+
+import yaml
+
+from ansible.module_utils.common.json import AnsibleJSONEncoder
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_diff
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus import NexusHelper
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_scheduler import (
+    DependencyCycleError,
+    dependency_waves,
+    find_cycle,
+    referenced_names,
+    reversed_dependencies,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.plugin_utils.nexus_runner import (
+    SUPPORTED_ANSIBLE_CORE,
+    ansible_core_version,
+    is_supported,
+    run_module,
+)
+
+# Sections of the state file: (section, module, option naming a resource). Each item of a section takes the
+# options of its module. Repositories are managed by nexus_repositories invocations, settings are single
+# resources named by their key.
+SECTIONS = (
+    ("blob_stores", "nexus_blobstore_file", "name"),
+    ("cleanup_policies", "nexus_cleanup_policies", "name"),
+    ("routing_rules", "nexus_routing_rule", "name"),
+    ("repositories", "nexus_repositories", "name"),
+    ("roles", "nexus_roles", "id"),
+    ("ldap_servers", "nexus_security_ldap", "ldap_name"),
+    ("users", "nexus_security_user", "user_id"),
+    ("tasks", "nexus_task", "name"),
+    ("settings", None, None),
+)
+
+# Resources are created and updated after the resources they refer to, and deleted before them:
+# (section, path of the options naming the resources referred to, section of the resources referred to).
+REFERENCES = (
+    ("repositories", ("storage", "blob_store_name"), "blob_stores"),
+    ("repositories", ("cleanup", "policy_names"), "cleanup_policies"),
+    ("repositories", ("routing_rule_name",), "routing_rules"),
+    ("repositories", ("group", "member_names"), "repositories"),
+    ("roles", ("roles",), "roles"),
+    ("users", ("roles",), "roles"),
+    ("tasks", ("properties", "blobstoreName"), "blob_stores"),
+    ("tasks", ("properties", "repositoryName"), "repositories"),
+)
+
+# Sections which can be purged, in the order they are purged, see purge_invocations.
+PURGE_SECTIONS = ("users", "repositories", "roles", "routing_rules", "cleanup_policies")
+
+SETTINGS_MODULES = {
+    "email": "nexus_email",
+    "http": "nexus_http",
+    "anonymous": "nexus_security_anonymous",
+}
+
+# Defaults of the nexus section, which has the options common to all modules, e.g. url and username.
+# With connection_pooling only GET and HEAD requests follow redirects, url must not be redirected.
+CONNECTION_DEFAULTS = {
+    "connection_pooling": True,
+    "state_cache": True,
+}
+
+# Modules of the sections which do not support check mode, resources managed by them cannot be planned.
+NO_CHECK_MODE_MODULES = ("nexus_security_ldap", "nexus_security_anonymous")
+
+ACTION_SYMBOLS = {
+    "create": "+",
+    "update": "~",
+    "delete": "-",
+    "none": " ",
+    "unknown": "?",
+}
+
+
+def load_state(path) -> dict:
+    """Reads a YAML or JSON state file."""
+    with open(path, encoding="utf-8") as f:
+        state = yaml.safe_load(f) or {}
+    if not isinstance(state, dict):
+        raise ValueError(f"{path}: the state file must be a mapping of sections")
+    known = {section for section, dummy, dummy in SECTIONS} | {"nexus", "purge"}
+    unknown = sorted(set(state) - known)
+    if unknown:
+        raise ValueError(
+            f"{path}: unknown sections {', '.join(unknown)}, known sections are {', '.join(sorted(known))}"
+        )
+    return state
+
+
+def resources(state) -> dict:
+    """Resources of a state file per (section, name), in the order of SECTIONS and of the file."""
+    declared = {}
+    for section, module_name, name_option in SECTIONS:
+        if section == "settings":
+            items = state.get(section) or {}
+            unknown = sorted(set(items) - set(SETTINGS_MODULES))
+            if unknown:
+                raise ValueError(
+                    f"settings: unknown {', '.join(unknown)}, known settings are {', '.join(SETTINGS_MODULES)}"
+                )
+            for key, settings_module in SETTINGS_MODULES.items():
+                if key in items:
+                    declared[(section, key)] = (settings_module, dict(items[key] or {}))
+            continue
+        for index, item in enumerate(state.get(section) or []):
+            if not isinstance(item, dict) or name_option not in item:
+                raise ValueError(f"{section}[{index}]: each item must be a mapping with {name_option}")
+            key = (section, str(item[name_option]))
+            if key in declared:
+                raise ValueError(f"{section}[{index}]: {key[1]} is listed more than once")
+            declared[key] = (module_name, dict(item))
+    return declared
+
+
+def is_absent(resource) -> bool:
+    return resource[1].get("state") == "absent"
+
+
+def invocation_key(key, resource):
+    """Repositories are managed by one nexus_repositories invocation for those to delete and one for the others."""
+    if key[0] == "repositories":
+        return ("repositories", "absent" if is_absent(resource) else "present")
+    return key
+
+
+def resource_references(declared, purged) -> dict:
+    """(section, name) of the declared resources each resource refers to.
+
+    Raises:
+        ValueError: If a resource refers to a resource to delete or purge.
+    """
+    references, errors = {}, []
+    for key, resource in declared.items():
+        references[key] = []
+        for section, path, target_section in REFERENCES:
+            if section != key[0]:
+                continue
+            for name in referenced_names(resource[1], path):
+                target = declared.get((target_section, str(name)))
+                if target is None:
+                    if target_section in purged and not is_absent(resource):
+                        errors.append(f"{key[0]}/{key[1]} refers to {target_section}/{name} which is purged")
+                    continue
+                if is_absent(target) and not is_absent(resource):
+                    errors.append(f"{key[0]}/{key[1]} refers to {target_section}/{name} which is deleted")
+                references[key].append((target_section, str(name)))
+    if errors:
+        raise ValueError("; ".join(errors))
+    return references
+
+
+def invocation_waves(declared, references) -> list:
+    """Waves of invocation keys, resources to create or update first, then resources to delete.
+
+    Raises:
+        DependencyCycleError: If resources refer to each other.
+    """
+    waves = []
+    for absent in (False, True):
+        keys = [key for key, resource in declared.items() if is_absent(resource) == absent]
+        # Cycles within nexus_repositories invocations, e.g. groups being members of each other.
+        cycle = find_cycle({key: references[key] for key in keys})
+        if cycle:
+            raise DependencyCycleError([f"{section}/{name}" for section, name in cycle])
+        dependencies = {}
+        for key in keys:
+            node = invocation_key(key, declared[key])
+            dependencies.setdefault(node, [])
+            for target in references[key]:
+                target_node = invocation_key(target, declared[target])
+                if target_node != node and target_node not in dependencies[node]:
+                    dependencies[node].append(target_node)
+        if absent:
+            dependencies = reversed_dependencies(dependencies)
+        try:
+            waves.extend(dependency_waves(dependencies))
+        except DependencyCycleError as e:
+            raise DependencyCycleError([f"{section}/{name}" for section, name in e.cycle]) from e
+    return waves
+
+
+def invocation(declared, node) -> tuple:
+    """(section, resource name, module, module options) of the invocation of an invocation key."""
+    if node[0] != "repositories":
+        return node[0], node[1], declared[node][0], declared[node][1]
+    repositories = [
+        resource[1]
+        for key, resource in declared.items()
+        if key[0] == "repositories" and invocation_key(key, resource) == node
+    ]
+    return "repositories", None, "nexus_repositories", {"repositories": repositories}
+
+
+def purge_invocations(declared, purge) -> list:
+    """nexus_purge invocations, one per wave, of the sections to purge.
+
+    The sections are purged one after the other, the objects of a section refer to those of later sections.
+    """
+    waves = []
+    for section in PURGE_SECTIONS:
+        if section in (purge.get("sections") or []):
+            options = {
+                "kind": section,
+                "names": [name for key_section, name in declared if key_section == section],
+                "protect": purge.get("protect") or [],
+            }
+            for option in ("max_deletions", "use_internal_api"):
+                if option in purge:
+                    options[option] = purge[option]
+            waves.append([(section, None, "nexus_purge", options)])
+    return waves
+
+
+def schedule(state) -> list:
+    """Module invocations applying a state file in waves, the invocations of a wave do not depend on each other.
+
+    Resources are created and updated after the resources they refer to, then resources are deleted before
+    the resources they refer to. References to resources not in the state file are left to the modules.
+    Purged sections are purged last.
+
+    Raises:
+        ValueError: If a resource refers to a resource to delete or purge.
+        DependencyCycleError: If resources refer to each other.
+
+    Returns:
+        list: Waves, each a list of (section, resource name, module, module options) per invocation. The
+            resource name is None for nexus_repositories and nexus_purge invocations.
+    """
+    declared = resources(state)
+    purge = state.get("purge") or {}
+    purged = purge.get("sections") or []
+    unknown = sorted(set(purged) - set(PURGE_SECTIONS))
+    if unknown:
+        raise ValueError(
+            f"purge: unknown sections {', '.join(unknown)}, "
+            + f"sections which can be purged are {', '.join(PURGE_SECTIONS)}"
+        )
+    waves = invocation_waves(declared, resource_references(declared, purged))
+    return [[invocation(declared, node) for node in wave] for wave in waves] + purge_invocations(declared, purge)
+
+
+def check_plannable(waves):
+    """Raises ValueError if an invocation of the waves runs a module which does not support check mode."""
+    unplannable = [
+        f"{section}/{name}"
+        for wave in waves
+        for section, name, module_name, dummy in wave
+        if module_name in NO_CHECK_MODE_MODULES
+    ]
+    if unplannable:
+        raise ValueError(
+            f"plan: {', '.join(unplannable)} cannot be planned, "
+            + f"{' and '.join(NO_CHECK_MODE_MODULES)} do not support check mode"
+        )
+
+
+def change_action(changed, diff) -> str:
+    """create, update, delete or none, unknown if a change is reported without a diff."""
+    if not changed:
+        return "none"
+    if not isinstance(diff, dict) or "before" not in diff:
+        return "unknown"
+    # The diff of an update only has the changed paths, none if only write-only values are sent.
+    if not diff["before"] and diff["after"]:
+        return "create"
+    if diff["before"] and not diff["after"]:
+        return "delete"
+    return "update"
+
+
+def resource_entries(section, name, module_name, result) -> list:
+    """Plan/apply entries of the resources managed by one module invocation."""
+    if module_name == "nexus_purge" and not result.get("failed"):
+        return [
+            {
+                "section": section,
+                "name": deleted,
+                "action": "delete",
+                "changed": True,
+                "failed": False,
+                "msg": "purged",
+                "diff": None,
+            }
+            for deleted in result["json"]["deleted"]
+        ]
+    if name is None and module_name == "nexus_repositories":
+        # nexus_repositories, one result and diff per repository.
+        diffs = {diff.get("before_header"): diff for diff in result.get("diff") or []}
+        entries = [
+            {
+                "section": section,
+                "name": item["name"],
+                "action": item["action"] if item["action"] in ACTION_SYMBOLS else "unknown",
+                "changed": item["changed"],
+                "failed": bool(item.get("failed")),
+                "msg": item.get("msg"),
+                "diff": diffs.get(item["name"]),
+            }
+            for item in result.get("json") or []
+        ]
+        if entries or not result.get("failed"):
+            return entries
+    diff = result.get("diff")
+    return [
+        {
+            "section": section,
+            "name": name or "*",
+            "action": "unknown" if result.get("skipped") else change_action(result.get("changed"), diff),
+            "changed": bool(result.get("changed")),
+            "failed": bool(result.get("failed")),
+            "msg": result.get("msg"),
+            "diff": diff,
+        }
+    ]
+
+
+def run_invocation(module_name, module_args) -> dict:
+    """Result of a module, a failed result if the module crashed."""
+    try:
+        output, dummy = run_module(module_name, module_args)
+    # pylint: disable-next=broad-exception-caught
+    except Exception as e:
+        return {"failed": True, "msg": f"MODULE FAILURE: {module_name}: {e!r}"}
+    try:
+        return json.loads(output)
+    except ValueError:
+        return {"failed": True, "msg": f"{module_name} returned no result: {output.strip()}"}
+
+
+def run_wave(wave, wave_number, connection, check_mode) -> list:
+    """Plan/apply entries of the resources of a wave, its modules are run one at a time."""
+    entries = []
+    for section, name, module_name, options in wave:
+        module_args = dict(connection)
+        module_args.update(options)
+        module_args.update({"_ansible_check_mode": check_mode, "_ansible_diff": True})
+        result = run_invocation(module_name, module_args)
+        for entry in resource_entries(section, name, module_name, result):
+            entry["wave"] = wave_number
+            entries.append(entry)
+    return entries
+
+
+def run(state, check_mode):
+    """Plans (check_mode) or applies a state, applying stops after the wave of the first failure.
+
+    Returns:
+        dict: The plan or apply report.
+    """
+    if not is_supported():
+        minimum, maximum = (".".join(map(str, version)) for version in SUPPORTED_ANSIBLE_CORE)
+        raise ValueError(f"ansible-core {ansible_core_version} is not supported, only >={minimum},<{maximum}")
+    waves = schedule(state)
+    if check_mode:
+        check_plannable(waves)
+    connection = dict(CONNECTION_DEFAULTS)
+    connection.update(state.get("nexus") or {})
+    state_cache_dir = None
+    if connection["state_cache"] and not connection.get("state_cache_dir"):
+        # A snapshot of the current state of Nexus for this run only.
+        state_cache_dir = tempfile.mkdtemp(prefix="nexus_apply_")
+        connection["state_cache_dir"] = state_cache_dir
+    NexusHelper.shared_connection_pools = {}
+    entries = []
+    try:
+        for wave_number, wave in enumerate(waves, start=1):
+            # Modules run one at a time, they share the process, nexus_repositories changes repositories
+            # concurrently as configured by max_concurrency.
+            entries.extend(run_wave(wave, wave_number, connection, check_mode))
+            if not check_mode and any(entry["failed"] for entry in entries):
+                break
+    finally:
+        for pool in NexusHelper.shared_connection_pools.values():
+            pool.close()
+        NexusHelper.shared_connection_pools = None
+        if state_cache_dir:
+            shutil.rmtree(state_cache_dir, ignore_errors=True)
+
+    summary = dict.fromkeys(("create", "update", "delete", "none", "unknown", "failed"), 0)
+    for entry in entries:
+        summary["failed" if entry["failed"] else entry["action"]] += 1
+    return {
+        "mode": "plan" if check_mode else "apply",
+        "changed": any(entry["changed"] for entry in entries),
+        "failed": summary["failed"] > 0,
+        "summary": summary,
+        "resources": entries,
+    }
+
+
+def format_report(report) -> str:
+    """Human readable report, with the paths changed by each update."""
+    lines = []
+    for entry in report["resources"]:
+        if entry["failed"]:
+            lines.append(f"! {entry['section']}/{entry['name']}: {entry['msg']}")
+            continue
+        if not entry["changed"]:
+            continue
+        lines.append(f"{ACTION_SYMBOLS[entry['action']]} {entry['section']}/{entry['name']}")
+        diff = entry["diff"]
+        if entry["action"] == "update" and diff:
+            changes = nexus_diff.diff(diff["before"], diff["after"])
+            for change in changes:
+                lines.append(f"    {change.path or '.'}: {json.dumps(change.before)} -> {json.dumps(change.after)}")
+            if not changes:
+                lines.append("    write-only values, e.g. passwords, are always sent")
+    summary = report["summary"]
+    if report["mode"] == "plan":
+        line = "Plan: {create} to create, {update} to update, {delete} to delete"
+    else:
+        line = "Applied: {create} created, {update} updated, {delete} deleted"
+    lines.append((line + ", {none} unchanged, {unknown} unknown, {failed} failed.").format(**summary))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="nexus_apply",
+        description="Plans or applies a YAML or JSON file with the desired state of Nexus resources.",
+    )
+    parser.add_argument("command", choices=["plan", "apply"])
+    parser.add_argument("state_file")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument(
+        "--detailed-exitcode",
+        action="store_true",
+        help="exit with 2 instead of 0 when the plan has changes",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        state = load_state(args.state_file)
+        report = run(state, check_mode=args.command == "plan")
+    except (OSError, ValueError, yaml.YAMLError, DependencyCycleError) as e:
+        print(f"nexus_apply: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(report, indent=2, cls=AnsibleJSONEncoder) if args.json else format_report(report))
+    if report["failed"]:
+        return 1
+    if args.detailed_exitcode and report["mode"] == "plan" and report["changed"]:
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+"""Makes the collection importable as ansible_collections.haxorof.sonatype_nexus for plain pytest.
+
+The collection is looked up in ANSIBLE_COLLECTIONS_PATH, above the working directory if pytest is run from
+ansible_collections/haxorof/sonatype_nexus, and in ~/.ansible/collections where
+setup_ansible_collection_symlink.sh links the checkout.
+"""
+
+import os
+import sys
+
+
+def collections_paths():
+    yield from filter(None, os.environ.get("ANSIBLE_COLLECTIONS_PATH", "").split(os.pathsep))
+    # PWD, unlike os.getcwd(), keeps the path through a symlink.
+    yield os.path.abspath(os.path.join(os.environ.get("PWD", os.getcwd()), "..", "..", ".."))
+    yield os.path.expanduser("~/.ansible/collections")
+
+
+for collections_path in collections_paths():
+    if os.path.isdir(os.path.join(collections_path, "ansible_collections", "haxorof", "sonatype_nexus")):
+        sys.path.insert(0, collections_path)
+        break
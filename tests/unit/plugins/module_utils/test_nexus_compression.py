@@ -0,0 +1,77 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import gzip
+import io
+import zlib
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_compression import (
+    DecodingReader,
+    NexusCompression,
+)
+
+BODY = b'[{"name": "maven-releases", "format": "maven2"}]' * 100
+
+
+def deflate_raw(data):
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+@pytest.mark.parametrize(
+    "encoding,encoded",
+    [("gzip", gzip.compress(BODY)), ("deflate", zlib.compress(BODY)), ("deflate", deflate_raw(BODY))],
+)
+def test_decoding_reader(encoding, encoded):
+    assert DecodingReader(io.BytesIO(encoded), encoding).read() == BODY
+
+
+@pytest.mark.parametrize("amt", [1, 7, 1024])
+def test_decoding_reader_reads_in_chunks(amt):
+    reader = DecodingReader(io.BytesIO(gzip.compress(BODY)), "gzip")
+    chunks = []
+    while True:
+        chunk = reader.read(amt)
+        if not chunk:
+            break
+        assert len(chunk) <= amt
+        chunks.append(chunk)
+    assert b"".join(chunks) == BODY
+
+
+def test_decode_response_counts_encoded_and_decoded_bytes():
+    compression = NexusCompression()
+    encoded = gzip.compress(BODY)
+    response = compression.decode_response(io.BytesIO(encoded), {"status": 200, "content-encoding": "gzip"})
+    assert response.read() == BODY
+    assert compression.stats["bytes_received"] == len(encoded)
+    assert compression.stats["bytes_received_decoded"] == len(BODY)
+
+
+def test_decode_response_passes_identity_bodies_through():
+    compression = NexusCompression()
+    assert compression.decode_response(io.BytesIO(BODY), {"status": 200}).read() == BODY
+    assert compression.stats["bytes_received"] == compression.stats["bytes_received_decoded"] == len(BODY)
+
+
+def test_decode_response_decodes_error_bodies():
+    compression = NexusCompression()
+    info = {"status": 400, "content-encoding": "deflate", "body": zlib.compress(b"Invalid repository")}
+    assert compression.decode_response(None, info) is None
+    assert info["body"] == b"Invalid repository"
+
+
+def test_encode_request_compresses_from_the_threshold_until_rejected():
+    compression = NexusCompression(request_threshold=100)
+    data, headers = compression.encode_request("x" * 10, {})
+    assert (data, headers) == (b"x" * 10, {"Accept-Encoding": "gzip, deflate"})
+
+    data, headers = compression.encode_request(BODY, {})
+    assert headers["Content-Encoding"] == "gzip" and gzip.decompress(data) == BODY
+    assert compression.is_request_encoding_rejected(headers, {"status": 415})
+
+    data, headers = compression.encode_request(BODY, {})
+    assert data == BODY and "Content-Encoding" not in headers
+    assert not compression.is_request_encoding_rejected(headers, {"status": 415})
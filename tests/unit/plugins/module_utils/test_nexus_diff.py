@@ -0,0 +1,50 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_diff
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_diff import Change, DiffRules
+
+
+def test_diff_reports_changed_added_and_removed_paths():
+    before = {"name": "m1", "storage": {"blobStoreName": "default", "writePolicy": "ALLOW"}, "cleanup": None}
+    after = {"name": "m1", "storage": {"blobStoreName": "default", "writePolicy": "DENY"}, "online": True}
+    assert nexus_diff.diff(before, after) == [
+        Change("storage.writePolicy", "ALLOW", "DENY"),
+        Change("cleanup", None, None),
+        Change("online", None, True),
+    ]
+
+
+def test_diff_reports_list_items_by_index_and_lists_of_other_length_as_a_whole():
+    assert nexus_diff.diff({"roles": [{"id": "a"}, {"id": "b"}]}, {"roles": [{"id": "a"}, {"id": "c"}]}) == [
+        Change("roles[1].id", "b", "c")
+    ]
+    assert nexus_diff.diff({"roles": ["a"]}, {"roles": ["a", "b"]}) == [Change("roles", ["a"], ["a", "b"])]
+
+
+def test_diff_applies_rules():
+    rules = DiffRules(order_insensitive=["group.memberNames"], ignored=["url"], write_only=["*.password"])
+    before = {"url": "http://nexus/a", "group": {"memberNames": ["a", "b"]}, "httpClient": {"password": None}}
+    after = {"url": "http://nexus/b", "group": {"memberNames": ["b", "a"]}, "httpClient": {"password": "secret"}}
+    assert nexus_diff.is_equal(before, after, rules)
+    assert not nexus_diff.is_equal(before, dict(after, group={"memberNames": ["a", "c"]}), rules)
+    assert nexus_diff.write_only_paths(after, rules) == ["httpClient.password"]
+
+
+def test_changes_to_diff_keys_changes_by_path():
+    changes = nexus_diff.diff({"storage": {"writePolicy": "ALLOW"}}, {"storage": {"writePolicy": "DENY"}})
+    assert nexus_diff.changes_to_diff(changes, "m1", "m1") == {
+        "before": {"storage.writePolicy": "ALLOW"},
+        "after": {"storage.writePolicy": "DENY"},
+        "before_header": "m1",
+        "after_header": "m1",
+    }
+
+
+def test_compare_finds_write_only_values_in_the_same_walk():
+    rules = DiffRules(write_only=("httpClient.password",))
+    before = {"name": "a", "httpClient": {"username": "user"}}
+    after = {"name": "a", "httpClient": {"username": "user", "password": "secret"}}
+    assert nexus_diff.compare(before, after, rules) == (True, True)
+    assert nexus_diff.compare(before, {"name": "a", "httpClient": {"username": "user"}}, rules) == (True, False)
+    assert nexus_diff.compare(before, dict(after, name="b"), rules)[0] is False
@@ -0,0 +1,99 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import threading
+import time
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_executor
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_executor import (
+    NexusExecutor,
+    NexusExecutorError,
+    TokenBucket,
+    in_worker,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(nexus_executor.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(nexus_executor.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_token_bucket_allows_a_burst_then_enforces_the_rate(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    for dummy in range(3):
+        bucket.acquire()
+    assert not clock.sleeps
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_token_bucket_refills_while_idle(clock):
+    bucket = TokenBucket(rate=10)
+    for dummy in range(10):
+        bucket.acquire()
+    clock.now += 0.3
+    for dummy in range(3):
+        bucket.acquire()
+    assert not clock.sleeps
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_results_are_in_the_order_of_the_items(max_workers):
+    def task(item):
+        time.sleep(0.01 * (5 - item))
+        return item * 2
+
+    results = NexusExecutor(max_workers).run(task, range(5))
+    assert [(result.item, result.value, result.ok) for result in results] == [(i, i * 2, True) for i in range(5)]
+
+
+def test_failures_do_not_stop_the_other_tasks():
+    def task(item):
+        if item == "fail_json":
+            raise NexusExecutorError("Repository not found")
+        if item == "crash":
+            raise KeyError("name")
+        return in_worker()
+
+    results = NexusExecutor(2).run(task, ["ok", "fail_json", "crash"])
+    assert [(result.value, result.error) for result in results] == [
+        (True, None),
+        (None, "Repository not found"),
+        (None, "KeyError: 'name'"),
+    ]
+    assert not in_worker()
+
+
+def test_concurrency_is_bounded_by_max_workers():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def task(_item):
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.pop()
+
+    NexusExecutor(3).run(task, range(10))
+    assert max(peak) <= 3
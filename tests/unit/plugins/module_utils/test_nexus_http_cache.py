@@ -0,0 +1,102 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import io
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_http_cache import (
+    NexusHttpCache,
+    credential_identity,
+    endpoint_name,
+)
+
+URL = "http://nexus:8081/service/rest/v1/repositories"
+ENDPOINTS = {
+    "repositories": "{url}/service/rest/v1/repositories",
+    "repository-settings": "{url}/service/rest/v1/repositorySettings",
+}
+
+
+def family_of(api_url):
+    return api_url.split("/service/rest/v1/")[1].split("/")[0]
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(tmp_path):
+    return NexusHttpCache(str(tmp_path), credential_identity("admin", "admin123"), family_of)
+
+
+def fetch(cache, url, body=b"[]", etag='"1"'):
+    """Simulates a GET answered with 304 when the validators sent match etag."""
+    headers = cache.conditional_headers(url)
+    if headers.get("If-None-Match") == etag:
+        info = {"status": 304}
+        response = None
+    else:
+        info = {"status": 200, "etag": etag}
+        response = io.BytesIO(body)
+    response, info = cache.handle_response(url, response, info)
+    return headers, info, response.read()
+
+
+def test_endpoint_name():
+    assert endpoint_name(URL + "/maven/hosted/releases", ENDPOINTS, "/service/rest") == (
+        "repositories",
+        "/maven/hosted/releases",
+    )
+    assert endpoint_name("http://nexus:8081/other", ENDPOINTS, "/service/rest") == (None, "/other")
+
+
+def test_cached_body_is_served_on_not_modified(cache):
+    headers, info, body = fetch(cache, URL, b'[{"name": "a"}]')
+    assert (headers, info["status"], body) == ({}, 200, b'[{"name": "a"}]')
+
+    headers, info, body = fetch(cache, URL)
+    assert headers == {"If-None-Match": '"1"'}
+    assert (info["status"], info["cache"], body) == (200, "revalidated", b'[{"name": "a"}]')
+    assert cache.stats["hits"] == 1 and cache.stats["stored"] == 1
+
+
+def test_changed_resource_replaces_the_cached_body(cache):
+    fetch(cache, URL, b"old")
+    headers, info, body = fetch(cache, URL, b"new", etag='"2"')
+    assert (headers["If-None-Match"], info["status"], body) == ('"1"', 200, b"new")
+    assert fetch(cache, URL, etag='"2"')[2] == b"new"
+
+
+def test_entries_are_per_credentials(cache, tmp_path):
+    fetch(cache, URL)
+    other = NexusHttpCache(str(tmp_path), credential_identity("admin", "other"), family_of)
+    assert other.conditional_headers(URL) == {}
+
+
+def test_responses_without_validators_are_not_cached(cache):
+    response, dummy = cache.handle_response(URL, io.BytesIO(b"[]"), {"status": 200})
+    assert response.read() == b"[]"
+    assert cache.conditional_headers(URL) == {}
+
+
+def test_expired_entries_are_not_revalidated(cache):
+    cache.ttl = {"repositories": -1}
+    fetch(cache, URL)
+    assert cache.conditional_headers(URL) == {}
+
+
+def test_writes_invalidate_the_resource_family(cache):
+    fetch(cache, URL)
+    fetch(cache, URL + "/maven/hosted/releases")
+    fetch(cache, "http://nexus:8081/service/rest/v1/blobstores")
+    cache.invalidate(URL + "/maven/hosted/releases")
+    assert cache.stats["invalidated"] == 2
+    assert cache.conditional_headers(URL) == {}
+    assert cache.conditional_headers("http://nexus:8081/service/rest/v1/blobstores")
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    cache.max_size = 10
+    fetch(cache, URL + "/a", b"123456")
+    fetch(cache, URL + "/b", b"123456")
+    assert cache.stats["evicted"] == 1
+    assert cache.conditional_headers(URL + "/a") == {}
+    assert cache.conditional_headers(URL + "/b")
@@ -0,0 +1,47 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import io
+import json
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_json_stream import load_json
+
+DOCUMENTS = [
+    "[1, 2.5e3]",
+    "[-0.125, 1E-7, 12345678901234567890, 3.0e+10]",
+    ' [ {"name": "maven-central", "online": true, "size": 1.5e2}, null, false, "é€", [] ] ',
+    '[{"nested": {"list": [1, 2, {"deep": -4.25}]}, "text": "a, b ] }"}]',
+    "[]",
+    '{"name": "not an array", "value": 6.02e23}',
+    "42.5",
+]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64 * 1024])
+def test_load_json_matches_json_loads_at_any_chunk_size(document, chunk_size):
+    assert load_json(io.BytesIO(document.encode("utf-8")), chunk_size=chunk_size) == json.loads(document)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7])
+def test_load_json_keeps_items_accepted_by_filter(chunk_size):
+    document = json.dumps([{"name": f"repo-{i}", "size": i + 0.5} for i in range(20)])
+    items = load_json(io.BytesIO(document.encode("utf-8")), lambda item: item["size"] > 17, chunk_size)
+    assert items == [
+        {"name": "repo-17", "size": 17.5},
+        {"name": "repo-18", "size": 18.5},
+        {"name": "repo-19", "size": 19.5},
+    ]
+
+
+def test_load_json_returns_none_without_document():
+    assert load_json(io.BytesIO(b"  \n")) is None
+
+
+@pytest.mark.parametrize("document", ["[1 2]", "[1,", "[1.5e3] x", "[tru]"])
+@pytest.mark.parametrize("chunk_size", [1, 4, 64 * 1024])
+def test_load_json_rejects_invalid_documents(document, chunk_size):
+    with pytest.raises(ValueError):
+        load_json(io.BytesIO(document.encode("utf-8")), chunk_size=chunk_size)
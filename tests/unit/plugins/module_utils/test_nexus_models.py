@@ -0,0 +1,108 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_models import (
+    BlobStore,
+    Repository,
+    Role,
+    User,
+    parse_repository,
+)
+
+MAVEN_HOSTED = {
+    "name": "maven-releases",
+    "format": "maven2",
+    "type": "hosted",
+    "url": "http://nexus:8081/repository/maven-releases",
+    "online": True,
+    "storage": {"blobStoreName": "default", "strictContentTypeValidation": True, "writePolicy": "ALLOW_ONCE"},
+    "cleanup": None,
+    "component": {"proprietaryComponents": False},
+    "maven": {"versionPolicy": "RELEASE", "layoutPolicy": "STRICT", "contentDisposition": "INLINE"},
+}
+
+DOCKER_PROXY = {
+    "name": "docker-hub",
+    "format": "docker",
+    "type": "proxy",
+    "online": True,
+    "storage": {"blobStoreName": "default", "strictContentTypeValidation": True},
+    "proxy": {"remoteUrl": "https://registry-1.docker.io", "contentMaxAge": 1440, "metadataMaxAge": 1440},
+    "negativeCache": {"enabled": True, "timeToLive": 1440},
+    "httpClient": {"blocked": False, "autoBlock": True, "authentication": None},
+    "docker": {"v1Enabled": False, "forceBasicAuth": True, "httpPort": None, "subdomain": None},
+    "dockerProxy": {"indexType": "HUB", "cacheForeignLayers": False, "foreignLayerUrlWhitelist": []},
+    "someNewKey": {"nested": 1},
+}
+
+
+def without_none(data):
+    """The API object as given back by to_api, nulls are left out."""
+    return {
+        key: without_none(value) if isinstance(value, dict) else value
+        for key, value in data.items()
+        if value is not None
+    }
+
+
+@pytest.mark.parametrize(
+    "model,data",
+    [
+        (
+            BlobStore,
+            {
+                "name": "default",
+                "type": "File",
+                "softQuota": {"type": "spaceRemainingQuota", "limit": 1024, "unknownKey": "kept"},
+                "blobCount": 10,
+                "totalSizeInBytes": 2048,
+            },
+        ),
+        (
+            Role,
+            {
+                "id": "nx-admin",
+                "source": "default",
+                "name": "nx-admin",
+                "readOnly": True,
+                "privileges": ["nx-all"],
+                "roles": [],
+            },
+        ),
+        (User, {"userId": "admin", "emailAddress": "admin@example.org", "roles": ["nx-admin"], "status": "active"}),
+        (Repository, {"name": "raw", "format": "raw", "type": "hosted", "online": True, "attributes": {"a": 1}}),
+    ],
+)
+def test_round_trip(model, data):
+    assert model.from_api(data).to_api() == data
+
+
+@pytest.mark.parametrize("data", [MAVEN_HOSTED, DOCKER_PROXY])
+def test_repository_round_trip(data):
+    repository = parse_repository(data)
+    assert type(repository).__name__ != "Repository"
+    assert repository.to_api() == without_none(data)
+
+
+def test_attributes_and_get():
+    repository = parse_repository(MAVEN_HOSTED)
+    assert repository.name == "maven-releases"
+    assert repository.storage.blob_store_name == "default"
+    assert repository.get("maven").get("versionPolicy") == "RELEASE"
+    assert repository.get("cleanup", "none") == "none"
+    assert parse_repository(DOCKER_PROXY).get("someNewKey") == {"nested": 1}
+    assert parse_repository(DOCKER_PROXY).get("unknown", 1) == 1
+
+
+def test_unknown_formats_use_the_common_model():
+    data = {"name": "conan-proxy", "format": "conan", "type": "proxy", "online": True, "proxy": {}}
+    repository = parse_repository(data)
+    assert isinstance(repository, Repository)
+    assert repository.to_api() == data
+
+
+def test_none_stays_none():
+    assert BlobStore.from_api(None) is None
+    assert User.from_api_list([]) == []
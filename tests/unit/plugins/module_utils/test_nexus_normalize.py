@@ -0,0 +1,126 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_normalize import (
+    camelize_key,
+    compile_key_table,
+    is_password_key,
+    normalize,
+    translate_keys,
+)
+
+ARGUMENT_SPEC = {
+    "name": {"type": "str"},
+    "blob_store_name": {"type": "str"},
+    "storage": {
+        "type": "dict",
+        "options": {
+            "write_policy": {"type": "str"},
+            "strict_content_type_validation": {"type": "bool"},
+        },
+    },
+    "routing_rules": {"type": "list", "elements": "dict", "options": {"matchers": {"type": "list"}}},
+    "attributes": {"type": "dict"},
+}
+
+
+@pytest.mark.parametrize(
+    "key,camelized",
+    [
+        ("blob_store_name", "blobStoreName"),
+        ("write-policy", "writePolicy"),
+        ("name", "name"),
+        ("NXRM", "NXRM"),
+        ("404", "404"),
+        ("_private", "_private"),
+        ("Soft_quota", "softQuota"),
+        ("ID_prefix", "IDPrefix"),
+    ],
+)
+def test_camelize_key(key, camelized):
+    assert camelize_key(key) == camelized
+
+
+def test_compile_key_table():
+    assert compile_key_table(ARGUMENT_SPEC) == {
+        "name": ("name", None),
+        "blob_store_name": ("blobStoreName", None),
+        "storage": (
+            "storage",
+            {
+                "write_policy": ("writePolicy", None),
+                "strict_content_type_validation": ("strictContentTypeValidation", None),
+            },
+        ),
+        "routing_rules": ("routingRules", {"matchers": ("matchers", None)}),
+        "attributes": ("attributes", None),
+    }
+
+
+def test_translate_keys_uses_the_table_and_camelizes_free_form_dicts():
+    data = {
+        "blob_store_name": "default",
+        "storage": {"write_policy": "ALLOW", "unknown_key": 1},
+        "routing_rules": [{"matchers": ["^/com/.*"]}],
+        "attributes": {"some_key": {"nested_key": True}},
+        "not_an_option": {"kept_as_is": 1},
+    }
+    assert translate_keys(data, compile_key_table(ARGUMENT_SPEC)) == {
+        "blobStoreName": "default",
+        "storage": {"writePolicy": "ALLOW", "unknown_key": 1},
+        "routingRules": [{"matchers": ["^/com/.*"]}],
+        "attributes": {"someKey": {"nestedKey": True}},
+        "not_an_option": {"kept_as_is": 1},
+    }
+
+
+@pytest.mark.parametrize("key", ["password", "Password", "pass", "word", ""])
+def test_is_password_key(key):
+    assert is_password_key(key)
+
+
+@pytest.mark.parametrize("key", ["passwords", "username", None, 1])
+def test_is_not_password_key(key):
+    assert not is_password_key(key)
+
+
+def test_normalize_prune_empty():
+    data = {"a": "", "b": {"c": None, "d": []}, "e": [[], 1, "", {"f": None}], "g": 0, "h": False}
+    assert normalize(data, prune_empty=True) == ({"e": [1, {}], "g": 0, "h": False}, False)
+
+
+def test_normalize_drop_none():
+    data = {"a": None, "b": [None, 1, {"c": None}], "d": {}, "e": ""}
+    assert normalize(data, drop_none=True) == ({"b": [1, {}], "d": {}, "e": ""}, False)
+
+
+def test_normalize_drop_password_keys_outside_lists():
+    data = {
+        "password": "secret",
+        "httpClient": {"authentication": {"Password": "secret", "username": "user"}},
+        "users": [{"password": "kept"}],
+    }
+    assert normalize(data, drop_password_keys=True) == (
+        {"httpClient": {"authentication": {"username": "user"}}, "users": [{"password": "kept"}]},
+        True,
+    )
+    assert normalize({"username": "user"}, drop_password_keys=True) == ({"username": "user"}, False)
+
+
+def test_normalize_camelize_keys_also_within_lists():
+    data = {"write_policy": "ALLOW", "routing_rules": [{"match_all": True}]}
+    assert normalize(data, camelize_keys=True) == (
+        {"writePolicy": "ALLOW", "routingRules": [{"matchAll": True}]},
+        False,
+    )
+
+
+def test_normalize_returns_new_dicts_and_lists():
+    data = {"a": {"b": [1, 2]}, "c": (["d"],)}
+    normalized, dummy = normalize(data)
+    assert normalized == data
+    assert normalized["a"] is not data["a"] and normalized["a"]["b"] is not data["a"]["b"]
+    assert normalized["c"] is not data["c"]
+    assert normalize(data, copy_leaves=False)[0]["c"] is data["c"]
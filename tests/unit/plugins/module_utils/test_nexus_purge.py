@@ -0,0 +1,139 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import http.server
+import json
+import threading
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_purge import (
+    deletion_limit_message,
+    deletion_waves,
+    is_protected,
+    purge_candidates,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_scheduler import DependencyCycleError
+from ansible_collections.haxorof.sonatype_nexus.plugins.plugin_utils.nexus_runner import (
+    is_supported,
+    run_module,
+)
+
+
+def repository(name, members=None):
+    item = {"name": name, "format": "maven2", "type": "group" if members else "hosted", "online": True}
+    if members:
+        item["group"] = {"memberNames": members}
+    return item
+
+
+REPOSITORIES = [
+    repository("maven-central"),
+    repository("releases"),
+    repository("snapshots"),
+    repository("all", ["internal", "maven-central"]),
+    repository("internal", ["releases", "snapshots"]),
+]
+
+
+class RepositoriesHandler(http.server.BaseHTTPRequestHandler):
+    """Nexus with REPOSITORIES, records the deletes."""
+
+    deletes = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        assert self.path == "/service/rest/v1/repositorySettings"
+        self.respond(200, json.dumps(REPOSITORIES).encode())
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        self.deletes.append(self.path.rsplit("/", 1)[1])
+        self.respond(204, b"")
+
+    def respond(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name="nexus_url")
+def fixture_nexus_url():
+    RepositoriesHandler.deletes = []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RepositoriesHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "name,protect,protected",
+    [("maven-central", ["maven-*"], True), ("maven-central", ["maven"], False), ("releases", [], False)],
+)
+def test_is_protected(name, protect, protected):
+    assert is_protected(name, protect) is protected
+
+
+def test_purge_candidates_keeps_desired_and_protected_names():
+    live = ["maven-central", "releases", "snapshots", "nuget.org-proxy"]
+    assert purge_candidates(live, ["releases"], ["maven-*", "nuget*"]) == (
+        ["snapshots"],
+        ["maven-central", "nuget.org-proxy"],
+    )
+
+
+@pytest.mark.parametrize("names,max_deletions", [([], 0), (["a", "b"], 2), (["a", "b", "c"], -1)])
+def test_deletions_within_the_limit(names, max_deletions):
+    assert deletion_limit_message(names, max_deletions) is None
+
+
+def test_deletions_over_the_limit():
+    assert deletion_limit_message(["a", "b", "c"], 2) == (
+        "Purge would delete 3 objects which is more than max_deletions=2, nothing was deleted: a, b, c"
+    )
+
+
+def test_groups_are_deleted_before_their_members():
+    live = {item["name"]: item for item in REPOSITORIES}
+    waves = deletion_waves("repositories", live, ["releases", "snapshots", "all", "internal"])
+    assert [sorted(wave) for wave in waves] == [["all"], ["internal"], ["releases", "snapshots"]]
+
+
+def test_only_references_among_the_deleted_objects_order_the_waves():
+    live = {item["name"]: item for item in REPOSITORIES}
+    assert deletion_waves("repositories", live, ["internal", "maven-central"]) == [["internal", "maven-central"]]
+
+
+def test_objects_referring_to_each_other_cannot_be_ordered():
+    live = {"a": {"id": "a", "roles": ["b"]}, "b": {"id": "b", "roles": ["a"]}}
+    with pytest.raises(DependencyCycleError):
+        deletion_waves("roles", live, ["a", "b"])
+
+
+@pytest.mark.skipif(not is_supported(), reason="ansible-core version is not supported")
+def test_purge_module(nexus_url):
+    module_args = {
+        "url": nexus_url,
+        "username": "admin",
+        "password": "pw",
+        "kind": "repositories",
+        "names": ["all"],
+        "protect": ["maven-*"],
+        "max_deletions": 2,
+    }
+    output, exit_code = run_module("nexus_purge", module_args)
+    assert exit_code == 1
+    assert json.loads(output)["msg"].startswith("Purge would delete 3 objects")
+    assert not RepositoriesHandler.deletes
+
+    output, exit_code = run_module("nexus_purge", dict(module_args, max_deletions=3))
+    result = json.loads(output)
+    assert exit_code == 0, output
+    assert result["changed"]
+    assert result["json"] == {"deleted": ["releases", "snapshots", "internal"], "protected": ["maven-central"]}
+    assert RepositoriesHandler.deletes[0] == "internal"
+    assert sorted(RepositoriesHandler.deletes[1:]) == ["releases", "snapshots"]
@@ -0,0 +1,79 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_models import parse_repository
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_repository_index import RepositoryIndex
+
+
+def repository(name, repository_format, repository_type, **settings):
+    item = {"name": name, "format": repository_format, "type": repository_type, "online": True}
+    item.update(settings)
+    return item
+
+
+REPOSITORIES = [
+    repository(
+        "maven-central",
+        "maven2",
+        "proxy",
+        storage={"blobStoreName": "proxies"},
+        cleanup={"policyNames": ["weekly", "monthly"]},
+        routingRuleName="no-snapshots",
+    ),
+    repository("maven-releases", "maven2", "hosted", storage={"blobStoreName": "default"}),
+    repository(
+        "npm-hosted", "npm", "hosted", storage={"blobStoreName": "default"}, cleanup={"policyNames": ["weekly"]}
+    ),
+    repository("maven-internal", "maven2", "group", group={"memberNames": ["maven-releases", "missing"]}),
+    repository("maven-public", "maven2", "group", group={"memberNames": ["maven-central", "maven-internal"]}),
+]
+
+
+@pytest.fixture(name="index", params=["dicts", "models"])
+def fixture_index(request):
+    if request.param == "models":
+        return RepositoryIndex(parse_repository(item) for item in REPOSITORIES)
+    return RepositoryIndex(REPOSITORIES)
+
+
+def names(repositories):
+    return [repository.get("name") for repository in repositories]
+
+
+@pytest.mark.parametrize(
+    "criteria,selected",
+    [
+        ({}, [item["name"] for item in REPOSITORIES]),
+        ({"name": "npm-hosted"}, ["npm-hosted"]),
+        ({"name": "unknown"}, []),
+        ({"format": "maven"}, ["maven-central", "maven-releases", "maven-internal", "maven-public"]),
+        ({"format": "maven2", "type": "hosted"}, ["maven-releases"]),
+        ({"type": "hosted", "blob_store": "default"}, ["maven-releases", "npm-hosted"]),
+        ({"cleanup_policy": "weekly"}, ["maven-central", "npm-hosted"]),
+        ({"cleanup_policy": "weekly", "format": "npm"}, ["npm-hosted"]),
+        ({"routing_rule": "no-snapshots"}, ["maven-central"]),
+        ({"member_of": "maven-internal"}, ["maven-releases"]),
+        ({"member_of": "maven-public", "type": "proxy"}, ["maven-central"]),
+        ({"contains": "maven-releases"}, ["maven-internal"]),
+        ({"format": "maven", "type": None}, ["maven-central", "maven-releases", "maven-internal", "maven-public"]),
+        ({"format": "docker"}, []),
+    ],
+)
+def test_select(index, criteria, selected):
+    assert names(index.select(**criteria)) == selected
+
+
+def test_mapping(index):
+    assert len(index) == len(REPOSITORIES)
+    assert list(index) == [item["name"] for item in REPOSITORIES]
+    assert index["npm-hosted"].get("format") == "npm"
+    assert "missing" not in index
+
+
+def test_group_membership(index):
+    assert index.members("maven-internal") == ["maven-releases", "missing"]
+    assert index.members("npm-hosted") == []
+    assert index.groups_containing("maven-releases") == ["maven-internal"]
+    assert index.groups_containing("maven-releases", transitive=True) == ["maven-internal", "maven-public"]
@@ -0,0 +1,59 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_retry import NexusRetryPolicy
+
+
+def test_backoff_grows_from_default_base_delay():
+    policy = NexusRetryPolicy(attempts=5, jitter=False)
+    assert [policy.backoff(attempt) for attempt in (1, 2, 3)] == [1.0, 2.0, 4.0]
+
+
+def test_backoff_uses_sleep_as_base_delay_and_is_capped():
+    policy = NexusRetryPolicy(attempts=5, sleep=3, backoff_factor=10, max_sleep=20, jitter=False)
+    assert [policy.backoff(attempt) for attempt in (1, 2, 3)] == [3, 20, 20]
+
+
+def test_backoff_jitter_stays_within_half_and_full_delay():
+    policy = NexusRetryPolicy(attempts=5)
+    for dummy in range(100):
+        assert 1.0 <= policy.backoff(2) <= 2.0
+
+
+@pytest.mark.parametrize(
+    "method,status,retryable",
+    [
+        ("GET", -1, True),
+        ("PUT", -1, True),
+        ("POST", -1, False),
+        ("GET", 503, True),
+        ("POST", 503, False),
+        ("POST", 429, True),
+        ("GET", 500, False),
+    ],
+)
+def test_is_retryable(method, status, retryable):
+    policy = NexusRetryPolicy(attempts=3, status_codes=[429, 503])
+    assert policy.is_retryable(method, status) is retryable
+
+
+def test_next_delay_honors_retry_after_attempts_and_deadline():
+    policy = NexusRetryPolicy(attempts=3, jitter=False, status_codes=[503], deadline=10)
+    assert policy.next_delay("GET", {"status": 503, "retry-after": "5"}, 1, 0) == 5
+    assert policy.next_delay("GET", {"status": 503}, 3, 0) is None
+    assert policy.next_delay("GET", {"status": 503, "retry-after": "5"}, 1, 6) is None
+
+
+def test_record_counts_retries():
+    policy = NexusRetryPolicy(attempts=3)
+    policy.record(1, 0, [])
+    policy.record(3, 1.5, [503, 429])
+    assert policy.stats == {
+        "requests": 2,
+        "requests_retried": 1,
+        "retries": 2,
+        "sleep_seconds": 1.5,
+        "retried_status_codes": {"503": 1, "429": 1},
+    }
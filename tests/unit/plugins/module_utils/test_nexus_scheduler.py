@@ -0,0 +1,81 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_models import Role
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_scheduler import (
+    DependencyCycleError,
+    dependency_waves,
+    find_cycle,
+    referenced_names,
+    reversed_dependencies,
+)
+
+
+def test_dependency_waves_orders_nodes_after_their_dependencies():
+    dependencies = {
+        "maven-public": ["maven-releases", "maven-central"],
+        "maven-releases": ["blobs"],
+        "maven-central": [],
+        "blobs": [],
+    }
+    assert dependency_waves(dependencies) == [["maven-central", "blobs"], ["maven-releases"], ["maven-public"]]
+
+
+def test_dependency_waves_ignores_dependencies_which_are_not_nodes():
+    assert dependency_waves({"a": ["existing"], "b": ["a", "existing"]}) == [["a"], ["b"]]
+
+
+def test_dependency_waves_of_an_empty_graph():
+    assert not dependency_waves({})
+
+
+@pytest.mark.parametrize(
+    "dependencies,cycle",
+    [
+        ({"a": ["a"]}, ["a", "a"]),
+        ({"a": ["b"], "b": ["c"], "c": ["a"], "d": []}, ["a", "b", "c", "a"]),
+    ],
+)
+def test_dependency_waves_reports_cycles(dependencies, cycle):
+    with pytest.raises(DependencyCycleError, match="Dependency cycle: ") as error:
+        dependency_waves(dependencies)
+    assert error.value.cycle == cycle
+
+
+def test_find_cycle_returns_none_without_cycle():
+    assert find_cycle({"a": ["b"], "b": ["missing"], "c": ["a", "b"]}) is None
+
+
+def test_find_cycle_starts_at_the_repeated_node():
+    assert find_cycle({"x": ["a"], "a": ["b"], "b": ["a"]}) == ["a", "b", "a"]
+
+
+def test_reversed_dependencies():
+    dependencies = {"group": ["hosted", "proxy"], "hosted": ["missing"], "proxy": [], "other": ["hosted", "hosted"]}
+    assert reversed_dependencies(dependencies) == {
+        "group": [],
+        "hosted": ["group", "other"],
+        "proxy": ["group"],
+        "other": [],
+    }
+
+
+@pytest.mark.parametrize(
+    "data,path,names",
+    [
+        ({"group": {"memberNames": ["a", "b"]}}, ("group", "memberNames"), ["a", "b"]),
+        ({"storage": {"blobStoreName": "default"}}, ("storage", "blobStoreName"), ["default"]),
+        ({"storage": None}, ("storage", "blobStoreName"), []),
+        ({"group": {"memberNames": []}}, ("group", "memberNames"), []),
+        ({}, ("group", "memberNames"), []),
+        ({"storage": "default"}, ("storage", "blobStoreName"), []),
+    ],
+)
+def test_referenced_names(data, path, names):
+    assert referenced_names(data, path) == names
+
+
+def test_referenced_names_of_a_model():
+    assert referenced_names(Role(id="developers", roles=["readers"]), ("roles",)) == ["readers"]
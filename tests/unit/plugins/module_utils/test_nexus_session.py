@@ -0,0 +1,144 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import http.server
+import io
+import json
+import threading
+from urllib.parse import parse_qs
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_session import (
+    CSRF_TOKEN,
+    SESSION_PATH,
+    NexusSessionStore,
+    login,
+    session_headers,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.plugin_utils.nexus_runner import (
+    is_supported,
+    run_module,
+)
+
+
+class SessionHandler(http.server.BaseHTTPRequestHandler):
+    """Nexus creating sessions on login, a session is rejected once expired is set."""
+
+    sessions = []
+    expired = set()
+    requests = []
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        form = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode())
+        assert self.path == SESSION_PATH and form["username"] == ["YWRtaW4="]
+        session_id = f"session{len(self.sessions)}"
+        self.sessions.append(session_id)
+        self.respond(204, b"", {"Set-Cookie": f"NXSESSIONID={session_id}; Path=/; HttpOnly"})
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        cookie = self.headers.get("Cookie", "")
+        self.requests.append(cookie)
+        session_id = cookie.split(";")[0].partition("=")[2]
+        if session_id not in self.sessions or session_id in self.expired:
+            self.respond(401, b"")
+        else:
+            self.respond(200, b"[]")
+            self.expired.add(session_id)
+
+    def respond(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name="nexus_url")
+def fixture_nexus_url():
+    SessionHandler.sessions, SessionHandler.expired, SessionHandler.requests = [], set(), []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), SessionHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_login_returns_the_session_headers():
+    sent = []
+
+    def send(path, method, data, headers):
+        sent.append((path, method, data, headers))
+        return io.BytesIO(b""), {"status": 204, "set-cookie": "NXSESSIONID=abc; Path=/; HttpOnly"}
+
+    headers, info = login(send, "admin", "admin123")
+    assert info["status"] == 204
+    path, method, data, login_headers = sent[0]
+    assert (path, method) == (SESSION_PATH, "POST")
+    assert parse_qs(data) == {"username": ["YWRtaW4="], "password": ["YWRtaW4xMjM="]}
+    csrf_token = login_headers[CSRF_TOKEN]
+    assert headers == {CSRF_TOKEN: csrf_token, "Cookie": f"NXSESSIONID=abc; {CSRF_TOKEN}={csrf_token}"}
+
+
+@pytest.mark.parametrize(
+    "info",
+    [
+        {"status": 401, "set-cookie": "NXSESSIONID=abc"},
+        {"status": 204},
+        {"status": 204, "set-cookie": "NXSESSIONID=; Expires=Thu, 01 Jan 1970 00:00:00 GMT"},
+    ],
+)
+def test_no_session_without_session_cookie(info):
+    assert session_headers(info, "token") is None
+
+
+def test_session_cookie_among_other_cookies():
+    info = {"status": 200, "set-cookie": "rememberMe=deleteMe; Expires=Thu, 01 Jan 1970 00:00:00 GMT, NXSESSIONID=abc"}
+    assert session_headers(info, "token")["Cookie"] == f"NXSESSIONID=abc; {CSRF_TOKEN}=token"
+
+
+def test_session_store(tmp_path):
+    store = NexusSessionStore(str(tmp_path), "http://nexus:8081/", "identity")
+    assert store.get() is None
+    store.put({"Cookie": "NXSESSIONID=abc"})
+    assert NexusSessionStore(str(tmp_path), "http://nexus:8081", "identity").get() == {"Cookie": "NXSESSIONID=abc"}
+    assert NexusSessionStore(str(tmp_path), "http://nexus:8081", "other").get() is None
+    store.drop({"Cookie": "NXSESSIONID=other"})
+    assert store.get() is not None
+    store.drop({"Cookie": "NXSESSIONID=abc"})
+    assert store.get() is None
+
+
+def test_expired_session_is_not_used(tmp_path):
+    store = NexusSessionStore(str(tmp_path), "http://nexus:8081", "identity", lifetime=-1)
+    store.put({"Cookie": "NXSESSIONID=abc"})
+    assert store.get() is None
+
+
+@pytest.mark.skipif(not is_supported(), reason="ansible-core version is not supported")
+def test_rejected_session_is_renewed(nexus_url, tmp_path):
+    module_args = {
+        "url": nexus_url,
+        "username": "admin",
+        "password": "admin123",
+        "auth_mode": "session",
+        "session_cache_dir": str(tmp_path),
+    }
+    output, exit_code = run_module("nexus_routing_rule_info", module_args)
+    assert exit_code == 0, output
+    assert json.loads(output)["session"] == {"logins": 1, "reused": 0, "renewed": 0}
+
+    # The stored session is rejected, the module logs in again and repeats the request.
+    output, exit_code = run_module("nexus_routing_rule_info", module_args)
+    assert exit_code == 0, output
+    assert json.loads(output)["session"] == {"logins": 1, "reused": 1, "renewed": 1}
+    assert SessionHandler.sessions == ["session0", "session1"]
+    assert [cookie.split(";")[0] for cookie in SessionHandler.requests] == [
+        "NXSESSIONID=session0",
+        "NXSESSIONID=session0",
+        "NXSESSIONID=session1",
+    ]
@@ -0,0 +1,73 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import time
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_state_cache import NexusStateCache
+
+NEXUS_URL = "http://nexus:8081"
+SETTINGS_URL = NEXUS_URL + "/service/rest/v1/repositorySettings"
+REPOSITORIES_URL = NEXUS_URL + "/service/rest/v1/repositories"
+BLOBSTORES_URL = NEXUS_URL + "/service/rest/v1/blobstores"
+ITEMS = [{"name": "maven-releases"}, {"name": "maven-snapshots"}]
+
+
+def family_of(api_url):
+    family = api_url.split("/service/rest/v1/")[1].split("/")[0]
+    return "repositories" if family == "repositorySettings" else family
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(tmp_path):
+    return NexusStateCache(str(tmp_path), NEXUS_URL, "identity", family_of)
+
+
+def test_snapshot_is_reused(cache):
+    assert cache.get(SETTINGS_URL) is None
+    cache.put(SETTINGS_URL, ITEMS, time.time())
+    assert cache.get(SETTINGS_URL) == ITEMS
+    assert cache.stats == {"hits": 1, "misses": 1, "stored": 1, "applied": 0, "invalidated": 0}
+
+
+def test_stale_snapshot_is_not_used(cache):
+    cache.put(SETTINGS_URL, ITEMS, time.time() - cache.max_staleness - 1)
+    assert cache.get(SETTINGS_URL) is None
+
+
+def test_snapshots_are_per_nexus_and_credentials(cache, tmp_path):
+    cache.put(SETTINGS_URL, ITEMS, time.time())
+    assert NexusStateCache(str(tmp_path), NEXUS_URL, "other", family_of).get(SETTINGS_URL) is None
+
+
+def test_snapshot_fetched_before_a_write_is_not_stored(cache):
+    fetched_at = time.time()
+    cache.apply_write(REPOSITORIES_URL + "/maven/hosted", "POST", 201)
+    cache.put(SETTINGS_URL, ITEMS, fetched_at)
+    assert cache.get(SETTINGS_URL) is None and cache.stats["stored"] == 0
+    cache.put(SETTINGS_URL, ITEMS, time.time())
+    assert cache.get(SETTINGS_URL) == ITEMS
+
+
+def test_writes_drop_the_snapshots_of_their_family(cache):
+    cache.put(SETTINGS_URL, ITEMS, time.time())
+    cache.put(BLOBSTORES_URL, [{"name": "default"}], time.time())
+    cache.apply_write(REPOSITORIES_URL + "/maven/hosted/maven-releases", "PUT", 204)
+    assert cache.get(SETTINGS_URL) is None
+    assert cache.get(BLOBSTORES_URL) == [{"name": "default"}]
+    assert cache.stats["invalidated"] == 1
+
+
+@pytest.mark.parametrize("status", [204, 404])
+def test_repository_deletes_are_applied_to_the_snapshots(cache, status):
+    cache.put(SETTINGS_URL, ITEMS, time.time())
+    cache.apply_write(REPOSITORIES_URL + "/maven-releases", "DELETE", status)
+    assert cache.get(SETTINGS_URL) == [{"name": "maven-snapshots"}]
+    assert cache.stats["applied"] == 1
+
+
+def test_failed_repository_deletes_drop_the_snapshots(cache):
+    cache.put(SETTINGS_URL, ITEMS, time.time())
+    cache.apply_write(REPOSITORIES_URL + "/maven-releases", "DELETE", 500)
+    assert cache.get(SETTINGS_URL) is None
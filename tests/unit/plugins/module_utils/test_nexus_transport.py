@@ -0,0 +1,148 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import http.server
+import threading
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_transport import NexusConnectionPool
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """Keeps connections alive unless the server closes them after each response, see fixture_server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.server.requests.append((self.command, self.path, dict(self.headers)))
+        if self.path.startswith("/redirect/"):
+            self.send_response(302)
+            location = self.path[len("/redirect/"):]
+            self.send_header("Location", location if location.startswith("http") else "/" + location)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self.respond(b"ok")
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.do_GET()
+
+    def respond(self, body):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Closed without telling the client, like a server dropping idle connections.
+        self.close_connection = self.server.close_after_response
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def start_server(close_after_response=False):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.requests = []
+    server.close_after_response = close_after_response
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    server = start_server()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(name="closing_server")
+def fixture_closing_server():
+    server = start_server(close_after_response=True)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def url_of(server, path="/"):
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+def read(pool, url, method="GET", data=None, headers=None):
+    response, info = pool.request(url, method, data, headers)
+    body = response.read() if response else None
+    if response:
+        response.close()
+    return info, body
+
+
+def test_connections_are_reused(server):
+    pool = NexusConnectionPool(use_proxy=False)
+    for dummy in range(3):
+        info, body = read(pool, url_of(server))
+        assert (info["status"], body) == (200, b"ok")
+    assert pool.stats == {"requests": 3, "connections_opened": 1, "connections_reused": 2}
+    pool.close()
+
+
+def test_connections_closed_by_the_server_are_not_reused(closing_server):
+    pool = NexusConnectionPool(use_proxy=False)
+    for dummy in range(2):
+        assert read(pool, url_of(closing_server))[0]["status"] == 200
+    assert pool.stats["connections_opened"] == 2
+    pool.close()
+
+
+def test_idempotent_request_is_sent_again_on_a_stale_connection(closing_server, monkeypatch):
+    # The closed connection is not detected before sending, as when the server closes it meanwhile.
+    monkeypatch.setattr(NexusConnectionPool, "is_dropped", staticmethod(lambda connection: False))
+    pool = NexusConnectionPool(use_proxy=False)
+    assert read(pool, url_of(closing_server))[0]["status"] == 200
+    info, body = read(pool, url_of(closing_server))
+    assert (info["status"], body) == (200, b"ok")
+    assert pool.stats == {"requests": 2, "connections_opened": 2, "connections_reused": 1}
+    pool.close()
+
+
+def test_post_is_not_sent_again_on_a_stale_connection(closing_server, monkeypatch):
+    monkeypatch.setattr(NexusConnectionPool, "is_dropped", staticmethod(lambda connection: False))
+    pool = NexusConnectionPool(use_proxy=False)
+    assert read(pool, url_of(closing_server), "POST", "{}")[0]["status"] == 200
+    info, body = read(pool, url_of(closing_server), "POST", "{}")
+    assert info["status"] == -1 and info["msg"].startswith("Connection failure")
+    assert body is None
+    assert len(closing_server.requests) == 1
+    pool.close()
+
+
+def test_redirects_of_get_requests_are_followed(server):
+    pool = NexusConnectionPool(use_proxy=False)
+    info, body = read(pool, url_of(server, "/redirect/target"))
+    assert (info["status"], body) == (200, b"ok")
+    assert [path for dummy, path, dummy in server.requests] == ["/redirect/target", "/target"]
+    pool.close()
+
+
+def test_redirects_of_other_requests_are_not_followed(server):
+    pool = NexusConnectionPool(use_proxy=False)
+    info, body = read(pool, url_of(server, "/redirect/target"), "POST", "{}")
+    assert info["status"] == 302 and "is not followed" in info["msg"]
+    assert body is None
+    assert len(server.requests) == 1
+    pool.close()
+
+
+def test_credentials_are_not_sent_to_another_host(server):
+    other = start_server()
+    try:
+        pool = NexusConnectionPool(use_proxy=False)
+        headers = {"Authorization": "Basic secret", "Cookie": "NXSESSIONID=1"}
+        info, dummy = read(pool, url_of(server, "/redirect/" + url_of(other, "/target")), headers=headers)
+        assert info["status"] == 200
+        assert server.requests[0][2]["Authorization"] == "Basic secret"
+        assert "Authorization" not in other.requests[0][2] and "Cookie" not in other.requests[0][2]
+        pool.close()
+    finally:
+        other.shutdown()
+        other.server_close()
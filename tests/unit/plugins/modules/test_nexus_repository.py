@@ -0,0 +1,92 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import http.server
+import json
+import threading
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.plugin_utils.nexus_runner import (
+    is_supported,
+    run_module,
+)
+
+pytestmark = pytest.mark.skipif(not is_supported(), reason="ansible-core version is not supported")
+
+
+class NoRepositoriesHandler(http.server.BaseHTTPRequestHandler):
+    """Nexus without repositories, records the write requests."""
+
+    writes = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        if self.path == "/service/rest/v1/repositorySettings":
+            self.respond(200, b"[]")
+        else:
+            self.respond(404, b"")
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.writes.append((self.command, self.path, json.loads(body)))
+        self.respond(201, b"")
+
+    def respond(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name="nexus_url")
+def fixture_nexus_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), NoRepositoriesHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def created_repository(nexus_url, module_name, module_args):
+    """(method, path, payload) of the request creating the repository."""
+    NoRepositoriesHandler.writes = []
+    output, exit_code = run_module(module_name, dict(module_args, url=nexus_url, username="admin", password="pw"))
+    assert exit_code == 0, output
+    assert json.loads(output)["changed"]
+    assert len(NoRepositoriesHandler.writes) == 1
+    return NoRepositoriesHandler.writes[0]
+
+
+@pytest.mark.parametrize(
+    "repository_format,repository_type,module_args",
+    [
+        ("maven", "hosted", {"name": "releases", "maven": {"version_policy": "MIXED"}}),
+        (
+            "docker",
+            "proxy",
+            {
+                "name": "docker-hub",
+                "proxy": {"remote_url": "https://registry-1.docker.io"},
+                "docker": {"v1_enabled": False, "force_basic_auth": True},
+                "docker_proxy": {"index_type": "HUB"},
+                "http_client": {"authentication": {"type": "username", "username": "user", "password": "secret"}},
+            },
+        ),
+        ("raw", "group", {"name": "raw-all", "group": {"member_names": ["raw-hosted"]}}),
+        ("npm", "hosted", {"name": "npm-private", "storage": {"write_policy": "ALLOW_ONCE"}}),
+    ],
+)
+def test_thin_module_and_nexus_repository_send_the_same_request(
+    nexus_url, repository_format, repository_type, module_args
+):
+    thin = created_repository(nexus_url, f"nexus_repository_{repository_format}_{repository_type}", module_args)
+    unified = created_repository(
+        nexus_url, "nexus_repository", dict(module_args, format=repository_format, type=repository_type)
+    )
+    assert thin == unified
+    assert thin[1] == f"/service/rest/v1/repositories/{repository_format}/{repository_type}"
@@ -0,0 +1,67 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import http.server
+import json
+import threading
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.plugin_utils.nexus_runner import (
+    is_supported,
+    run_module,
+)
+
+
+class StatusHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):  # pylint: disable=invalid-name
+        status = 200 if self.path == "/service/rest/v1/status/writable" else 503
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name="nexus_url")
+def fixture_nexus_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+requires_supported = pytest.mark.skipif(not is_supported(), reason="ansible-core version is not supported")
+
+
+@pytest.mark.parametrize(
+    "version,supported",
+    [("2.16.19", True), ("2.18.0rc1", True), ("2.15.13", False), ("2.19.0", False), ("devel", False)],
+)
+def test_is_supported(version, supported):
+    assert is_supported(version) is supported
+
+
+@requires_supported
+def test_run_module_runs_a_real_module(nexus_url):
+    output, exit_code = run_module("nexus_status_info", {"url": nexus_url})
+    result = json.loads(output)
+    assert exit_code == 0
+    assert not result.get("failed")
+    assert result["changed"] is False
+
+
+@requires_supported
+def test_run_module_reports_failures(nexus_url):
+    output, exit_code = run_module("nexus_status_info", {"url": nexus_url, "check_type": "readable"})
+    result = json.loads(output)
+    assert exit_code == 1
+    assert result["failed"] and result["msg"] == "Unavailable to service requests."
+
+    output, exit_code = run_module("nexus_status_info", {"url": nexus_url, "unknown_option": 1})
+    result = json.loads(output)
+    assert exit_code == 1
+    assert "unknown_option" in result["msg"]
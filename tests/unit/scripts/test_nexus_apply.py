@@ -0,0 +1,69 @@
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+import pytest
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_scheduler import DependencyCycleError
+from ansible_collections.haxorof.sonatype_nexus.scripts.nexus_apply import check_plannable, schedule
+
+
+def invocations(waves):
+    return [[(section, name, module_name) for section, name, module_name, dummy in wave] for wave in waves]
+
+
+def test_schedule_creates_before_and_deletes_after_referenced_resources():
+    state = {
+        "blob_stores": [{"name": "blobs"}, {"name": "old-blobs", "state": "absent"}],
+        "repositories": [
+            {"name": "maven-releases", "format": "maven", "type": "hosted", "storage": {"blob_store_name": "blobs"}},
+            {"name": "old", "format": "raw", "type": "hosted", "state": "absent",
+             "storage": {"blob_store_name": "old-blobs"}},
+        ],
+        "roles": [{"id": "developers", "roles": ["readers"]}, {"id": "readers"}],
+    }
+    assert invocations(schedule(state)) == [
+        [("blob_stores", "blobs", "nexus_blobstore_file"), ("roles", "readers", "nexus_roles")],
+        [("repositories", None, "nexus_repositories"), ("roles", "developers", "nexus_roles")],
+        [("repositories", None, "nexus_repositories")],
+        [("blob_stores", "old-blobs", "nexus_blobstore_file")],
+    ]
+
+
+def test_schedule_purges_sections_last_with_the_declared_names():
+    state = {
+        "roles": [{"id": "developers"}],
+        "purge": {"sections": ["roles", "users"], "protect": ["nx-*"], "use_internal_api": True},
+    }
+    waves = schedule(state)
+    assert invocations(waves)[-2:] == [[("users", None, "nexus_purge")], [("roles", None, "nexus_purge")]]
+    assert waves[-1][0][3] == {"kind": "roles", "names": ["developers"], "protect": ["nx-*"], "use_internal_api": True}
+
+
+@pytest.mark.parametrize(
+    "state,message",
+    [
+        ({"purge": {"sections": ["tasks"]}}, "purge: unknown sections tasks"),
+        (
+            {"users": [{"user_id": "u", "roles": ["gone"]}], "roles": [{"id": "gone", "state": "absent"}]},
+            "users/u refers to roles/gone which is deleted",
+        ),
+        ({"users": [{"user_id": "u", "roles": ["external"]}], "purge": {"sections": ["roles"]}},
+         "users/u refers to roles/external which is purged"),
+    ],
+)
+def test_schedule_rejects_invalid_states(state, message):
+    with pytest.raises(ValueError, match=message):
+        schedule(state)
+
+
+def test_schedule_reports_reference_cycles():
+    state = {"roles": [{"id": "a", "roles": ["b"]}, {"id": "b", "roles": ["a"]}]}
+    with pytest.raises(DependencyCycleError):
+        schedule(state)
+
+
+def test_plan_refuses_modules_without_check_mode():
+    state = {"roles": [{"id": "developers"}], "settings": {"anonymous": {"user_id": "anonymous"}}}
+    with pytest.raises(ValueError, match="settings/anonymous cannot be planned"):
+        check_plannable(schedule(state))
+    check_plannable(schedule({"roles": [{"id": "developers"}]}))
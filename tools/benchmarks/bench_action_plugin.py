@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+"""Compares running modules in-process by the nexus_in_process action plugin with running them the usual way.
+
+Runs a playbook with nexus_status_info tasks on localhost, against a minimal HTTP server answering every
+request with 200 OK, once with nexus_in_process=true and once with nexus_in_process=false, and prints
+the time per task.
+
+Requires ansible-playbook and the collection in a collections path, e.g. after running
+setup_ansible_collection_symlink.sh:
+
+    python tools/benchmarks/bench_action_plugin.py [--tasks N] [--loop N] [--collections-path PATH]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PLAYBOOK = """
+- hosts: localhost
+  gather_facts: false
+  tasks:
+{tasks}
+"""
+
+TASK = """
+    - haxorof.sonatype_nexus.nexus_status_info:
+        url: "{url}"
+        connection_pooling: true
+      loop: "{{{{ range({loop}) | list }}}}"
+"""
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    # pylint: disable-next=invalid-name
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    # pylint: disable-next=redefined-builtin
+    def log_message(self, format, *args):
+        pass
+
+
+def run_playbook(playbook, collections_path, in_process):
+    env = dict(os.environ, ANSIBLE_COLLECTIONS_PATH=collections_path)
+    command = [
+        "ansible-playbook", "-i", "localhost,", "-c", "local", playbook,
+        "-e", f"nexus_in_process={in_process}", "-e", f"ansible_python_interpreter={sys.executable}",
+    ]
+    started = time.perf_counter()
+    with open(os.devnull, "rb") as stdin:
+        subprocess.run(command, env=env, stdin=stdin, check=True, capture_output=True)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10)
+    parser.add_argument("--loop", type=int, default=1, help="Loop items per task")
+    parser.add_argument("--collections-path", default=os.getcwd())
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    module_runs = args.tasks * args.loop
+    with tempfile.TemporaryDirectory() as directory:
+        playbook = os.path.join(directory, "playbook.yml")
+        with open(playbook, "w", encoding="utf-8") as file:
+            tasks = "".join(TASK.format(url=url, loop=args.loop) for dummy in range(args.tasks))
+            file.write(PLAYBOOK.format(tasks=tasks))
+        # The first run also compiles the collection.
+        run_playbook(playbook, args.collections_path, True)
+        baseline = None
+        for in_process in (False, True):
+            seconds = run_playbook(playbook, args.collections_path, in_process)
+            baseline = baseline or seconds
+            print(
+                f"nexus_in_process={str(in_process).lower():<6} {seconds:8.2f} s "
+                + f"{seconds / module_runs * 1000:8.1f} ms/module run {baseline / seconds:6.1f}x"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
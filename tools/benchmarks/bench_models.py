@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+"""Compares the memory used by and the time to parse large listings as dicts and as nexus_models objects.
+
+Each listing is parsed from JSON text, as received from Nexus, and the models are checked to give back
+the API objects with to_api().
+
+Run from a directory where the collection can be imported as ansible_collections.haxorof.sonatype_nexus,
+e.g. after running setup_ansible_collection_symlink.sh:
+
+    python tools/benchmarks/bench_models.py [--objects N]
+"""
+
+import argparse
+import gc
+import json
+import timeit
+import tracemalloc
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils import nexus_models
+
+
+def repositories(count):
+    listing = []
+    for i in range(count):
+        if i % 10 == 0:
+            listing.append({
+                "name": f"maven-group-{i}", "format": "maven2", "type": "group",
+                "url": f"http://nexus/repository/maven-group-{i}", "online": True,
+                "storage": {"blobStoreName": "default", "strictContentTypeValidation": True},
+                "group": {"memberNames": [f"maven-proxy-{i + 1}", f"maven-proxy-{i + 2}"]},
+                "maven": {"versionPolicy": "RELEASE", "layoutPolicy": "STRICT", "contentDisposition": "INLINE"},
+            })
+        else:
+            listing.append({
+                "name": f"maven-proxy-{i}", "format": "maven2", "type": "proxy",
+                "url": f"http://nexus/repository/maven-proxy-{i}", "online": True,
+                "storage": {"blobStoreName": "default", "strictContentTypeValidation": True},
+                "cleanup": {"policyNames": ["weekly"]},
+                "proxy": {
+                    "remoteUrl": "https://repo1.maven.org/maven2/", "contentMaxAge": 1440, "metadataMaxAge": 1440
+                },
+                "negativeCache": {"enabled": True, "timeToLive": 1440},
+                "httpClient": {"blocked": False, "autoBlock": True,
+                               "connection": {"retries": 3, "timeout": 60, "enableCircularRedirects": False,
+                                              "enableCookies": False, "useTrustStore": False}},
+                "routingRuleName": "block-snapshots",
+                "maven": {"versionPolicy": "RELEASE", "layoutPolicy": "STRICT", "contentDisposition": "INLINE"},
+            })
+    return listing
+
+
+def users(count):
+    return [
+        {"userId": f"user{i}", "firstName": "First", "lastName": f"Last{i}", "emailAddress": f"user{i}@example.com",
+         "source": "default", "status": "active", "readOnly": False, "roles": ["nx-developers", f"team-{i % 50}"],
+         "externalRoles": []}
+        for i in range(count)
+    ]
+
+
+def roles(count):
+    return [
+        {"id": f"role-{i}", "source": "default", "name": f"Role {i}", "description": f"Role number {i}",
+         "readOnly": False,
+         "privileges": [f"nx-repository-view-maven2-repo-{i}-{action}" for action in ("browse", "read")],
+         "roles": [f"role-{i - 1}"] if i else []}
+        for i in range(count)
+    ]
+
+
+def measure_memory(text, parse_item):
+    gc.collect()
+    tracemalloc.start()
+    items = json.loads(text)
+    if parse_item:
+        items = [parse_item(item) for item in items]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"{'listing':<24} {'parse dict':>11} {'parse model':>11} {'memory dict':>11} {'memory model':>12}")
+    for label, listing, parse_item in (
+        ("repositories", repositories(args.objects), nexus_models.parse_repository),
+        ("users", users(args.objects), nexus_models.User.from_api),
+        ("roles", roles(args.objects), nexus_models.Role.from_api),
+    ):
+        text = json.dumps(listing)
+        # Repository models are generated on first use, which is not what is measured.
+        parse_item(listing[0])
+        dict_size, dummy = measure_memory(text, None)
+        model_size, models = measure_memory(text, parse_item)
+        for item, model in zip(listing, models):
+            if model.to_api() != item:
+                raise SystemExit(f"{label}: to_api() differs for {item}")
+        dict_time = min(timeit.repeat(lambda text=text: json.loads(text), number=1, repeat=5))
+        model_time = min(timeit.repeat(
+            lambda text=text, parse_item=parse_item: [parse_item(item) for item in json.loads(text)], number=1, repeat=5
+        ))
+        print(
+            f"{label + ' x' + str(args.objects):<24} {dict_time * 1e3:9.1f}ms {model_time * 1e3:9.1f}ms"
+            + f" {dict_size / 2**20:9.1f}MB {model_size / 2**20:10.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+"""Checks that nexus_normalize gives exactly the same results as the previous normalization functions
+and humps.camelize, and compares their speed.
+
+Run from a directory where the collection can be imported as ansible_collections.haxorof.sonatype_nexus,
+e.g. after running setup_ansible_collection_symlink.sh:
+
+    python tools/benchmarks/bench_normalize.py [--iterations N] [--seed N]
+"""
+
+import argparse
+import copy
+import random
+import timeit
+
+import humps
+
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_normalize import (
+    compile_key_table,
+    normalize,
+    translate_keys,
+)
+from ansible_collections.haxorof.sonatype_nexus.plugins.module_utils.nexus_repository_formats import (
+    repository_argument_spec,
+)
+
+
+# Previous implementations from NexusHelper, kept as reference.
+def legacy_clean_dict_list(data_to_clean):
+    d = copy.deepcopy(data_to_clean)
+    if isinstance(d, dict):
+        cleaned = {}
+        for k, v in d.items():
+            cleaned_value = legacy_clean_dict_list(v)
+            if cleaned_value not in ("", [], {}, None):
+                cleaned[k] = cleaned_value
+        return cleaned
+    if isinstance(d, list):
+        return [legacy_clean_dict_list(i) for i in d if i not in ("", [], {}, None)]
+    return d
+
+
+def legacy_delete_all_none_values(data_to_clean, do_deepcopy=False):
+    d = copy.deepcopy(data_to_clean) if do_deepcopy else data_to_clean
+    if isinstance(d, dict):
+        cleaned = {}
+        for k, v in d.items():
+            cleaned_value = legacy_delete_all_none_values(v)
+            if cleaned_value is not None:
+                cleaned[k] = cleaned_value
+        return cleaned
+    if isinstance(d, list):
+        return [legacy_delete_all_none_values(i) for i in d if i is not None]
+    return d
+
+
+def legacy_delete_all_password_keys(d):
+    key_deleted = False
+    if isinstance(d, dict):
+        cleaned = {}
+        for k, v in d.items():
+            if isinstance(k, str) and k.lower() in "password":
+                key_deleted = True
+            else:
+                item_key_deleted, cleaned[k] = legacy_delete_all_password_keys(v)
+                if item_key_deleted:
+                    key_deleted = True
+        return key_deleted, cleaned
+    return key_deleted, d
+
+
+KEYS = ["name", "member_names", "password", "Password", "pass", "auth_info", "blobStoreName", "http_client",
+        "remote_url", "enabled", "x", "write_policy", "", "__private", "ABC_def"]
+LEAVES = ["", None, 0, 1, False, True, 0.0, "text", "snake_case", ("t_u", [1]), "maven-central"]
+
+
+def random_value(rng, depth):
+    kind = rng.random()
+    if depth <= 0 or kind < 0.45:
+        return rng.choice(LEAVES)
+    if kind < 0.75:
+        return {rng.choice(KEYS): random_value(rng, depth - 1) for dummy in range(rng.randint(0, 5))}
+    return [random_value(rng, depth - 1) for dummy in range(rng.randint(0, 5))]
+
+
+def check_equivalence(rng, iterations):
+    for dummy in range(iterations):
+        data = random_value(rng, 5)
+        original = copy.deepcopy(data)
+        assert normalize(data, prune_empty=True)[0] == legacy_clean_dict_list(data), data
+        assert normalize(data, drop_none=True, copy_leaves=False)[0] == legacy_delete_all_none_values(data), data
+        if isinstance(data, dict):
+            removed, expected = legacy_delete_all_password_keys(data)
+            assert normalize(data, drop_password_keys=True, copy_leaves=False) == (expected, removed), data
+        if isinstance(data, (dict, list)):
+            assert normalize(data, camelize_keys=True, copy_leaves=False)[0] == humps.camelize(data), data
+        assert data == original, "input was modified"
+
+
+def group_repository(members):
+    return {
+        "name": "maven-public",
+        "online": True,
+        "storage": {"blobStoreName": "default", "strictContentTypeValidation": True, "writePolicy": None},
+        "group": {"memberNames": [f"maven-member-{i}" for i in range(members)], "writableMember": None},
+        "cleanup": None,
+        "component": {},
+    }
+
+
+def role(privileges):
+    return {
+        "id": "developer",
+        "name": "developer",
+        "description": "",
+        "privileges": [f"nx-repository-view-maven2-repo-{i}-read" for i in range(privileges)],
+        "roles": [],
+    }
+
+
+def maven_proxy_params():
+    return {
+        "http_client": {
+            "blocked": False,
+            "auto_block": True,
+            "connection": {"retries": 3, "user_agent_suffix": None, "timeout": 60, "enable_circular_redirects": False,
+                           "enable_cookies": False, "use_trust_store": False},
+            "authentication": {"type": "ntlm", "username": "user", "password": "secret", "ntlmHost": "host",
+                               "ntlmDomain": "domain"},
+        },
+        "negative_cache": {"enabled": True, "time_to_live": 1440},
+        "proxy": {"remote_url": "https://repo1.maven.org/maven2/", "content_max_age": 1440, "metadata_max_age": 1440},
+        "storage": {"blob_store_name": "default", "strict_content_type_validation": True},
+        "maven": {"version_policy": "release", "layout_policy": "strict", "content_disposition": "inline"},
+    }
+
+
+def bench(name, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    print(f"{name:<48} {seconds / number * 1e6:10.1f} us/call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    check_equivalence(random.Random(args.seed), args.iterations)
+    print(f"equivalence: {args.iterations} random payloads OK")
+
+    for label, data in (
+        ("group repository, 500 members", group_repository(500)),
+        ("role, 1000 privileges", role(1000)),
+    ):
+        bench(f"{label}: legacy clean_dict_list", lambda data=data: legacy_clean_dict_list(data), 200)
+        bench(f"{label}: normalize(prune_empty)", lambda data=data: normalize(data, prune_empty=True), 200)
+
+    params = maven_proxy_params()
+    key_table = compile_key_table(repository_argument_spec("maven", "proxy"))
+    assert {key_table[k][0]: translate_keys(v, key_table[k][1]) for k, v in params.items()} == humps.camelize(params)
+    bench("maven proxy parameters: humps.camelize", lambda: humps.camelize(params), 2000)
+    bench(
+        "maven proxy parameters: translate_keys",
+        lambda: {key_table[k][0]: translate_keys(v, key_table[k][1]) for k, v in params.items()},
+        2000,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the haxorof.sonatype_nexus project
+# MIT License (see COPYING or https://opensource.org/license/mit/)
+
+"""Measures import and argument parsing time of every module in plugins/modules.
+
+Each measurement runs in a new Python process. Argument parsing is measured from calling main() until
+AnsibleModule has validated the arguments, no request is sent. With --cold the modules and module_utils
+are compiled from source on each run, as when Ansible runs them from the AnsiballZ zip file.
+
+Run from a directory where the collection can be imported as ansible_collections.haxorof.sonatype_nexus,
+e.g. after running setup_ansible_collection_symlink.sh:
+
+    python tools/benchmarks/bench_startup.py [--runs N] [--cold] [--collections-path PATH] [MODULE ...]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+CHILD = r"""
+import contextlib, io, json, sys, time
+sys.path.insert(0, sys.argv[2])
+started = time.perf_counter()
+from ansible.module_utils import basic
+ansible_imported = time.perf_counter()
+module = __import__("ansible_collections.haxorof.sonatype_nexus.plugins.modules." + sys.argv[1], fromlist=["main"])
+imported = time.perf_counter()
+
+class ArgumentsParsed(Exception):
+    pass
+
+init = basic.AnsibleModule.__init__
+def parsed(self, *args, **kwargs):
+    init(self, *args, **kwargs)
+    raise ArgumentsParsed()
+
+basic.AnsibleModule.__init__ = parsed
+basic._ANSIBLE_ARGS = json.dumps({"ANSIBLE_MODULE_ARGS": {"url": "http://127.0.0.1:9"}}).encode()
+with contextlib.redirect_stdout(io.StringIO()):
+    try:
+        module.main()
+    except (ArgumentsParsed, SystemExit):
+        pass
+done = time.perf_counter()
+print(json.dumps({
+    "ansible_import": ansible_imported - started,
+    "module_import": imported - ansible_imported,
+    "argument_parsing": done - imported,
+}))
+"""
+
+
+def module_names(collection_root):
+    modules_dir = os.path.join(collection_root, "plugins", "modules")
+    return sorted(
+        name[:-3] for name in os.listdir(modules_dir) if name.endswith(".py") and name != "__init__.py"
+    )
+
+
+def measure(module, collections_path, cold):
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as pycache_prefix:
+        command = [sys.executable]
+        if cold:
+            command += ["-X", f"pycache_prefix={pycache_prefix}"]
+        command += ["-c", CHILD, module, collections_path]
+        output = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="Modules to measure, all by default")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--cold", action="store_true", help="Compile from source on each run")
+    parser.add_argument("--collections-path", default=os.getcwd())
+    args = parser.parse_args()
+
+    collection_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    modules = args.modules or module_names(collection_root)
+    # Warm up the bytecode cache of Ansible itself.
+    measure(modules[0], args.collections_path, cold=False)
+
+    print(f"{'module':<44} {'ansible ms':>10} {'import ms':>10} {'args ms':>10}")
+    totals = {"ansible_import": [], "module_import": [], "argument_parsing": []}
+    for module in modules:
+        runs = [measure(module, args.collections_path, args.cold) for dummy in range(args.runs)]
+        medians = {key: statistics.median(run[key] for run in runs) * 1000 for key in totals}
+        for key, value in medians.items():
+            totals[key].append(value)
+        print(
+            f"{module:<44} {medians['ansible_import']:10.1f} {medians['module_import']:10.1f} "
+            + f"{medians['argument_parsing']:10.1f}"
+        )
+    print(
+        f"{'mean of medians':<44} {statistics.mean(totals['ansible_import']):10.1f} "
+        + f"{statistics.mean(totals['module_import']):10.1f} {statistics.mean(totals['argument_parsing']):10.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()